@@ -58,6 +58,33 @@ for route in api_app.routes:
     # 경로 수정
     route.path = path
 
+# API 서버의 시작/종료 처리(작업 워커 시작, 커넥션 풀 정리)도 함께 실행
+for handler in api_app.router.on_startup:
+    app.add_event_handler("startup", handler)
+for handler in api_app.router.on_shutdown:
+    app.add_event_handler("shutdown", handler)
+
+# API 라우트만 복사해 오므로 API 서버 앱의 미들웨어는 적용되지 않아 여기서 다시 추가
+from src.api_server import UPLOAD_LIMITED_PATHS
+from src.config import METRICS_ENABLED, TRACING_ENABLED, TRACE_LOG_FILE, UPLOAD_MAX_BYTES, UPLOAD_FORM_OVERHEAD_BYTES
+from src.utils.metrics import MetricsMiddleware
+from src.utils.tracing import TracingMiddleware
+from src.utils.upload_limit import UploadSizeLimitMiddleware
+
+# 파일 업로드 요청은 본문을 모두 받기 전에 크기 제한 적용
+# (복사한 라우트는 경로 정규식이 바뀌지 않아 /api 접두사 없는 경로로도 요청되므로 두 경로 모두 제한)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_bytes=UPLOAD_MAX_BYTES + UPLOAD_FORM_OVERHEAD_BYTES,
+    paths=UPLOAD_LIMITED_PATHS + [f"/api{path}" for path in UPLOAD_LIMITED_PATHS]
+)
+
+# 요청 지표와 단계별 소요 시간 기록 (업로드 크기 초과로 거절된 요청도 기록하도록 바깥쪽에 추가)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+if TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware, log_path=TRACE_LOG_FILE)
+
 # 웹 앱 라우트 정의
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
@@ -81,7 +108,15 @@ if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
     # 개발 모드 확인
     debug = os.environ.get("FLASK_ENV") == "development" or os.environ.get("DEBUG") == "true"
+    # 워커 프로세스 수 (WEB_CONCURRENCY, 자동 재시작 모드에서는 1)
+    workers = 1 if debug else max(1, int(os.environ.get("WEB_CONCURRENCY", 1)))
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    if workers > 1:
+        # 이전 실행의 워커 지표가 /metrics 합계에 섞이지 않도록 정리
+        from src.config import METRICS_MULTIPROCESS_DIR
+        from src.utils.metrics import reset_multiprocess_dir
+        reset_multiprocess_dir(METRICS_MULTIPROCESS_DIR)
     
     # 서버 실행
-    logger.info(f"서버 시작 중... (포트: {port}, 디버그 모드: {debug})")
-    uvicorn.run("app:app", host="0.0.0.0", port=port, reload=debug) 
\ No newline at end of file
+    logger.info(f"서버 시작 중... (포트: {port}, 디버그 모드: {debug}, 워커 수: {workers})")
+    uvicorn.run("app:app", host="0.0.0.0", port=port, reload=debug, workers=workers) 
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""HTML 본문 추출 벤치마크
+
+기존 scrape_url의 추출 방식(html.parser + 태그/클래스/ID별 반복 탐색)과
+src/utils/html_extractor의 단일 순회 방식을 같은 페이지로 비교합니다.
+두 방식의 결과가 같은지도 함께 확인합니다.
+
+사용법:
+    python benchmarks/bench_html_extractor.py                 # 합성 페이지 사용
+    python benchmarks/bench_html_extractor.py page1.html ...  # 저장된 페이지 사용
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from src.utils.html_extractor import parse_html, PARSER
+
+def legacy_extract(html):
+    """기존 scrape_url의 본문 추출 방식 (비교용으로 그대로 옮김)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    title = soup.title.string if soup.title else "제목 없음"
+    
+    for element in soup.find_all(['script', 'style']):
+        element.decompose()
+    
+    all_text = soup.get_text(separator='\n', strip=True)
+    
+    for element in soup.find_all(['script', 'style', 'nav', 'footer', 'iframe', 'aside']):
+        element.decompose()
+    
+    ad_classes = ['ad', 'ads', 'advertisement', 'banner', 'sidebar', 'related', 'footer', 'menu', 'nav', 'share', 'social', 'comment', 'copyright']
+    for class_name in ad_classes:
+        for element in soup.find_all(class_=lambda x: x and any(ad in x.lower() for ad in [class_name])):
+            element.decompose()
+    
+    ad_ids = ['ad', 'ads', 'advertisement', 'banner', 'sidebar', 'related', 'footer', 'menu', 'nav', 'share', 'social', 'comment', 'copyright']
+    for id_name in ad_ids:
+        for element in soup.find_all(id=lambda x: x and any(ad in x.lower() for ad in [id_name])):
+            element.decompose()
+    
+    content = ""
+    
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    if meta_desc and meta_desc.get('content'):
+        content += meta_desc.get('content') + "\n\n"
+    
+    main_content = None
+    for container in ['article', 'main', '.article', '.content', '.post', '.entry', '#article', '#content', '#main']:
+        if container.startswith('.') or container.startswith('#'):
+            selector_type = 'class' if container.startswith('.') else 'id'
+            selector_value = container[1:]
+            if selector_type == 'class':
+                main_content = soup.find(class_=selector_value)
+            else:
+                main_content = soup.find(id=selector_value)
+        else:
+            main_content = soup.find(container)
+        
+        if main_content:
+            break
+    
+    if main_content:
+        for tag in main_content.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+            text = tag.get_text(strip=True)
+            if text and len(text) > 20:
+                content += text + "\n\n"
+    else:
+        for tag in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+            text = tag.get_text(strip=True)
+            if text and len(text) > 20:
+                content += text + "\n\n"
+    
+    return str(title) if title else "제목 없음", all_text, content
+
+def new_extract(html, parser=None):
+    """단일 순회 추출 방식"""
+    document = parse_html(html, parser)
+    return document.title(), document.text(), document.content()
+
+_WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+          "incididunt ut labore et dolore magna aliqua 콘텐츠 요약 기사 본문 뉴스").split()
+_CLASSES = ['header', 'content', 'post', 'entry', 'article', 'ad-slot', 'sidebar', 'menu-item',
+            'shadow', 'loading', 'social-share', 'comment-list', 'wrapper', 'row', 'col', 'text', 'Banner']
+_IDS = ['main', 'content', 'article', 'nav-top', 'footer', 'related-news', 'box', 'Header', None, None, None]
+_TAGS = ['div', 'section', 'p', 'span', 'h2', 'h3', 'a', 'article', 'main', 'nav', 'aside', 'footer']
+
+def _sentence(rng, words):
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+def _random_element(rng, depth):
+    """임의의 class/id와 중첩 구조를 가진 요소 생성"""
+    tag = rng.choice(_TAGS if depth < 4 else ['p', 'span', 'h2'])
+    attrs = ""
+    if rng.random() < 0.5:
+        attrs += f' class="{" ".join(rng.sample(_CLASSES, rng.randint(1, 3)))}"'
+    element_id = rng.choice(_IDS)
+    if element_id and rng.random() < 0.3:
+        attrs += f' id="{element_id}"'
+    
+    if tag in ('p', 'h2', 'h3', 'span', 'a') or depth >= 4:
+        return f"<{tag}{attrs}>{_sentence(rng, rng.randint(2, 30))}</{tag}>"
+    children = "".join(_random_element(rng, depth + 1) for _ in range(rng.randint(1, 4)))
+    return f"<{tag}{attrs}>{children}</{tag}>"
+
+def make_page(seed, blocks=40):
+    """벤치마크용 합성 뉴스 페이지 생성"""
+    rng = random.Random(seed)
+    body = "".join(_random_element(rng, 0) for _ in range(blocks))
+    return (
+        "<!DOCTYPE html><html><head><title>테스트 페이지</title>"
+        '<meta name="description" content="합성 페이지 설명입니다.">'
+        "<script>var x = 1;</script><style>p { color: red; }</style></head>"
+        f"<body>{body}<script>track();</script></body></html>"
+    )
+
+def measure(function, pages, repeat):
+    """페이지 목록을 repeat번 처리하는 데 걸린 시간 중 가장 짧은 시간 (초)"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            function(page)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 본문 추출 벤치마크")
+    parser.add_argument("files", nargs="*", help="비교할 HTML 파일 (없으면 합성 페이지 사용)")
+    parser.add_argument("--pages", type=int, default=30, help="합성 페이지 수")
+    parser.add_argument("--blocks", type=int, default=40, help="합성 페이지당 최상위 블록 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수")
+    args = parser.parse_args()
+    
+    if args.files:
+        pages = []
+        for path in args.files:
+            with open(path, 'r', encoding='utf-8', errors='replace') as file:
+                pages.append(file.read())
+    else:
+        pages = [make_page(seed, args.blocks) for seed in range(args.pages)]
+    
+    total_kb = sum(len(page.encode('utf-8')) for page in pages) / 1024
+    print(f"페이지 {len(pages)}개, 총 {total_kb:.0f}KB, 기본 파서: {PARSER}")
+    
+    # 같은 파서(html.parser)를 사용했을 때 결과가 같아야 함
+    mismatches = sum(1 for page in pages if legacy_extract(page) != new_extract(page, 'html.parser'))
+    print(f"기존 방식과 결과가 다른 페이지 (html.parser): {mismatches}개")
+    if PARSER != 'html.parser':
+        parser_mismatches = sum(1 for page in pages if legacy_extract(page) != new_extract(page))
+        print(f"기존 방식과 결과가 다른 페이지 ({PARSER}): {parser_mismatches}개")
+    
+    legacy_time = measure(legacy_extract, pages, args.repeat)
+    print(f"기존 방식:               {legacy_time * 1000 / len(pages):8.2f} ms/페이지")
+    
+    single_pass_time = measure(lambda page: new_extract(page, 'html.parser'), pages, args.repeat)
+    print(f"단일 순회 (html.parser): {single_pass_time * 1000 / len(pages):8.2f} ms/페이지 ({legacy_time / single_pass_time:.1f}배)")
+    
+    if PARSER != 'html.parser':
+        fast_time = measure(new_extract, pages, args.repeat)
+        print(f"단일 순회 ({PARSER}):{' ' * (11 - len(PARSER))}{fast_time * 1000 / len(pages):8.2f} ms/페이지 ({legacy_time / fast_time:.1f}배)")
+    
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+"""벤치마크용 고정 문서 모음 생성
+
+네트워크 없이 같은 입력으로 반복 측정할 수 있도록 여러 언어의 HTML 페이지, PDF, Word 문서,
+텍스트 파일을 시드가 고정된 난수로 만듭니다. 같은 CORPUS_VERSION이면 항상 같은 파일이 생성되므로
+커밋 사이의 측정 결과를 비교할 수 있습니다.
+
+PDF는 글꼴을 포함하지 않고 ToUnicode 맵만 가진 Type0 글꼴로 만들어, 한국어·일본어·중국어 텍스트도
+PyPDF2로 추출할 수 있습니다 (화면에 표시하는 용도가 아니라 텍스트 추출 측정용입니다).
+
+사용법:
+    python benchmarks/corpus.py [출력 디렉토리]   # 문서 모음 생성 후 목록 출력
+"""
+import os
+import sys
+import json
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import TEMP_DIR
+
+# 생성 방식이 바뀌면 올려서 기존 문서 모음을 다시 만들게 함
+CORPUS_VERSION = "1"
+
+# 기본 생성 위치
+DEFAULT_CORPUS_DIR = TEMP_DIR / "bench_corpus"
+
+# 언어별 문장 재료 (문장 = 단어를 이어 붙이고 끝에 마침 문자 추가)
+LANGUAGES = {
+    "ko": {
+        "words": ("콘텐츠 요약 서비스는 긴 기사와 보고서를 빠르게 읽을 수 있도록 핵심 내용을 정리합니다 "
+                  "인공지능 모델 문서 분석 결과 사용자 경험 성능 개선 데이터 처리 과정 시장 경제 정책 "
+                  "기술 발전 연구진 발표 올해 지난해 대비 증가 감소 전망 기업 투자 교육 환경").split(),
+        "separator": " ",
+        "end": "."
+    },
+    "en": {
+        "words": ("the content summarizer reads long articles and reports and extracts the key points "
+                  "so readers can decide quickly what matters market policy research team announced "
+                  "growth compared with last year investment education climate technology data").split(),
+        "separator": " ",
+        "end": "."
+    },
+    "ja": {
+        "words": ("コンテンツ 要約 サービス は 長い 記事 と 報告書 を 素早く 読める よう に 要点 を "
+                  "整理 します 人工知能 モデル 文書 分析 結果 市場 経済 政策 技術 研究 発表 昨年 比 増加").split(),
+        "separator": "",
+        "end": "。"
+    },
+    "zh": {
+        "words": ("内容 摘要 服务 帮助 读者 快速 阅读 长篇 文章 和 报告 提取 关键 信息 人工智能 模型 "
+                  "文档 分析 结果 市场 经济 政策 技术 研究 团队 发布 同比 增长 投资 教育 环境").split(),
+        "separator": "",
+        "end": "。"
+    },
+    "de": {
+        "words": ("der Inhalt wird zusammengefasst damit Leser lange Artikel und Berichte schnell "
+                  "verstehen Markt Politik Forschung Wachstum Vergleich Vorjahr Investition Bildung "
+                  "Klima Technologie Daten Unternehmen Ergebnis Analyse").split(),
+        "separator": " ",
+        "end": "."
+    }
+}
+
+def make_sentence(rng, language, words=None):
+    """임의의 문장 하나 생성"""
+    spec = LANGUAGES[language]
+    count = words or rng.randint(8, 20)
+    return spec["separator"].join(rng.choice(spec["words"]) for _ in range(count)) + spec["end"]
+
+def make_paragraphs(seed, language, count, sentences=(3, 6)):
+    """시드가 같으면 항상 같은 문단 목록 생성"""
+    rng = random.Random(f"{seed}-{language}")
+    return [
+        " ".join(make_sentence(rng, language) for _ in range(rng.randint(*sentences)))
+        for _ in range(count)
+    ]
+
+def make_html(seed, language, paragraphs):
+    """광고, 메뉴, 관련 기사 등이 섞인 뉴스 기사형 HTML 페이지"""
+    rng = random.Random(f"html-{seed}-{language}")
+    body = make_paragraphs(seed, language, paragraphs)
+    boilerplate = make_paragraphs(seed + 1000, language, 6, sentences=(1, 2))
+    parts = [
+        "<!DOCTYPE html>",
+        f'<html lang="{language}"><head><meta charset="utf-8">',
+        f"<title>{make_sentence(rng, language, 5)}</title>",
+        f'<meta name="description" content="{make_sentence(rng, language, 12)}">',
+        "<script>window.dataLayer = [];</script><style>.ad { display: none; }</style>",
+        "</head><body>",
+        '<nav class="gnb"><ul>' + "".join(f"<li><a href='/s{i}'>{make_sentence(rng, language, 2)}</a></li>" for i in range(12)) + "</ul></nav>",
+        f'<div class="ad-banner"><p>{boilerplate[0]}</p></div>',
+        '<div class="wrapper"><article class="news">',
+        f"<h1>{make_sentence(rng, language, 6)}</h1>"
+    ]
+    for index, paragraph in enumerate(body):
+        if index and index % 5 == 0:
+            parts.append(f"<h2>{make_sentence(rng, language, 5)}</h2>")
+            parts.append(f'<div class="social-share"><span>{boilerplate[1]}</span></div>')
+        parts.append(f"<p>{paragraph}</p>")
+    parts.append("</article>")
+    parts.append('<aside class="sidebar related">' + "".join(f"<p>{text}</p>" for text in boilerplate[2:5]) + "</aside>")
+    parts.append(f"</div><footer><p>{boilerplate[5]}</p><p>Copyright © Contents Lenz</p></footer>")
+    parts.append("<script>track();</script></body></html>")
+    return "\n".join(parts)
+
+def _to_unicode_cmap(characters):
+    """문서에 사용된 문자만 글리프 번호 = 코드 포인트로 대응시키는 ToUnicode CMap
+    
+    전체 평면을 하나의 범위로 적으면 PyPDF2가 페이지마다 65536개 항목을 펼치므로 사용된 문자만 적습니다.
+    """
+    code_points = sorted({ord(character) for character in characters if ord(character) <= 0xFFFF})
+    entries = [f"<{code_point:04X}> <{code_point:04X}>" for code_point in code_points]
+    blocks = []
+    for start in range(0, len(entries), 100):  # bfchar 블록 하나에 최대 100개
+        chunk = entries[start:start + 100]
+        blocks.append(f"{len(chunk)} beginbfchar\n" + "\n".join(chunk) + "\nendbfchar")
+    return (
+        "/CIDInit /ProcSet findresource begin\n12 dict begin\nbegincmap\n"
+        "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def\n"
+        "/CMapName /Adobe-Identity-UCS def\n/CMapType 2 def\n"
+        "1 begincodespacerange\n<0000> <FFFF>\nendcodespacerange\n"
+        + "\n".join(blocks)
+        + "\nendcmap\nCMapName currentdict /CMap defineresource pop\nend\nend"
+    ).encode("ascii")
+
+def _wrap(text, width):
+    return [text[i:i + width] for i in range(0, len(text), width)] or [""]
+
+def write_pdf(path, pages):
+    """페이지별 문단 목록으로 PDF 생성 (글리프 번호 = 유니코드 코드 포인트, 기본 다국어 평면만 지원)
+    
+    Args:
+        path (str): 저장할 파일 경로
+        pages (list): 페이지마다 문단 문자열 목록
+    """
+    cmap = _to_unicode_cmap("".join("".join(paragraphs) for paragraphs in pages))
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type0 /BaseFont /BenchFont /Encoding /Identity-H "
+           b"/DescendantFonts [4 0 R] /ToUnicode 5 0 R >>",
+        4: b"<< /Type /Font /Subtype /CIDFontType2 /BaseFont /BenchFont "
+           b"/CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) /Supplement 0 >> /FontDescriptor 6 0 R /DW 1000 >>",
+        5: b"<< /Length %d >>\nstream\n" % len(cmap) + cmap + b"\nendstream",
+        6: b"<< /Type /FontDescriptor /FontName /BenchFont /Flags 4 /FontBBox [0 0 1000 1000] "
+           b"/ItalicAngle 0 /Ascent 880 /Descent -120 /CapHeight 700 /StemV 80 >>"
+    }
+    page_ids = []
+    next_id = 7
+    for paragraphs in pages:
+        lines = []
+        for paragraph in paragraphs:
+            lines.extend(_wrap(paragraph, 60))
+            lines.append("")
+        operators = "BT /F1 9 Tf 30 810 Td 12 TL " + " ".join(
+            "<" + line.encode("utf-16-be").hex().upper() + "> '" for line in lines
+        ) + " ET"
+        stream = operators.encode("ascii")
+        content_id, page_id = next_id, next_id + 1
+        next_id += 2
+        objects[content_id] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        objects[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(page_id)
+    objects[2] = b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % i for i in page_ids) + b"] /Count %d >>" % len(page_ids)
+    
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = len(output)
+        output += b"%d 0 obj\n" % object_id + objects[object_id] + b"\nendobj\n"
+    xref_offset = len(output)
+    size = max(objects) + 1
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for object_id in range(1, size):
+        output += b"%010d 00000 n \n" % offsets[object_id]
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset)
+    
+    with open(path, "wb") as file:
+        file.write(output)
+
+def write_docx(path, title, paragraphs):
+    """제목, 문단, 표가 있는 Word 문서 생성"""
+    import docx
+    
+    document = docx.Document()
+    document.add_heading(title, level=1)
+    for index, paragraph in enumerate(paragraphs):
+        document.add_paragraph(paragraph)
+        if index == len(paragraphs) // 2:
+            table = document.add_table(rows=3, cols=3)
+            for row_index, row in enumerate(table.rows):
+                for column_index, cell in enumerate(row.cells):
+                    cell.text = f"{row_index}-{column_index}"
+    document.save(path)
+
+# 생성할 문서 목록: (이름, 종류, 언어, 크기)
+# 크기는 HTML/텍스트/Word 문서는 문단 수, PDF는 페이지 수
+CORPUS_SPEC = [
+    ("news_ko", "html", "ko", 30),
+    ("news_en", "html", "en", 30),
+    ("news_ja", "html", "ja", 30),
+    ("news_zh", "html", "zh", 30),
+    ("news_de", "html", "de", 30),
+    ("long_ko", "html", "ko", 300),
+    ("report_ko", "pdf", "ko", 4),
+    ("report_en", "pdf", "en", 4),
+    ("report_ja", "pdf", "ja", 4),
+    ("book_en", "pdf", "en", 40),
+    ("memo_ko", "docx", "ko", 40),
+    ("memo_zh", "docx", "zh", 40),
+    ("memo_de", "docx", "de", 40),
+    ("notes_ko", "txt", "ko", 200),
+    ("notes_ko_cp949", "txt", "ko", 200),
+    ("notes_en", "txt", "en", 200)
+]
+
+def build_corpus(directory=DEFAULT_CORPUS_DIR):
+    """문서 모음 생성 (같은 버전이 이미 있으면 그대로 사용)
+    
+    Args:
+        directory: 문서를 저장할 디렉토리
+    
+    Returns:
+        list: 문서마다 {"name", "kind", "language", "path", "bytes"} 항목
+    """
+    directory = str(directory)
+    manifest_path = os.path.join(directory, "manifest.json")
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+        if manifest.get("version") == CORPUS_VERSION and all(os.path.exists(item["path"]) for item in manifest["documents"]):
+            return manifest["documents"]
+    
+    os.makedirs(directory, exist_ok=True)
+    documents = []
+    for seed, (name, kind, language, size) in enumerate(CORPUS_SPEC):
+        extension = ".txt" if kind == "txt" else "." + kind
+        path = os.path.join(directory, name + extension)
+        
+        if kind == "html":
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(make_html(seed, language, size))
+        elif kind == "pdf":
+            paragraphs = make_paragraphs(seed, language, size * 6)
+            write_pdf(path, [paragraphs[i:i + 6] for i in range(0, len(paragraphs), 6)])
+        elif kind == "docx":
+            paragraphs = make_paragraphs(seed, language, size)
+            write_docx(path, make_sentence(random.Random(seed), language, 5), paragraphs)
+        else:
+            encoding = "cp949" if name.endswith("cp949") else "utf-8"
+            text = "\r\n\r\n".join(make_paragraphs(seed, language, size))
+            with open(path, "w", encoding=encoding, newline="") as file:
+                file.write(text)
+        
+        documents.append({
+            "name": name,
+            "kind": kind,
+            "language": language,
+            "path": path,
+            "bytes": os.path.getsize(path)
+        })
+    
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        json.dump({"version": CORPUS_VERSION, "documents": documents}, file, ensure_ascii=False, indent=2)
+    return documents
+
+if __name__ == "__main__":
+    documents = build_corpus(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CORPUS_DIR)
+    for document in documents:
+        print(f"{document['name']:<16} {document['kind']:<5} {document['language']:<3} {document['bytes'] / 1024:8.1f}KB  {document['path']}")
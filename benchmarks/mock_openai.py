@@ -0,0 +1,219 @@
+"""OpenAI Chat Completions API 대체 서버 (벤치마크용)
+
+네트워크 없이 요청 경로 전체를 측정할 수 있도록 /v1/chat/completions에 정해진 지연 시간 뒤
+가짜 응답을 돌려주고, /v1/models에는 모델 하나만 담은 목록을 돌려줍니다. 스트리밍 요청(stream=True)은 SSE로 단어 단위 청크를 보내고,
+stream_options.include_usage가 있으면 마지막에 사용량 청크를 보냅니다.
+/pages/<파일 이름> 경로로 지정한 디렉토리의 파일을 제공하므로 URL 요약 경로도 로컬에서 측정할 수 있습니다.
+
+사용법:
+    python benchmarks/mock_openai.py --port 8089 --latency 0.3
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=bench python main.py --api
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import mimetypes
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# 기본 응답에 사용할 단어
+_REPLY_WORDS = "summary content report market research data analysis result growth policy".split()
+
+def default_reply(request, output_tokens):
+    """요청에 맞는 기본 응답 텍스트
+    
+    응답 최대 토큰 수가 언어 감지 수준(10 이하)이면 언어 코드를 돌려주고,
+    그 밖에는 키워드 응답으로도 해석할 수 있도록 쉼표로 구분한 단어를 돌려줍니다.
+    """
+    max_tokens = request.get("max_tokens") or output_tokens
+    if max_tokens <= 10:
+        return "en"
+    count = max(1, min(max_tokens, output_tokens))
+    return ", ".join(_REPLY_WORDS[i % len(_REPLY_WORDS)] for i in range(count))
+
+class MockOpenAIServer:
+    """백그라운드 스레드에서 실행되는 Chat Completions API 대체 서버"""
+    
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, tokens_per_second=0.0,
+                 output_tokens=150, reply=None, pages_dir=None):
+        """서버 초기화
+        
+        Args:
+            host (str): 바인드할 주소
+            port (int): 바인드할 포트 (0이면 빈 포트 자동 선택)
+            latency (float): 첫 응답까지의 지연 시간 (초)
+            tokens_per_second (float): 응답 토큰 생성 속도 (0이면 지연 없이 한 번에 생성)
+            output_tokens (int): 기본 응답의 최대 단어 수
+            reply: (요청 dict) -> 응답 텍스트 함수 (None이면 default_reply 사용)
+            pages_dir (str): /pages/ 경로로 제공할 파일 디렉토리
+        """
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.output_tokens = output_tokens
+        self.reply = reply
+        self.pages_dir = pages_dir
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+    
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    @property
+    def base_url(self):
+        """OpenAI SDK의 base_url (OPENAI_BASE_URL 환경 변수 값)"""
+        return self.url + "/v1"
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+    
+    def _completion(self, request):
+        """응답 텍스트와 사용량 계산"""
+        with self._lock:
+            self.requests += 1
+        text = self.reply(request) if self.reply else default_reply(request, self.output_tokens)
+        prompt_chars = sum(len(str(message.get("content", ""))) for message in request.get("messages", []))
+        words = text.split(" ")
+        usage = {
+            "prompt_tokens": max(1, prompt_chars // 4),
+            "completion_tokens": len(words),
+            "total_tokens": max(1, prompt_chars // 4) + len(words)
+        }
+        return text, words, usage
+    
+    def _make_handler(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def log_message(self, format, *args):
+                pass
+            
+            def _send_json(self, status, payload):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_GET(self):
+                # API 서버 워밍업의 연결 확인 요청
+                if self.path.rstrip("/").endswith("/models"):
+                    self._send_json(200, {"object": "list", "data": [{"id": "mock", "object": "model", "created": 0, "owned_by": "bench"}]})
+                    return
+                if not self.path.startswith("/pages/") or not server.pages_dir:
+                    self._send_json(404, {"error": {"message": "not found"}})
+                    return
+                name = os.path.basename(self.path[len("/pages/"):].split("?")[0])
+                path = os.path.join(server.pages_dir, name)
+                if not os.path.isfile(path):
+                    self._send_json(404, {"error": {"message": "not found"}})
+                    return
+                with open(path, "rb") as file:
+                    body = file.read()
+                content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                if content_type.startswith("text/"):
+                    content_type += "; charset=utf-8"
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    self._send_json(400, {"error": {"message": "invalid json"}})
+                    return
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": "not found"}})
+                    return
+                
+                text, words, usage = server._completion(request)
+                if server.latency:
+                    time.sleep(server.latency)
+                token_delay = 1 / server.tokens_per_second if server.tokens_per_second else 0
+                base = {"id": "chatcmpl-bench", "created": int(time.time()), "model": request.get("model", "mock")}
+                
+                if not request.get("stream"):
+                    if token_delay:
+                        time.sleep(token_delay * len(words))
+                    self._send_json(200, dict(base, object="chat.completion", choices=[{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop"
+                    }], usage=usage))
+                    return
+                
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                
+                def send_event(payload):
+                    self.wfile.write(b"data: " + json.dumps(payload).encode("utf-8") + b"\n\n")
+                    self.wfile.flush()
+                
+                chunk = dict(base, object="chat.completion.chunk")
+                for index, word in enumerate(words):
+                    if token_delay:
+                        time.sleep(token_delay)
+                    content = word if index == 0 else " " + word
+                    send_event(dict(chunk, choices=[{"index": 0, "delta": {"content": content}, "finish_reason": None}]))
+                send_event(dict(chunk, choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}]))
+                if (request.get("stream_options") or {}).get("include_usage"):
+                    send_event(dict(chunk, choices=[], usage=usage))
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+                self.close_connection = True
+        
+        return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI Chat Completions API 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드할 주소")
+    parser.add_argument("--port", type=int, default=8089, help="포트 (기본값: 8089)")
+    parser.add_argument("--latency", type=float, default=0.0, help="첫 응답까지의 지연 시간 (초)")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="응답 토큰 생성 속도 (0이면 한 번에 응답)")
+    parser.add_argument("--output-tokens", type=int, default=150, help="응답 최대 단어 수")
+    parser.add_argument("--pages", help="/pages/ 경로로 제공할 파일 디렉토리")
+    args = parser.parse_args()
+    
+    server = MockOpenAIServer(
+        args.host, args.port, latency=args.latency, tokens_per_second=args.tokens_per_second,
+        output_tokens=args.output_tokens, pages_dir=args.pages
+    )
+    print(f"대체 서버 실행 중: OPENAI_BASE_URL={server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,444 @@
+"""오프라인 벤치마크 모음
+
+네트워크 없이 실행되며, 결과를 JSON으로 출력하여 커밋 사이의 성능 변화를 비교할 수 있습니다.
+
+- 고정 문서 모음(benchmarks/corpus.py): 여러 언어의 HTML, PDF, Word 문서, 텍스트 파일
+- OpenAI API 대체 서버(benchmarks/mock_openai.py): 지연 시간과 응답 길이를 설정할 수 있는 로컬 서버
+- 마이크로 벤치마크: FileHandler.read_file, scrape_url의 본문 추출 경로, OpenAIClient 프롬프트 구성
+- 엔드투엔드 벤치마크: 주요 API 엔드포인트 (앱을 프로세스 안에서 직접 호출하고, OpenAI와 웹 페이지는 대체 서버 사용)
+- 시작 시간 벤치마크: 새 프로세스에서 src.api_server 가져오기와 main.py --help 실행 시간
+  (무거운 모듈을 미리 가져오면 실패로 보고 종료 코드 1, 인터프리터 시작 시간을 뺀 시간이
+  STARTUP_BUDGETS를 넘으면 경고만 출력)
+
+캐시는 기본적으로 끄고 측정합니다 (같은 입력을 반복하므로 켜면 캐시 조회 시간만 측정됨).
+
+사용법:
+    python benchmarks/run_benchmarks.py                              # 전체 실행, 결과 JSON을 표준 출력으로
+    python benchmarks/run_benchmarks.py --output results.json        # 결과를 파일로 저장
+    python benchmarks/run_benchmarks.py --filter file_handler        # 이름에 문자열이 포함된 벤치마크만 실행
+    python benchmarks/run_benchmarks.py --quick --llm-latency 0.2    # 반복 횟수를 줄이고 API 지연 시간 설정
+    python benchmarks/run_benchmarks.py --compare base.json --output new.json  # 이전 결과와 비교
+"""
+import os
+import sys
+import json
+import math
+import time
+import asyncio
+import argparse
+import platform
+import statistics
+import subprocess
+import contextlib
+from datetime import datetime, timezone
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# 결과 JSON 형식 버전 (필드 의미가 바뀌면 올림)
+RESULT_SCHEMA_VERSION = 1
+
+# 캐시를 끌 때 설정하는 환경 변수 (src.config를 가져오기 전에 설정해야 적용되므로 src 모듈은 main에서 가져옴)
+CACHE_SETTINGS = [
+    "SUMMARY_CACHE_ENABLED", "EXTRACTION_CACHE_ENABLED", "SCRAPE_CACHE_ENABLED", "SCRAPE_CONTENT_CACHE_ENABLED"
+]
+
+# 시작 시간 예산 (초, startup/python 중앙값을 뺀 추가 시간)
+STARTUP_BUDGETS = {
+    "startup/import src.api_server": 1.0,
+    "startup/main.py --help": 0.1
+}
+
+# 처음 사용할 때 가져와야 하는 무거운 모듈 (src.api_server를 가져온 직후 로드되어 있으면 실패)
+LAZY_MODULES = ["openai", "httpx", "bs4", "lxml", "PyPDF2", "docx", "requests", "tiktoken", "uvicorn"]
+
+def summarize_samples(samples):
+    """측정값 목록의 통계 (초 단위)"""
+    ordered = sorted(samples)
+    count = len(ordered)
+    return {
+        "iterations": count,
+        "min": round(ordered[0], 6),
+        "median": round(statistics.median(ordered), 6),
+        "mean": round(statistics.fmean(ordered), 6),
+        "p95": round(ordered[max(0, math.ceil(count * 0.95) - 1)], 6),
+        "max": round(ordered[-1], 6),
+        "stdev": round(statistics.pstdev(ordered), 6)
+    }
+
+def time_calls(function, iterations, warmup=1):
+    """함수를 여러 번 호출하며 호출마다 걸린 시간 측정"""
+    for _ in range(warmup):
+        function()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+async def time_async_calls(function, iterations, warmup=1):
+    """코루틴 함수를 여러 번 호출하며 호출마다 걸린 시간 측정"""
+    for _ in range(warmup):
+        await function()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+def _result(name, group, samples, **extra):
+    return dict({"name": name, "group": group, "unit": "seconds"}, **summarize_samples(samples), **extra)
+
+def _read_text(path):
+    with open(path, "r", encoding="utf-8") as file:
+        return file.read()
+
+def bench_file_handler(corpus, args):
+    """FileHandler.read_file (문서 종류와 언어별)"""
+    from src.utils.file_handler import FileHandler
+    
+    results = []
+    for document in corpus:
+        if document["kind"] not in ("pdf", "docx", "txt"):
+            continue
+        samples = time_calls(lambda: FileHandler.read_file(document["path"]), args.iterations)
+        results.append(_result(
+            f"file_handler.read_file/{document['name']}", "micro", samples,
+            bytes=document["bytes"], mb_per_second=round(document["bytes"] / statistics.median(samples) / 1e6, 3)
+        ))
+    return results
+
+def bench_scrape_extract(corpus, args):
+    """scrape_url의 본문 추출 경로 (HTML 파싱, 본문 추출, 텍스트 정리)"""
+    from src.api_server import extract_web_content
+    
+    async def run():
+        results = []
+        for document in corpus:
+            if document["kind"] != "html":
+                continue
+            html = _read_text(document["path"])
+            url = f"https://bench.local/{document['name']}"
+            samples = await time_async_calls(lambda: extract_web_content(html, url, False), args.iterations)
+            results.append(_result(
+                f"scrape.extract/{document['name']}", "micro", samples, bytes=document["bytes"]
+            ))
+        return results
+    
+    return asyncio.run(run())
+
+def bench_prompt_building(corpus, args):
+    """OpenAIClient 프롬프트 구성 (입력 길이 맞추기, 메시지 구성, 분할 요약 청크 나누기)"""
+    from src.models.openai_client import OpenAIClient
+    from src.utils.file_handler import FileHandler
+    
+    client = OpenAIClient()
+    max_tokens = client._summary_max_tokens("medium")
+    results = []
+    for document in corpus:
+        if document["kind"] != "txt" or document["name"].endswith("cp949"):
+            continue
+        text = FileHandler.read_file(document["path"])
+        samples = time_calls(
+            lambda: client._build_summary_messages(client._fit_to_budget(text, max_tokens), "medium", "paragraph", "auto"),
+            args.iterations
+        )
+        results.append(_result(f"openai_client.build_summary_messages/{document['name']}", "micro", samples, chars=len(text)))
+        
+        samples = time_calls(lambda: client._build_keywords_messages(text, 10, "auto"), args.iterations)
+        results.append(_result(f"openai_client.build_keywords_messages/{document['name']}", "micro", samples, chars=len(text)))
+        
+        samples = time_calls(lambda: client._chunk_for_summary(text), args.iterations)
+        results.append(_result(f"openai_client.chunk_for_summary/{document['name']}", "micro", samples, chars=len(text)))
+    return results
+
+def bench_endpoints(corpus, args, mock_server):
+    """주요 API 엔드포인트 (동시 요청 수 args.concurrency, 엔드포인트마다 args.requests번 요청)"""
+    import httpx
+    import src.api_server as api_server
+    from src.utils.file_handler import FileHandler
+    
+    documents = {document["name"]: document for document in corpus}
+    short_text = FileHandler.read_file(documents["notes_en"]["path"])[:6000]
+    korean_text = FileHandler.read_file(documents["notes_ko"]["path"])[:6000]
+    long_text = FileHandler.read_file(documents["notes_ko"]["path"])
+    
+    def upload(name):
+        with open(documents[name]["path"], "rb") as file:
+            content = file.read()
+        return lambda: {"files": {"file": (os.path.basename(documents[name]["path"]), content)}}
+    
+    endpoints = [
+        ("POST /summarize/text", "/summarize/text", lambda: {"data": {"text": short_text}}),
+        ("POST /summarize/text chunked", "/summarize/text", lambda: {"data": {"text": long_text, "chunked": "true"}}),
+        ("POST /summarize/text/stream", "/summarize/text/stream", lambda: {"data": {"text": korean_text}}),
+        ("POST /summarize/url", "/summarize/url", lambda: {"data": {"url": f"{mock_server.url}/pages/news_ko.html"}}),
+        ("POST /scrape-url", "/scrape-url", lambda: {"data": {"url": f"{mock_server.url}/pages/news_ja.html", "use_ai_filter": "false"}}),
+        ("POST /summarize/file pdf", "/summarize/file", upload("report_ko")),
+        ("POST /summarize/file docx", "/summarize/file", upload("memo_de")),
+        ("POST /keywords/text", "/keywords/text", lambda: {"data": {"text": short_text}}),
+        ("POST /analyze/text", "/analyze/text", lambda: {"data": {"text": korean_text}}),
+        ("POST /detect-language", "/detect-language", lambda: {"data": {"text": korean_text}}),
+        ("POST /summarize/batch", "/summarize/batch", lambda: {"json": {"items": [
+            {"text": text} for text in (short_text[i * 500:(i + 1) * 500] for i in range(10))
+        ]}})
+    ]
+    
+    async def run():
+        results = []
+        transport = httpx.ASGITransport(app=api_server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            for name, path, make_request in endpoints:
+                if args.filter and args.filter not in f"endpoint/{name}":
+                    continue
+                semaphore = asyncio.Semaphore(args.concurrency)
+                samples = []
+                errors = 0
+                
+                async def call():
+                    nonlocal errors
+                    async with semaphore:
+                        start = time.perf_counter()
+                        response = await client.post(path, **make_request())
+                        await response.aread()
+                        samples.append(time.perf_counter() - start)
+                        if response.status_code != 200:
+                            errors += 1
+                
+                await call()  # 준비 요청 (결과에서 제외)
+                samples.clear()
+                errors = 0
+                start = time.perf_counter()
+                await asyncio.gather(*(call() for _ in range(args.requests)))
+                elapsed = time.perf_counter() - start
+                results.append(_result(
+                    f"endpoint/{name}", "endpoint", samples,
+                    concurrency=args.concurrency, errors=errors,
+                    requests_per_second=round(len(samples) / elapsed, 3)
+                ))
+        if api_server.openai_client:
+            await api_server.openai_client.close()
+        await api_server.http_fetcher.close()
+        return results
+    
+    return asyncio.run(run())
+
+def bench_startup(corpus, args):
+    """새 프로세스의 시작 시간 (서버 모듈 가져오기, 명령줄 도움말)과 미리 가져온 무거운 모듈 확인"""
+    targets = [
+        ("startup/python", [sys.executable, "-c", "pass"]),
+        ("startup/import src.api_server", [sys.executable, "-c", "import src.api_server"]),
+        ("startup/main.py --help", [sys.executable, "main.py", "--help"])
+    ]
+    
+    def run(command):
+        subprocess.run(command, cwd=ROOT_DIR, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    
+    results = []
+    baseline = None
+    for name, command in targets:
+        samples = time_calls(lambda: run(command), args.iterations)
+        median = statistics.median(samples)
+        extra = {}
+        if baseline is None:
+            baseline = median
+        elif name in STARTUP_BUDGETS:
+            overhead = median - baseline
+            extra = {
+                "overhead": round(overhead, 6),
+                "budget": STARTUP_BUDGETS[name],
+                "over_budget": overhead > STARTUP_BUDGETS[name]
+            }
+        results.append(_result(name, "startup", samples, **extra))
+    
+    check = subprocess.run(
+        [sys.executable, "-c", f"import sys, json, src.api_server; print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"],
+        cwd=ROOT_DIR, check=True, capture_output=True, text=True
+    )
+    eager_modules = json.loads(check.stdout.strip().splitlines()[-1])
+    for result in results:
+        if result["name"] == "startup/import src.api_server":
+            result["eager_modules"] = eager_modules
+    return results
+
+def startup_failures(results):
+    """무거운 모듈을 미리 가져온 벤치마크 설명 목록 (실행 환경과 무관한 검사라 실패로 처리)"""
+    return [
+        f"{result['name']}: 미리 가져온 모듈 {', '.join(result['eager_modules'])}"
+        for result in results if result.get("eager_modules")
+    ]
+
+def startup_warnings(results):
+    """인터프리터 시작 시간을 뺀 시간이 예산을 넘은 벤치마크 설명 목록 (측정 잡음이 있어 경고로만 처리)"""
+    return [
+        f"{result['name']}: 추가 시간 {result['overhead']:.3f}초 > 예산 {result['budget']}초"
+        for result in results if result.get("over_budget")
+    ]
+
+BENCHMARKS = [
+    ("startup", bench_startup),
+    ("file_handler", bench_file_handler),
+    ("scrape", bench_scrape_extract),
+    ("openai_client", bench_prompt_building),
+    ("endpoint", bench_endpoints)
+]
+
+def git_revision():
+    """현재 커밋과 작업 트리 변경 여부 (git이 없으면 None)"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip())
+        return {"commit": commit, "dirty": dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_results(current, baseline, threshold):
+    """이전 결과와 중앙값 비교
+    
+    Returns:
+        list: 중앙값이 threshold 비율보다 많이 늘어난 벤치마크 이름 목록
+    """
+    baseline_medians = {result["name"]: result["median"] for result in baseline.get("results", [])}
+    regressions = []
+    print(f"\n{'벤치마크':<60} {'이전(ms)':>10} {'현재(ms)':>10} {'비율':>7}", file=sys.stderr)
+    for result in current["results"]:
+        previous = baseline_medians.get(result["name"])
+        if not previous:
+            continue
+        ratio = result["median"] / previous
+        mark = ""
+        if ratio > 1 + threshold:
+            regressions.append(result["name"])
+            mark = "  느려짐"
+        elif ratio < 1 - threshold:
+            mark = "  빨라짐"
+        print(f"{result['name']:<60} {previous * 1000:>10.3f} {result['median'] * 1000:>10.3f} {ratio:>7.2f}{mark}", file=sys.stderr)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크 모음 (결과는 JSON으로 출력)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (없으면 표준 출력)")
+    parser.add_argument("--filter", help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    parser.add_argument("--iterations", type=int, default=20, help="마이크로 벤치마크 반복 횟수 (기본값: 20)")
+    parser.add_argument("--requests", type=int, default=20, help="엔드포인트마다 보낼 요청 수 (기본값: 20)")
+    parser.add_argument("--concurrency", type=int, default=4, help="엔드포인트 벤치마크 동시 요청 수 (기본값: 4)")
+    parser.add_argument("--quick", action="store_true", help="반복 횟수와 요청 수를 5로 줄여 빠르게 실행")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="대체 OpenAI 서버의 응답 지연 시간 (초)")
+    parser.add_argument("--llm-tokens-per-second", type=float, default=0.0, help="대체 OpenAI 서버의 토큰 생성 속도 (0이면 한 번에 응답)")
+    parser.add_argument("--llm-output-tokens", type=int, default=150, help="대체 OpenAI 서버의 응답 최대 단어 수")
+    parser.add_argument("--with-caches", action="store_true", help="요약, 문서 추출, 웹 페이지 캐시를 켠 채로 측정")
+    parser.add_argument("--corpus-dir", help="문서 모음 디렉토리 (기본값: temp/bench_corpus)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.1, help="느려졌다고 판단할 중앙값 증가 비율 (기본값: 0.1)")
+    parser.add_argument("--verbose", action="store_true", help="API 서버의 요청 로그 출력 (기본값: 숨김)")
+    args = parser.parse_args()
+    
+    if args.quick:
+        args.iterations = min(args.iterations, 5)
+        args.requests = min(args.requests, 5)
+    
+    # src 모듈을 가져오기 전에 설정해야 적용됨
+    os.environ["OPENAI_API_KEY"] = "bench"
+    os.environ["TRACE_LOG_FILE"] = ""
+    if not args.with_caches:
+        for name in CACHE_SETTINGS:
+            os.environ[name] = "false"
+    
+    from corpus import build_corpus, CORPUS_VERSION, DEFAULT_CORPUS_DIR
+    from mock_openai import MockOpenAIServer
+    
+    print("문서 모음 준비 중...", file=sys.stderr)
+    args.corpus_dir = args.corpus_dir or str(DEFAULT_CORPUS_DIR)
+    corpus = build_corpus(args.corpus_dir)
+    
+    mock_server = MockOpenAIServer(
+        latency=args.llm_latency, tokens_per_second=args.llm_tokens_per_second,
+        output_tokens=args.llm_output_tokens, pages_dir=args.corpus_dir
+    ).start()
+    # OpenAI SDK는 클라이언트를 만들 때 이 환경 변수를 읽음
+    os.environ["OPENAI_BASE_URL"] = mock_server.base_url
+    
+    results = []
+    log_output = sys.stderr if args.verbose else open(os.devnull, "w")
+    try:
+        for group, benchmark in BENCHMARKS:
+            # 엔드포인트 벤치마크는 엔드포인트 이름으로 다시 거름
+            if args.filter and group != "endpoint" and args.filter not in group:
+                continue
+            print(f"{group} 벤치마크 실행 중...", file=sys.stderr)
+            with contextlib.redirect_stdout(log_output):
+                if group == "endpoint":
+                    group_results = benchmark(corpus, args, mock_server)
+                else:
+                    group_results = benchmark(corpus, args)
+            if args.filter:
+                group_results = [result for result in group_results if args.filter in result["name"]]
+            results.extend(group_results)
+    finally:
+        mock_server.stop()
+        if log_output is not sys.stderr:
+            log_output.close()
+    
+    report = {
+        "schema": RESULT_SCHEMA_VERSION,
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "corpus_version": CORPUS_VERSION,
+            "caches": args.with_caches,
+            "iterations": args.iterations,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "llm": {
+                "latency": args.llm_latency,
+                "tokens_per_second": args.llm_tokens_per_second,
+                "output_tokens": args.llm_output_tokens,
+                "requests": mock_server.requests
+            }
+        },
+        "results": results
+    }
+    
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+        print(f"결과가 {args.output}에 저장되었습니다. (벤치마크 {len(results)}개)", file=sys.stderr)
+    else:
+        print(output)
+    
+    exit_code = 0
+    warnings = startup_warnings(results)
+    if warnings:
+        print(f"\n시작 시간 예산 초과 {len(warnings)}개 (경고):", file=sys.stderr)
+        for warning in warnings:
+            print(f"  {warning}", file=sys.stderr)
+    
+    failures = startup_failures(results)
+    if failures:
+        print(f"\n무거운 모듈을 미리 가져온 시작 경로 {len(failures)}개:", file=sys.stderr)
+        for failure in failures:
+            print(f"  {failure}", file=sys.stderr)
+        exit_code = 1
+    
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare_results(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n느려진 벤치마크 {len(regressions)}개: {', '.join(regressions)}", file=sys.stderr)
+            exit_code = 1
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
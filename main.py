@@ -4,9 +4,8 @@
 import sys
 import os
 import argparse
-from src.config import create_required_directories, SUPPORTED_LANGUAGES
-from src.models.openai_client import OpenAIClient
-from src.utils.file_handler import FileHandler
+import itertools
+from src.config import create_required_directories, SUPPORTED_LANGUAGES, BATCH_MAX_CONCURRENCY, OUTPUT_DIR
 
 def main():
     """애플리케이션 메인 함수"""
@@ -21,18 +20,28 @@ def main():
     parser.add_argument('--length', type=str, choices=['short', 'medium', 'long'], default='medium', help='요약 길이 (short, medium, long)')
     parser.add_argument('--format', type=str, choices=['bullet', 'paragraph', 'structured'], default='paragraph', help='요약 형식 (bullet, paragraph, structured)')
     parser.add_argument('--language', type=str, choices=list(SUPPORTED_LANGUAGES.keys()), default='auto', help='요약 결과 언어 (auto, ko, en, ja, zh 등)')
+    parser.add_argument('--pages', type=str, help='PDF에서 요약할 페이지 범위 (예: 1-5,8)')
+    parser.add_argument('--chunked', action='store_true', help='긴 문서를 분할하여 병렬로 요약 (map-reduce)')
+    parser.add_argument('--batch', type=str, help='일괄 요약할 디렉토리, 글롭 패턴 또는 목록 파일 경로 (결과는 --output에 JSONL로 저장)')
+    parser.add_argument('--workers', type=int, help='일괄 처리 시 파일 추출 프로세스 수 (기본값: CPU 수), API 서버 모드에서는 워커 프로세스 수 (기본값: WEB_CONCURRENCY 또는 1)')
+    parser.add_argument('--concurrency', type=int, default=BATCH_MAX_CONCURRENCY, help=f'일괄 처리 시 동시에 진행할 요약 수 (기본값: {BATCH_MAX_CONCURRENCY})')
+    parser.add_argument('--no-resume', action='store_true', help='일괄 처리 시 이미 처리된 항목도 다시 요약')
     
     args = parser.parse_args()
     
     create_required_directories()
     
+    # 일괄 처리 모드 (디렉토리, 글롭, 목록 파일)
+    if args.batch:
+        sys.exit(run_batch_mode(args))
+    
     # API 서버 모드 (기본 모드)
     if args.api or (not args.headless and not args.input):
         try:
             from src.api_server import run_api_server
             print(f"Contents Lenz API 서버를 시작합니다. http://{args.host}:{args.port}")
             print("종료하려면 Ctrl+C를 누르세요.")
-            run_api_server(host=args.host, port=args.port, reload=args.reload)
+            run_api_server(host=args.host, port=args.port, reload=args.reload, workers=args.workers)
         except Exception as e:
             print(f"API 서버 실행 중 오류가 발생했습니다: {str(e)}")
             sys.exit(1)
@@ -43,10 +52,21 @@ def main():
             print("오류: 헤드리스 모드에서는 --input 인자가 필요합니다.")
             sys.exit(1)
         
+        # 요약에 필요한 모듈은 이 모드에서만 가져옴 (--help, API 서버 모드의 시작 시간 단축)
+        from src.models.openai_client import OpenAIClient
+        from src.utils.file_handler import FileHandler
+        
         try:
             input_text = ""
+            input_blocks = None
             if os.path.isfile(args.input):
-                input_text = FileHandler.read_file(args.input)
+                if args.chunked:
+                    # 분할 요약은 문서를 블록 단위로 읽으면서 진행 (언어 감지는 첫 블록 사용)
+                    blocks = FileHandler.iter_file(args.input, pages=args.pages)
+                    input_text = next(blocks, "")
+                    input_blocks = itertools.chain([input_text], blocks)
+                else:
+                    input_text = FileHandler.read_file(args.input, pages=args.pages)
             else:
                 input_text = args.input  # 파일이 아니면 직접 텍스트로 간주
             
@@ -58,7 +78,10 @@ def main():
                 print(f"감지된 언어: {SUPPORTED_LANGUAGES.get(detected_language, detected_language)}")
             
             print("텍스트 요약 중...")
-            summary = client.summarize_text(input_text, args.length, args.format, args.language)
+            if args.chunked:
+                summary = client.summarize_blocks(input_blocks or [input_text], args.length, args.format, args.language)
+            else:
+                summary = client.summarize_text(input_text, args.length, args.format, args.language)
             
             if args.output:
                 output_path = args.output
@@ -78,5 +101,48 @@ def main():
             print(f"오류 발생: {str(e)}")
             sys.exit(1)
 
+def run_batch_mode(args):
+    """일괄 처리 모드 실행
+    
+    Returns:
+        int: 종료 코드 (실패한 항목이 있으면 1)
+    """
+    import asyncio
+    from src.batch_runner import collect_inputs, run_batch
+    from src.models.async_openai_client import AsyncOpenAIClient
+    
+    try:
+        items = collect_inputs(args.batch, pages=args.pages)
+    except (OSError, ValueError) as e:
+        print(f"오류 발생: {str(e)}")
+        return 1
+    
+    if not items:
+        print("오류: 일괄 처리할 파일이 없습니다.")
+        return 1
+    
+    output_path = args.output or str(OUTPUT_DIR / "batch_results.jsonl")
+    print(f"{len(items)}개 파일을 요약합니다. 결과 파일: {output_path}")
+    
+    async def run():
+        client = AsyncOpenAIClient()
+        try:
+            return await run_batch(
+                items, output_path, client,
+                length=args.length, format=args.format, language=args.language, chunked=args.chunked,
+                workers=args.workers, concurrency=args.concurrency, resume=not args.no_resume
+            )
+        finally:
+            await client.close()
+    
+    try:
+        counts = asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\n중단되었습니다. 같은 명령을 다시 실행하면 처리된 항목을 건너뛰고 이어서 진행합니다.")
+        return 130
+    
+    print(f"완료: 성공 {counts['ok']}개, 실패 {counts['error']}개, 건너뜀 {counts['skipped']}개 (전체 {counts['total']}개)")
+    return 1 if counts['error'] else 0
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
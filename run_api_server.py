@@ -14,13 +14,14 @@ def main():
     parser.add_argument('--host', type=str, default='0.0.0.0', help='서버 호스트 (기본값: 0.0.0.0)')
     parser.add_argument('--port', type=int, default=8000, help='서버 포트 (기본값: 8000)')
     parser.add_argument('--reload', action='store_true', help='코드 변경 시 자동 재시작')
+    parser.add_argument('--workers', type=int, help='워커 프로세스 수 (기본값: WEB_CONCURRENCY 환경 변수 또는 1)')
     
     args = parser.parse_args()
     
     print(f"Contents Lenz API 서버를 시작합니다. http://{args.host}:{args.port}")
     print("종료하려면 Ctrl+C를 누르세요.")
     
-    run_api_server(host=args.host, port=args.port, reload=args.reload)
+    run_api_server(host=args.host, port=args.port, reload=args.reload, workers=args.workers)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -3,20 +3,44 @@ FastAPI 기반 API 서버 모듈
 """
 
 import os
+import json
+import asyncio
+import time
+import itertools
+import shutil
 import tempfile
 from typing import Optional, List
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse, Response, JSONResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
-import uvicorn
-import requests
-from bs4 import BeautifulSoup
-import re
 
-from src.models.openai_client import OpenAIClient
-from src.utils.file_handler import FileHandler
-from src.config import SUMMARY_LENGTHS, SUMMARY_FORMATS, SUPPORTED_LANGUAGES, SUPPORTED_TEXT_FORMATS, SUPPORTED_DOCUMENT_FORMATS
+from src.models.async_openai_client import AsyncOpenAIClient
+from src.utils.file_handler import FileHandler, PageRangeError, extraction_cache, parse_page_range, preload_parsers
+from src.utils.http_fetcher import HttpFetcher, canonicalize_url
+from src.utils.cache import make_cache_key
+from src.utils.single_flight import SingleFlight
+from src.utils.html_extractor import parse_html
+from src.utils.token_estimator import estimate_tokens
+from src.utils.language_detector import get_language_detector
+from src.utils.upload_limit import UploadSizeLimitMiddleware, UploadTooLarge
+from src.utils.text_normalizer import WEB_CONTENT_PIPELINE, DOCUMENT_PIPELINE
+from src.utils.metrics import (
+    REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, Counter, Gauge, reset_multiprocess_dir,
+    SCRAPE_DURATION, PARSE_DURATION, DOCUMENT_EXTRACT_DURATION
+)
+from src.utils.tracing import TracingMiddleware, span
+from src.utils.job_queue import JobStore, JobQueue, JobError, public_job
+from src.config import (
+    SUMMARY_LENGTHS, SUMMARY_FORMATS, SUPPORTED_LANGUAGES, SUPPORTED_TEXT_FORMATS, SUPPORTED_DOCUMENT_FORMATS,
+    BATCH_MAX_ITEMS, BATCH_MAX_CONCURRENCY, SCRAPE_CONTENT_CACHE_ENABLED, UPLOAD_MAX_BYTES, UPLOAD_FORM_OVERHEAD_BYTES,
+    DOCUMENT_MAX_TOKENS, OPENAI_TOKENS_PER_MINUTE, SERVER_WORKERS, METRICS_ENABLED, TRACING_ENABLED, TRACE_LOG_FILE,
+    METRICS_MULTIPROCESS_DIR, METRICS_SYNC_INTERVAL, LANGUAGE_DETECTION_MAX_BLOCKS,
+    JOBS_ENABLED, JOBS_DIR, JOBS_DB_PATH, JOB_MAX_CONCURRENCY, JOB_MAX_QUEUED, JOB_MAX_ATTEMPTS,
+    JOB_HEARTBEAT_INTERVAL, JOB_RESULT_TTL, JOB_CALLBACK_TIMEOUT,
+    WARMUP_ENABLED, WARMUP_CONNECT_UPSTREAM, WARMUP_TIMEOUT
+)
 
 # API 응답 모델 정의
 class SummaryResponse(BaseModel):
@@ -27,15 +51,50 @@ class SummaryResponse(BaseModel):
 class KeywordsResponse(BaseModel):
     keywords: List[str]
 
+class AnalysisResponse(BaseModel):
+    summary: str
+    keywords: List[str]
+    detected_language: Optional[str] = None
+    detected_language_name: Optional[str] = None
+
 class LanguageResponse(BaseModel):
     language: str
     language_name: str
 
+class LanguageBatchResponse(BaseModel):
+    results: List[LanguageResponse]
+
+class BatchSummaryResult(BaseModel):
+    index: int
+    summary: Optional[str] = None
+    detected_language: Optional[str] = None
+    detected_language_name: Optional[str] = None
+    error: Optional[str] = None
+
+class BatchSummaryResponse(BaseModel):
+    results: List[BatchSummaryResult]
+
 class WebContentResponse(BaseModel):
     title: str
     content: str
     url: str
 
+class JobSubmitResponse(BaseModel):
+    job_id: str
+    status: str
+    status_url: str
+
+class JobResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: str
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    attempts: int
+    result: Optional[dict] = None
+    error: Optional[str] = None
+
 class ErrorResponse(BaseModel):
     error: str
 
@@ -49,21 +108,46 @@ class SummarizeUrlRequest(BaseModel):
     length: str = "medium"
     format: str = "paragraph"
     language: str = "auto"
+    chunked: bool = False
 
 class SummarizeTextRequest(BaseModel):
     text: str
     length: str = "medium"
     format: str = "paragraph"
     language: str = "auto"
+    chunked: bool = False
+
+class BatchSummaryItem(BaseModel):
+    text: Optional[str] = None
+    url: Optional[str] = None
+    length: str = "medium"
+    format: str = "paragraph"
+    language: str = "auto"
+    chunked: bool = False
+
+class SummarizeBatchRequest(BaseModel):
+    items: List[BatchSummaryItem]
+    concurrency: Optional[int] = None
+    stream: bool = False
 
 class KeywordsRequest(BaseModel):
     text: str
     count: int = 10
     language: str = "auto"
 
+class AnalyzeTextRequest(BaseModel):
+    text: str
+    length: str = "medium"
+    format: str = "paragraph"
+    language: str = "auto"
+    keyword_count: int = 10
+
 class LanguageDetectionRequest(BaseModel):
     text: str
 
+class LanguageBatchDetectionRequest(BaseModel):
+    texts: List[str]
+
 # FastAPI 앱 초기화
 app = FastAPI(
     title="Contents Lenz API",
@@ -80,13 +164,281 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 파일 업로드 요청은 본문을 모두 받기 전에 크기 제한 적용 (app.py도 같은 경로 목록 사용)
+UPLOAD_LIMITED_PATHS = ["/summarize/file", "/summarize/file/stream", "/jobs/summarize/file"]
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_bytes=UPLOAD_MAX_BYTES + UPLOAD_FORM_OVERHEAD_BYTES,
+    paths=UPLOAD_LIMITED_PATHS
+)
+
+# 요청 수와 처리 시간 기록 (업로드 크기 초과로 거절된 요청도 기록하도록 크기 제한 미들웨어를 감싸게 추가)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# 단계별 소요 시간을 Server-Timing 헤더와 추적 로그로 전달
+if TRACING_ENABLED:
+    app.add_middleware(TracingMiddleware, log_path=TRACE_LOG_FILE)
+
 # OpenAI 클라이언트 초기화
 openai_client = None
 try:
-    openai_client = OpenAIClient()
+    # 워커 프로세스마다 토큰 버킷이 따로 있으므로 전체 한도를 워커 수로 나눠 적용
+    openai_client = AsyncOpenAIClient(tokens_per_minute=OPENAI_TOKENS_PER_MINUTE // SERVER_WORKERS)
 except ValueError as e:
     print(f"OpenAI API 초기화 오류: {str(e)}")
 
+# 웹 페이지 스크래핑용 공유 HTTP 페처
+http_fetcher = HttpFetcher()
+
+# 같은 URL에 대한 동시 스크래핑 요청을 하나로 합침
+scrape_flights = SingleFlight("scrape")
+
+# 워밍업 진행 상태 (/ready 응답)
+readiness = {"ready": False, "warmup_seconds": None, "upstream": None}
+warmup_task = None
+metrics_sync_task = None
+
+def preload_dependencies():
+    """첫 요청에서 가져올 무거운 모듈과 공유 객체를 미리 준비 (스레드 풀에서 실행)"""
+    preload_parsers()
+    parse_html("<html><head><title>warm up</title></head><body><p>warm up</p></body></html>").text()
+    estimate_tokens("warm up")
+    get_language_detector()
+
+async def warm_up():
+    """무거운 모듈을 가져오고 OpenAI 클라이언트와 커넥션 풀을 준비한 뒤 준비 완료로 표시"""
+    start = time.perf_counter()
+    try:
+        await run_in_threadpool(preload_dependencies)
+        if openai_client:
+            connected = await openai_client.warm_up(connect=WARMUP_CONNECT_UPSTREAM, timeout=WARMUP_TIMEOUT)
+            readiness["upstream"] = ("ok" if connected else "error") if WARMUP_CONNECT_UPSTREAM else "skipped"
+    except Exception as e:
+        # 워밍업은 최적화일 뿐이므로 실패해도 요청은 받음 (필요한 모듈은 첫 사용 시 다시 가져옴)
+        print(f"워밍업 중 오류가 발생했습니다: {str(e)}")
+    readiness["warmup_seconds"] = round(time.perf_counter() - start, 3)
+    readiness["ready"] = True
+    print(f"워밍업 완료 ({readiness['warmup_seconds']}초)")
+
+async def sync_metrics():
+    """다른 워커가 /metrics 요청을 받아도 이 프로세스의 값이 포함되도록 지표 값을 주기적으로 저장"""
+    while True:
+        try:
+            await run_in_threadpool(REGISTRY.write_snapshot)
+        except OSError as e:
+            print(f"지표 파일 저장 중 오류가 발생했습니다: {str(e)}")
+        await asyncio.sleep(METRICS_SYNC_INTERVAL)
+
+@app.on_event("startup")
+async def startup():
+    """서버 시작 시 작업 워커와 워밍업 시작 (이전 실행에서 남은 대기 작업도 이어서 처리)
+    
+    워밍업은 백그라운드에서 진행하므로 서버는 바로 요청을 받고, 끝나면 /ready가 200을 응답합니다.
+    """
+    global warmup_task, metrics_sync_task
+    if job_queue:
+        job_queue.start()
+    if WARMUP_ENABLED:
+        warmup_task = asyncio.ensure_future(warm_up())
+    else:
+        readiness["ready"] = True
+    
+    # 워커가 여러 개면 /metrics 요청을 받은 워커가 모든 워커의 지표를 합쳐 응답
+    if METRICS_ENABLED and SERVER_WORKERS > 1:
+        REGISTRY.enable_multiprocess(METRICS_MULTIPROCESS_DIR, stale_after=METRICS_SYNC_INTERVAL * 3)
+        metrics_sync_task = asyncio.ensure_future(sync_metrics())
+
+@app.on_event("shutdown")
+async def shutdown():
+    """서버 종료 시 작업 워커와 커넥션 풀 정리"""
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    if metrics_sync_task:
+        metrics_sync_task.cancel()
+        # 종료된 워커의 누적 지표도 합계에 남도록 마지막 값 저장
+        try:
+            await run_in_threadpool(REGISTRY.write_snapshot)
+        except OSError:
+            pass
+    if job_queue:
+        await job_queue.stop()
+    if openai_client:
+        await openai_client.close()
+    await http_fetcher.close()
+
+async def detect_language_safely(text):
+    """언어 감지 (오류 발생 시 None 반환)"""
+    try:
+        return await openai_client.detect_language(text)
+    except Exception as e:
+        print(f"언어 감지 중 오류가 발생했습니다: {str(e)}")
+        return None
+
+async def summarize_with_detection(text, length, format, language, chunked=False, raise_errors=False):
+    """텍스트 요약 및 언어 감지 후 응답 구성
+    
+    자동 언어 모드에서는 언어 감지와 요약이 서로 독립적이므로 두 요청을 동시에 보냅니다.
+    chunked가 True이면 긴 문서를 분할하여 요약합니다(map-reduce).
+    raise_errors가 True이면 요약 실패를 오류 문자열 대신 예외로 전달합니다.
+    """
+    if raise_errors:
+        summarize = openai_client.summarize_or_raise(text, length, format, language, chunked)
+    elif chunked:
+        summarize = openai_client.summarize_chunked(text, length, format, language)
+    else:
+        summarize = openai_client.summarize_text(text, length, format, language)
+    
+    detected_language = None
+    if language == 'auto':
+        detected_language, summary = await asyncio.gather(detect_language_safely(text), summarize)
+    else:
+        summary = await summarize
+    
+    return build_summary_response(summary, detected_language)
+
+async def summarize_upload_in_blocks(file, file_ext, pages, length, format, language):
+    """업로드 문서를 블록 단위로 추출하면서 분할 요약
+    
+    앞쪽 블록(PDF 앞 페이지 등)이 추출되면 바로 언어 감지와 부분 요약을 시작하므로,
+    긴 문서도 전체 추출이 끝날 때까지 기다리지 않고 메모리에는 진행 중인 블록만 유지합니다.
+    자동 언어 모드에서는 표지처럼 첫 블록만으로 결과가 달라지지 않도록 앞쪽 블록을
+    최대 LANGUAGE_DETECTION_MAX_BLOCKS개까지 모아 감지합니다.
+    """
+    try:
+        check_upload_size(file)
+        blocks = FileHandler.iter_stream(file.file, file_ext, pages=pages, max_tokens=DOCUMENT_MAX_TOKENS or None)
+        head_count = max(1, LANGUAGE_DETECTION_MAX_BLOCKS) if language == 'auto' else 1
+        try:
+            head = await run_in_threadpool(lambda: list(itertools.islice(blocks, head_count)))
+        except PageRangeError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if not head:
+            raise HTTPException(status_code=400, detail="파일에 텍스트 내용이 없습니다.")
+        
+        summarize = openai_client.summarize_blocks(itertools.chain(head, blocks), length, format, language)
+        
+        # 감지 샘플은 모은 블록 전체에서 고르게 추출됨 (detect_language의 sample_text)
+        detected_language = None
+        if language == 'auto':
+            detected_language, summary = await asyncio.gather(detect_language_safely("\n\n".join(head)), summarize)
+        else:
+            summary = await summarize
+    finally:
+        await file.close()
+    
+    return build_summary_response(summary, detected_language)
+
+def build_summary_response(summary, detected_language=None):
+    """요약 API 응답 구성"""
+    response = {
+        "summary": summary
+    }
+    
+    if detected_language:
+        response["detected_language"] = detected_language
+        response["detected_language_name"] = SUPPORTED_LANGUAGES.get(detected_language, detected_language)
+    
+    return response
+
+def format_sse(event, data):
+    """SSE(Server-Sent Events) 이벤트 문자열 구성"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def stream_summary_response(text, length, format, language, chunked=False):
+    """요약을 생성되는 대로 SSE로 전달하는 응답 생성
+    
+    요약 조각마다 summary 이벤트({"delta": ...})를 보내고, 마지막에 전체 요약과
+    감지된 언어, 토큰 사용량을 담은 done 이벤트를 보냅니다.
+    오류가 발생하면 error 이벤트({"detail": ...})로 전달합니다.
+    """
+    async def events():
+        # 자동 언어 모드에서는 요약을 스트리밍하는 동안 언어 감지를 함께 진행
+        detection = asyncio.ensure_future(detect_language_safely(text)) if language == 'auto' else None
+        try:
+            result = None
+            async for kind, data in openai_client.stream_summary(text, length, format, language, chunked):
+                if kind == "delta":
+                    yield format_sse("summary", {"delta": data})
+                else:
+                    result = data
+            
+            if detection:
+                detected_language = await detection
+                if detected_language:
+                    result["detected_language"] = detected_language
+                    result["detected_language_name"] = SUPPORTED_LANGUAGES.get(detected_language, detected_language)
+            
+            yield format_sse("done", result)
+        
+        except Exception as e:
+            yield format_sse("error", {"detail": f"요약 중 오류가 발생했습니다: {str(e)}"})
+        
+        finally:
+            if detection and not detection.done():
+                detection.cancel()
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # 프록시가 이벤트를 모아서 보내지 않도록 캐시와 버퍼링 비활성화
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def check_upload_extension(file):
+    """업로드된 파일의 확장자 확인
+    
+    Args:
+        file (UploadFile): 업로드된 파일
+    
+    Returns:
+        str: 소문자 확장자 (예: ".pdf")
+    """
+    file_ext = os.path.splitext(file.filename)[1].lower()
+    if file_ext not in SUPPORTED_TEXT_FORMATS + SUPPORTED_DOCUMENT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 파일 형식입니다: {file_ext}")
+    return file_ext
+
+def check_upload_size(file):
+    """스풀된 업로드 파일 크기 확인 (Content-Length 없이 전송된 경우 대비)"""
+    file.file.seek(0, os.SEEK_END)
+    if file.file.tell() > UPLOAD_MAX_BYTES:
+        raise UploadTooLarge(UPLOAD_MAX_BYTES)
+
+async def read_upload_text(file, file_ext, pages=None):
+    """업로드된 파일에서 텍스트 추출
+    
+    업로드 내용은 Starlette가 청크 단위로 받아 임시 파일에 스풀하므로,
+    전체를 메모리로 읽거나 디스크에 다시 복사하지 않고 스풀된 스트림에서 바로 파싱합니다.
+    
+    Args:
+        file (UploadFile): 업로드된 파일
+        file_ext (str): 파일 확장자
+        pages (str): PDF에서 추출할 페이지 범위 (예: "1-5,8", None이면 전체)
+    
+    Returns:
+        str: 파일 텍스트
+    """
+    try:
+        check_upload_size(file)
+        
+        # PDF/Word 파싱은 CPU를 사용하므로 스레드 풀에서 실행
+        with DOCUMENT_EXTRACT_DURATION.labels(file_ext).time():
+            text = await run_in_threadpool(
+                FileHandler.read_stream, file.file, file_ext,
+                pages=pages, max_tokens=DOCUMENT_MAX_TOKENS or None
+            )
+    except PageRangeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        # 파싱에 실패해도 스풀 파일 정리
+        await file.close()
+    
+    if not text.strip():
+        raise HTTPException(status_code=400, detail="파일에 텍스트 내용이 없습니다.")
+    
+    return text
+
 @app.get("/api")
 async def root():
     """API 루트 경로"""
@@ -97,6 +449,224 @@ async def root():
         "redoc_url": "/redoc"
     }
 
+@app.get("/ready")
+async def ready():
+    """준비 상태 확인 API (로드 밸런서용, 워밍업이 끝나기 전에는 503 응답)"""
+    if not readiness["ready"]:
+        return JSONResponse(status_code=503, content=readiness)
+    return readiness
+
+@app.get("/stats")
+async def stats():
+    """캐시, 토큰 사용량, 요청 합치기 통계 조회 API"""
+    return {
+        "summary_cache": openai_client.cache.stats() if openai_client and openai_client.cache else None,
+        "token_usage": openai_client.usage.stats() if openai_client else None,
+        "rate_limiter": openai_client.rate_limiter.stats() if openai_client and openai_client.rate_limiter else None,
+        "page_cache": http_fetcher.stats(),
+        "extraction_cache": extraction_cache.stats() if extraction_cache else None,
+        "single_flight": {
+            "openai": openai_client.flights.stats() if openai_client else None,
+            "scrape": scrape_flights.stats()
+        },
+        "text_pipelines": {
+            "web_content": WEB_CONTENT_PIPELINE.stats(),
+            "document": DOCUMENT_PIPELINE.stats()
+        },
+        "job_queue": await run_in_threadpool(job_queue.stats) if job_queue else None
+    }
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 형식 지표 조회 API"""
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="지표 수집이 비활성화되어 있습니다.")
+    # 수집 함수가 캐시와 작업 데이터베이스를 조회하고 다른 워커의 지표 파일도 읽으므로 스레드 풀에서 실행
+    return Response(await run_in_threadpool(REGISTRY.render), media_type=METRICS_CONTENT_TYPE)
+
+def collect_component_metrics():
+    """캐시, 요청 합치기, 토큰 한도, 텍스트 정리 파이프라인 통계를 지표로 변환 (/metrics 요청마다 호출)"""
+    cache_hits = Counter("contents_lenz_cache_hits_total", "캐시 적중 횟수", ("cache", "tier"))
+    cache_misses = Counter("contents_lenz_cache_misses_total", "캐시 실패 횟수", ("cache",))
+    cache_evictions = Counter("contents_lenz_cache_evictions_total", "메모리 계층에서 밀려난 캐시 항목 수", ("cache",))
+    cache_entries = Gauge("contents_lenz_cache_entries", "메모리 계층 캐시 항목 수", ("cache",))
+    # 디스크 계층은 워커끼리 공유하므로 워커 값을 더하지 않음
+    cache_bytes = Gauge(
+        "contents_lenz_cache_bytes", "캐시 계층별 사용량 (바이트)", ("cache", "tier"),
+        aggregate=lambda cache, tier: "max" if tier == "disk" else "sum"
+    )
+    
+    caches = {
+        "summary": openai_client.cache if openai_client else None,
+        "extraction": extraction_cache,
+        "page": http_fetcher.cache
+    }
+    for name, cache in caches.items():
+        if cache is None:
+            continue
+        cache_stats = cache.stats()
+        cache_hits.labels(name, "memory").inc(cache_stats["memory_hits"])
+        cache_hits.labels(name, "disk").inc(cache_stats["disk_hits"])
+        cache_misses.labels(name).inc(cache_stats["misses"])
+        cache_evictions.labels(name).inc(cache_stats["evictions"])
+        cache_entries.labels(name).set(cache_stats["memory_entries"])
+        cache_bytes.labels(name, "memory").set(cache_stats["memory_bytes"])
+        cache_bytes.labels(name, "disk").set(cache_stats["disk_bytes"])
+    
+    coalesced = Counter("contents_lenz_single_flight_coalesced_total", "진행 중인 같은 작업에 합쳐진 호출 수", ("name",))
+    flights_in_progress = Gauge("contents_lenz_single_flight_in_flight", "진행 중인 합치기 대상 작업 수", ("name",))
+    for flights in ([openai_client.flights] if openai_client else []) + [scrape_flights]:
+        flight_stats = flights.stats()
+        coalesced.labels(flight_stats["name"]).inc(flight_stats["coalesced"])
+        flights_in_progress.labels(flight_stats["name"]).set(flight_stats["in_flight"])
+    
+    pipeline_calls = Counter("contents_lenz_text_pipeline_stage_calls_total", "텍스트 정리 단계 실행 횟수", ("pipeline", "stage"))
+    pipeline_seconds = Counter("contents_lenz_text_pipeline_stage_seconds_total", "텍스트 정리 단계 누적 실행 시간", ("pipeline", "stage"))
+    for pipeline in (WEB_CONTENT_PIPELINE, DOCUMENT_PIPELINE):
+        for stage, stage_stats in pipeline.stats().items():
+            pipeline_calls.labels(pipeline.name, stage).inc(stage_stats["calls"])
+            pipeline_seconds.labels(pipeline.name, stage).inc(stage_stats["total_ms"] / 1000)
+    
+    collected = [
+        cache_hits, cache_misses, cache_evictions, cache_entries, cache_bytes,
+        coalesced, flights_in_progress, pipeline_calls, pipeline_seconds
+    ]
+    
+    if openai_client and openai_client.rate_limiter:
+        limiter_stats = openai_client.rate_limiter.stats()
+        rate_limit_waits = Counter("contents_lenz_rate_limit_waits_total", "분당 토큰 한도 때문에 대기한 횟수")
+        rate_limit_wait_seconds = Counter("contents_lenz_rate_limit_wait_seconds_total", "분당 토큰 한도 때문에 대기한 누적 시간")
+        rate_limit_waits.inc(limiter_stats["waits"])
+        rate_limit_wait_seconds.inc(limiter_stats["wait_seconds"])
+        collected.extend([rate_limit_waits, rate_limit_wait_seconds])
+    
+    if job_queue:
+        queue_stats = job_queue.stats()
+        jobs = Gauge("contents_lenz_jobs", "상태별 비동기 작업 수 (모든 프로세스 합계)", ("status",), aggregate="max")
+        for status in ("queued", "running", "succeeded", "failed", "canceled"):
+            jobs.labels(status).set(queue_stats["jobs"].get(status, 0))
+        jobs_running = Gauge("contents_lenz_jobs_running", "이 프로세스에서 처리 중인 비동기 작업 수")
+        jobs_running.set(queue_stats["running"])
+        job_callback_failures = Counter("contents_lenz_job_callback_failures_total", "전송에 실패한 작업 완료 콜백 수")
+        job_callback_failures.inc(queue_stats["callbacks_failed"])
+        collected.extend([jobs, jobs_running, job_callback_failures])
+    
+    return collected
+
+REGISTRY.register_collector(collect_component_metrics)
+
+def parse_web_page(html):
+    """HTML을 파싱해 제목과 스크립트, 스타일을 제거한 전체 텍스트 추출 (스레드 풀에서 실행)
+    
+    Returns:
+        tuple: (파싱된 문서, 제목, 전체 텍스트)
+    """
+    with PARSE_DURATION.labels("parse").time(), span("html.parse"):
+        document = parse_html(html)
+    
+    title = document.title()
+    
+    with PARSE_DURATION.labels("text").time(), span("html.text"):
+        all_text = document.text()
+    return document, title, all_text
+
+def extract_main_content(document):
+    """광고, 메뉴 등 불필요한 요소를 제거한 본문을 추출해 정리 (스레드 풀에서 실행)"""
+    with PARSE_DURATION.labels("content").time(), span("html.content"):
+        content = document.content()
+    
+    # 콘텐츠 정리 (중복 줄바꿈, 저작권 문구, 중복 문단 제거)
+    with PARSE_DURATION.labels("cleanup").time(), span("html.cleanup"):
+        return WEB_CONTENT_PIPELINE.run(content)
+
+async def extract_web_content(html, url, use_ai_filter):
+    """HTML에서 제목과 본문 추출
+    
+    파싱과 본문 추출은 CPU를 오래 쓰므로 스레드 풀에서 실행해 다른 요청을 막지 않습니다.
+    
+    Args:
+        html (str): 웹 페이지 HTML
+        url (str): 웹 페이지 URL
+        use_ai_filter (bool): OpenAI로 주요 내용만 필터링할지 여부
+    
+    Returns:
+        dict: title, content, url 키를 가진 웹 콘텐츠
+    """
+    document, title, all_text = await run_in_threadpool(parse_web_page, html)
+    
+    # OpenAI API를 사용하여 주요 내용 필터링 (use_ai_filter가 True이고 openai_client가 있는 경우)
+    if use_ai_filter and openai_client:
+        try:
+            filtered_content = await openai_client.filter_web_content(all_text, title, url)
+            return {
+                "title": title,
+                "content": filtered_content,
+                "url": url
+            }
+        except Exception as e:
+            print(f"AI 필터링 중 오류 발생: {str(e)}")
+            # AI 필터링 실패 시 기존 방식으로 대체
+            pass
+    
+    # AI 필터링을 사용하지 않거나 실패한 경우 기존 방식으로 처리
+    # 광고, 메뉴 등 불필요한 요소를 제거하고 메타 설명과 주요 콘텐츠 영역의 본문 추출
+    content = await run_in_threadpool(extract_main_content, document)
+    
+    if not content:
+        raise HTTPException(status_code=400, detail="웹 페이지에서 콘텐츠를 추출할 수 없습니다.")
+    
+    return {
+        "title": title,
+        "content": content,
+        "url": url
+    }
+
+async def scrape_web_content(url, use_ai_filter):
+    """웹 페이지를 가져와 제목과 본문 추출
+    
+    Args:
+        url (str): 스크래핑할 URL
+        use_ai_filter (bool): OpenAI로 주요 내용만 필터링할지 여부
+    
+    Returns:
+        dict: title, content, url 키를 가진 웹 콘텐츠
+    """
+    import httpx
+    
+    try:
+        # 웹 페이지 가져오기 (공유 커넥션 풀과 페이지 캐시 사용)
+        start = time.perf_counter()
+        try:
+            with span("fetch"):
+                page = await http_fetcher.fetch_page(url)
+        except Exception:
+            SCRAPE_DURATION.labels("error").observe(time.perf_counter() - start)
+            raise
+        SCRAPE_DURATION.labels(page.status).observe(time.perf_counter() - start)
+        
+        # 페이지 본문이 바뀌지 않았으면 이전에 추출한 결과를 재사용
+        content_key = None
+        if SCRAPE_CONTENT_CACHE_ENABLED and http_fetcher.cache is not None:
+            filtered = bool(use_ai_filter and openai_client)
+            content_key = make_cache_key(
+                "web_content", page.digest, canonicalize_url(url), filtered,
+                openai_client.model if filtered else None
+            )
+            cached = await http_fetcher.cache.get_async(content_key)
+            if cached is not None:
+                return dict(cached, url=url)
+        
+        web_content = await extract_web_content(page.text, url, use_ai_filter)
+        
+        if content_key is not None:
+            await http_fetcher.cache.set_async(content_key, web_content)
+        return web_content
+    
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=400, detail=f"웹 페이지 접근 중 오류가 발생했습니다: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"웹 스크래핑 중 오류가 발생했습니다: {str(e)}")
+
 @app.post("/scrape-url", response_model=WebContentResponse)
 async def scrape_url(
     request: ScrapeUrlRequest = None,
@@ -125,142 +695,13 @@ async def scrape_url(
         url = 'https://' + url
         print(f"URL 형식 수정: {url}")
     
-    try:
-        # 웹 페이지 가져오기
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()  # 오류 발생 시 예외 발생
-        
-        # HTML 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 제목 추출
-        title = soup.title.string if soup.title else "제목 없음"
-        
-        # 기본적인 불필요 요소 제거 (스크립트, 스타일 등)
-        for element in soup.find_all(['script', 'style']):
-            element.decompose()
-        
-        # 전체 텍스트 추출
-        all_text = soup.get_text(separator='\n', strip=True)
-        
-        # OpenAI API를 사용하여 주요 내용 필터링 (use_ai_filter가 True이고 openai_client가 있는 경우)
-        if use_ai_filter and openai_client:
-            try:
-                filtered_content = openai_client.filter_web_content(all_text, title, url)
-                return {
-                    "title": title,
-                    "content": filtered_content,
-                    "url": url
-                }
-            except Exception as e:
-                print(f"AI 필터링 중 오류 발생: {str(e)}")
-                # AI 필터링 실패 시 기존 방식으로 대체
-                pass
-        
-        # AI 필터링을 사용하지 않거나 실패한 경우 기존 방식으로 처리
-        # 불필요한 요소 제거
-        for element in soup.find_all(['script', 'style', 'nav', 'footer', 'iframe', 'aside']):
-            element.decompose()
-            
-        # 광고, 사이드바, 관련 기사 등을 포함할 가능성이 높은 요소 제거
-        ad_classes = ['ad', 'ads', 'advertisement', 'banner', 'sidebar', 'related', 'footer', 'menu', 'nav', 'share', 'social', 'comment', 'copyright']
-        for class_name in ad_classes:
-            for element in soup.find_all(class_=lambda x: x and any(ad in x.lower() for ad in [class_name])):
-                element.decompose()
-                
-        # 광고, 사이드바, 관련 기사 등을 포함할 가능성이 높은 ID 제거
-        ad_ids = ['ad', 'ads', 'advertisement', 'banner', 'sidebar', 'related', 'footer', 'menu', 'nav', 'share', 'social', 'comment', 'copyright']
-        for id_name in ad_ids:
-            for element in soup.find_all(id=lambda x: x and any(ad in x.lower() for ad in [id_name])):
-                element.decompose()
-        
-        # 본문 추출 (메타 설명, 주요 텍스트 블록)
-        content = ""
-        
-        # 메타 설명 추가
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            content += meta_desc.get('content') + "\n\n"
-        
-        # 주요 콘텐츠 추출 시도 (article, main, section 등 주요 콘텐츠 영역)
-        main_content = None
-        for container in ['article', 'main', '.article', '.content', '.post', '.entry', '#article', '#content', '#main']:
-            if container.startswith('.') or container.startswith('#'):
-                selector_type = 'class' if container.startswith('.') else 'id'
-                selector_value = container[1:]
-                if selector_type == 'class':
-                    main_content = soup.find(class_=selector_value)
-                else:
-                    main_content = soup.find(id=selector_value)
-            else:
-                main_content = soup.find(container)
-                
-            if main_content:
-                break
-        
-        # 주요 콘텐츠 영역이 발견된 경우
-        if main_content:
-            # 주요 콘텐츠 내에서 텍스트 추출
-            for tag in main_content.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                text = tag.get_text(strip=True)
-                if text and len(text) > 20:  # 짧은 텍스트는 건너뜀
-                    content += text + "\n\n"
-        else:
-            # 주요 콘텐츠 영역을 찾지 못한 경우 일반적인 방법으로 추출
-            for tag in soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                text = tag.get_text(strip=True)
-                if text and len(text) > 20:  # 짧은 텍스트는 건너뜀
-                    content += text + "\n\n"
-        
-        # 콘텐츠 정리 (중복 줄바꿈 제거 등)
-        content = re.sub(r'\n{3,}', '\n\n', content).strip()
-        
-        # 불필요한 문자열 패턴 제거 (저작권 정보, 광고 문구 등)
-        patterns_to_remove = [
-            r'ⓒ.*All Rights Reserved',
-            r'무단 전재 및 재배포 금지',
-            r'Copyright ©.*',
-            r'관련기사',
-            r'관련 기사',
-            r'관련 뉴스',
-            r'.*\[.*\]$',  # [카메라 워크 K]와 같은 패턴
-            r'^외눈박이의.*',  # "외눈박이의 누드 사진"과 같은 패턴
-            r'^family site.*',
-            r'^문화·교육.*',
-        ]
-        
-        for pattern in patterns_to_remove:
-            content = re.sub(pattern, '', content, flags=re.MULTILINE)
-        
-        # 여러 줄 공백 정리
-        content = re.sub(r'\n\s*\n', '\n\n', content)
-        
-        # 중복 문단 제거
-        lines = content.split('\n\n')
-        unique_lines = []
-        for line in lines:
-            line = line.strip()
-            if line and line not in unique_lines:
-                unique_lines.append(line)
-        
-        content = '\n\n'.join(unique_lines)
-        
-        if not content:
-            raise HTTPException(status_code=400, detail="웹 페이지에서 콘텐츠를 추출할 수 없습니다.")
-        
-        return {
-            "title": title,
-            "content": content,
-            "url": url
-        }
-    
-    except requests.exceptions.RequestException as e:
-        raise HTTPException(status_code=400, detail=f"웹 페이지 접근 중 오류가 발생했습니다: {str(e)}")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"웹 스크래핑 중 오류가 발생했습니다: {str(e)}")
+    # 같은 URL을 동시에 요청하면 스크래핑과 필터링을 한 번만 수행
+    return await scrape_flights.do((url, use_ai_filter), lambda: scrape_web_content(url, use_ai_filter))
+
+async def fetch_url_text(url):
+    """URL을 스크래핑해 요약에 넣을 텍스트 구성 (제목 포함)"""
+    web_content = await scrape_url(url=url, use_ai_filter=True)
+    return f"제목: {web_content['title']}\n\n{web_content['content']}"
 
 @app.post("/summarize/url", response_model=SummaryResponse)
 async def summarize_url(
@@ -268,11 +709,12 @@ async def summarize_url(
     url: str = Form(None),
     length: str = Form("medium"),
     format: str = Form("paragraph"),
-    language: str = Form("auto")
+    language: str = Form("auto"),
+    chunked: bool = Form(False)
 ):
     """URL 콘텐츠 요약 API"""
     # 디버깅 로그 추가
-    print(f"요약 요청 받음: request={request}, url={url}, length={length}, format={format}, language={language}")
+    print(f"요약 요청 받음: request={request}, url={url}, length={length}, format={format}, language={language}, chunked={chunked}")
     
     if not openai_client:
         raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
@@ -283,7 +725,8 @@ async def summarize_url(
         length = request.length
         format = request.format
         language = request.language
-        print(f"JSON 요청 처리: url={url}, length={length}, format={format}, language={language}")
+        chunked = request.chunked
+        print(f"JSON 요청 처리: url={url}, length={length}, format={format}, language={language}, chunked={chunked}")
     elif url is None:
         print("URL이 제공되지 않음")
         raise HTTPException(status_code=400, detail="URL이 제공되지 않았습니다.")
@@ -294,29 +737,10 @@ async def summarize_url(
     
     try:
         # 웹 콘텐츠 스크래핑
-        web_content = await scrape_url(url=url, use_ai_filter=True)
-        text = f"제목: {web_content['title']}\n\n{web_content['content']}"
+        text = await fetch_url_text(url)
         
-        # 언어 감지 (자동 모드인 경우)
-        detected_language = None
-        if language == 'auto':
-            try:
-                detected_language = openai_client.detect_language(text)
-            except Exception as e:
-                print(f"언어 감지 중 오류가 발생했습니다: {str(e)}")
-        
-        # 텍스트 요약
-        summary = openai_client.summarize_text(text, length, format, language)
-        
-        response = {
-            "summary": summary
-        }
-        
-        if detected_language:
-            response["detected_language"] = detected_language
-            response["detected_language_name"] = SUPPORTED_LANGUAGES.get(detected_language, detected_language)
-        
-        return response
+        # 언어 감지 (자동 모드인 경우) 및 텍스트 요약
+        return await summarize_with_detection(text, length, format, language, chunked)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"URL 요약 중 오류가 발생했습니다: {str(e)}")
@@ -327,11 +751,12 @@ async def summarize_text(
     text: str = Form(None),
     length: str = Form("medium"),
     format: str = Form("paragraph"),
-    language: str = Form("auto")
+    language: str = Form("auto"),
+    chunked: bool = Form(False)
 ):
     """텍스트 요약 API"""
     # 디버깅 로그 추가
-    print(f"텍스트 요약 요청 받음: request={request}, text 길이={len(text) if text else 0}, length={length}, format={format}, language={language}")
+    print(f"텍스트 요약 요청 받음: request={request}, text 길이={len(text) if text else 0}, length={length}, format={format}, language={language}, chunked={chunked}")
     
     if not openai_client:
         raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
@@ -342,7 +767,8 @@ async def summarize_text(
         length = request.length
         format = request.format
         language = request.language
-        print(f"JSON 요청 처리: text 길이={len(text)}, length={length}, format={format}, language={language}")
+        chunked = request.chunked
+        print(f"JSON 요청 처리: text 길이={len(text)}, length={length}, format={format}, language={language}, chunked={chunked}")
     elif text is None:
         print("텍스트가 제공되지 않음")
         raise HTTPException(status_code=400, detail="텍스트가 제공되지 않았습니다.")
@@ -351,27 +777,9 @@ async def summarize_text(
         print("텍스트가 비어있음")
         raise HTTPException(status_code=400, detail="요약할 텍스트를 입력하세요.")
     
-    # 언어 감지 (자동 모드인 경우)
-    detected_language = None
-    if language == 'auto':
-        try:
-            detected_language = openai_client.detect_language(text)
-        except Exception as e:
-            print(f"언어 감지 중 오류가 발생했습니다: {str(e)}")
-    
-    # 텍스트 요약
+    # 언어 감지 (자동 모드인 경우) 및 텍스트 요약
     try:
-        summary = openai_client.summarize_text(text, length, format, language)
-        
-        response = {
-            "summary": summary
-        }
-        
-        if detected_language:
-            response["detected_language"] = detected_language
-            response["detected_language_name"] = SUPPORTED_LANGUAGES.get(detected_language, detected_language)
-        
-        return response
+        return await summarize_with_detection(text, length, format, language, chunked)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"요약 중 오류가 발생했습니다: {str(e)}")
@@ -381,59 +789,415 @@ async def summarize_file(
     file: UploadFile = File(...),
     length: str = Form("medium"),
     format: str = Form("paragraph"),
-    language: str = Form("auto")
+    language: str = Form("auto"),
+    chunked: bool = Form(False),
+    pages: str = Form(None)
 ):
     """파일 요약 API"""
     if not openai_client:
         raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
     
     # 파일 확장자 확인
-    file_ext = os.path.splitext(file.filename)[1].lower()
-    if file_ext not in SUPPORTED_TEXT_FORMATS + SUPPORTED_DOCUMENT_FORMATS:
-        raise HTTPException(status_code=400, detail=f"지원하지 않는 파일 형식입니다: {file_ext}")
+    file_ext = check_upload_extension(file)
     
     # 파일 저장 및 읽기
     try:
-        # 임시 파일로 저장
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=file_ext)
-        temp_file.close()
-        
-        contents = await file.read()
-        with open(temp_file.name, "wb") as f:
-            f.write(contents)
-        
-        # 파일 내용 읽기
-        text = FileHandler.read_file(temp_file.name)
+        # 분할 요약은 문서 추출과 겹쳐 진행
+        if chunked:
+            return await summarize_upload_in_blocks(file, file_ext, pages, length, format, language)
         
-        # 임시 파일 삭제
-        os.remove(temp_file.name)
+        text = await read_upload_text(file, file_ext, pages)
         
-        if not text.strip():
-            raise HTTPException(status_code=400, detail="파일에 텍스트 내용이 없습니다.")
+        # 언어 감지 (자동 모드인 경우) 및 텍스트 요약
+        return await summarize_with_detection(text, length, format, language, chunked)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"파일 처리 중 오류가 발생했습니다: {str(e)}")
+
+@app.post("/summarize/url/stream")
+async def summarize_url_stream(
+    request: SummarizeUrlRequest = None,
+    url: str = Form(None),
+    length: str = Form("medium"),
+    format: str = Form("paragraph"),
+    language: str = Form("auto"),
+    chunked: bool = Form(False)
+):
+    """URL 콘텐츠 요약 스트리밍 API (SSE)"""
+    if not openai_client:
+        raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
+    
+    # JSON 요청과 Form 요청 모두 처리
+    if request:
+        url = request.url
+        length = request.length
+        format = request.format
+        language = request.language
+        chunked = request.chunked
+    elif url is None:
+        raise HTTPException(status_code=400, detail="URL이 제공되지 않았습니다.")
+    
+    if not url or not url.strip():
+        raise HTTPException(status_code=400, detail="요약할 URL을 입력하세요.")
+    
+    # 웹 콘텐츠 스크래핑은 스트리밍 시작 전에 완료 (오류는 HTTP 상태 코드로 전달)
+    text = await fetch_url_text(url)
+    
+    return stream_summary_response(text, length, format, language, chunked)
+
+@app.post("/summarize/text/stream")
+async def summarize_text_stream(
+    request: SummarizeTextRequest = None,
+    text: str = Form(None),
+    length: str = Form("medium"),
+    format: str = Form("paragraph"),
+    language: str = Form("auto"),
+    chunked: bool = Form(False)
+):
+    """텍스트 요약 스트리밍 API (SSE)"""
+    if not openai_client:
+        raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
+    
+    # JSON 요청과 Form 요청 모두 처리
+    if request:
+        text = request.text
+        length = request.length
+        format = request.format
+        language = request.language
+        chunked = request.chunked
+    elif text is None:
+        raise HTTPException(status_code=400, detail="텍스트가 제공되지 않았습니다.")
+    
+    if not text or not text.strip():
+        raise HTTPException(status_code=400, detail="요약할 텍스트를 입력하세요.")
+    
+    return stream_summary_response(text, length, format, language, chunked)
+
+@app.post("/summarize/file/stream")
+async def summarize_file_stream(
+    file: UploadFile = File(...),
+    length: str = Form("medium"),
+    format: str = Form("paragraph"),
+    language: str = Form("auto"),
+    chunked: bool = Form(False),
+    pages: str = Form(None)
+):
+    """파일 요약 스트리밍 API (SSE)"""
+    if not openai_client:
+        raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
+    
+    # 파일 확장자 확인
+    file_ext = check_upload_extension(file)
+    
+    # 파일 읽기는 스트리밍 시작 전에 완료
+    try:
+        text = await read_upload_text(file, file_ext, pages)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"파일 처리 중 오류가 발생했습니다: {str(e)}")
+    
+    return stream_summary_response(text, length, format, language, chunked)
+
+async def summarize_batch_item(item):
+    """일괄 요약 항목 하나 처리 (오류는 예외 대신 error 필드로 반환)"""
+    try:
+        if item.text is not None:
+            text = item.text
+        else:
+            url = item.url.strip()
+            if not url.startswith(('http://', 'https://')):
+                url = 'https://' + url
+            text = await fetch_url_text(url)
         
-        # 언어 감지 (자동 모드인 경우)
-        detected_language = None
-        if language == 'auto':
+        # 실패한 항목을 요약과 구분할 수 있도록 오류는 error 필드로 전달
+        return await summarize_with_detection(
+            text, item.length, item.format, item.language, item.chunked, raise_errors=True
+        )
+    
+    except HTTPException as e:
+        return {"error": str(e.detail)}
+    except Exception as e:
+        return {"error": f"요약 중 오류가 발생했습니다: {str(e)}"}
+
+@app.post("/summarize/batch", response_model=BatchSummaryResponse)
+async def summarize_batch(request: SummarizeBatchRequest):
+    """여러 텍스트/URL 일괄 요약 API
+    
+    같은 입력과 옵션을 가진 항목은 한 번만 요약하고, 최대 concurrency개 항목을 동시에 처리합니다.
+    OpenAI 요청은 분당 토큰 한도(OPENAI_TOKENS_PER_MINUTE) 안에서 보내집니다.
+    stream이 True이면 항목이 끝나는 순서대로 결과를 NDJSON(한 줄에 JSON 하나)으로 전달합니다.
+    """
+    if not openai_client:
+        raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
+    
+    if not request.items:
+        raise HTTPException(status_code=400, detail="요약할 항목을 입력하세요.")
+    
+    if len(request.items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {BATCH_MAX_ITEMS}개 항목까지 요약할 수 있습니다.")
+    
+    # 같은 입력과 옵션을 가진 항목끼리 묶음
+    groups = {}
+    results = [None] * len(request.items)
+    for index, item in enumerate(request.items):
+        if item.text is not None and item.text.strip():
+            source = ("text", item.text)
+        elif item.text is None and item.url and item.url.strip():
+            source = ("url", item.url.strip())
+        else:
+            results[index] = {"index": index, "error": "요약할 텍스트 또는 URL을 입력하세요."}
+            continue
+        key = (source, item.length, item.format, item.language, item.chunked)
+        groups.setdefault(key, (item, []))[1].append(index)
+    
+    concurrency = min(request.concurrency or BATCH_MAX_CONCURRENCY, BATCH_MAX_CONCURRENCY)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def run_group(item, indices):
+        async with semaphore:
+            return indices, await summarize_batch_item(item)
+    
+    tasks = [asyncio.ensure_future(run_group(item, indices)) for item, indices in groups.values()]
+    
+    if request.stream:
+        async def events():
             try:
-                detected_language = openai_client.detect_language(text)
-            except Exception as e:
-                print(f"언어 감지 중 오류가 발생했습니다: {str(e)}")
-        
-        # 텍스트 요약
-        summary = openai_client.summarize_text(text, length, format, language)
+                for result in results:
+                    if result is not None:
+                        yield json.dumps(result, ensure_ascii=False) + "\n"
+                for task in asyncio.as_completed(tasks):
+                    indices, result = await task
+                    for index in indices:
+                        yield json.dumps(dict(result, index=index), ensure_ascii=False) + "\n"
+            finally:
+                # 클라이언트 연결이 끊기면 남은 항목 취소
+                for task in tasks:
+                    task.cancel()
         
-        response = {
-            "summary": summary
-        }
+        return StreamingResponse(events(), media_type="application/x-ndjson")
+    
+    for indices, result in await asyncio.gather(*tasks):
+        for index in indices:
+            results[index] = dict(result, index=index)
+    
+    return {"results": results}
+
+async def summarize_job_text(text, params):
+    """작업으로 받은 텍스트 요약 (요약 실패를 오류 문자열 대신 작업 실패로 기록)"""
+    if not openai_client:
+        raise JobError("OpenAI API 키가 설정되지 않았습니다.")
+    
+    summarize = openai_client.summarize_or_raise(
+        text, params["length"], params["format"], params["language"], params["chunked"]
+    )
+    detected_language = None
+    if params["language"] == 'auto':
+        detected_language, summary = await asyncio.gather(detect_language_safely(text), summarize)
+    else:
+        summary = await summarize
+    
+    return build_summary_response(summary, detected_language)
+
+async def run_text_job(job):
+    """텍스트 요약 작업 처리 (텍스트는 입력 파일로 보관)"""
+    with open(job["input_path"], 'r', encoding='utf-8') as file:
+        text = file.read()
+    return await summarize_job_text(text, job["params"])
+
+async def run_url_job(job):
+    """URL 요약 작업 처리"""
+    try:
+        text = await fetch_url_text(job["params"]["url"])
+    except HTTPException as e:
+        raise JobError(str(e.detail))
+    return await summarize_job_text(text, job["params"])
+
+async def run_file_job(job):
+    """파일 요약 작업 처리 (업로드 파일은 입력 파일로 보관)"""
+    params = job["params"]
+    try:
+        with DOCUMENT_EXTRACT_DURATION.labels(os.path.splitext(job["input_path"])[1]).time():
+            text = await run_in_threadpool(
+                FileHandler.read_file, job["input_path"],
+                pages=params["pages"], max_tokens=DOCUMENT_MAX_TOKENS or None
+            )
+    except (PageRangeError, FileNotFoundError) as e:
+        raise JobError(str(e))
+    
+    if not text.strip():
+        raise JobError("파일에 텍스트 내용이 없습니다.")
+    
+    return await summarize_job_text(text, params)
+
+# 오래 걸리는 요약을 요청과 분리해 처리하는 작업 큐 (상태와 결과는 재시작 후에도 유지)
+job_queue = None
+if JOBS_ENABLED:
+    job_queue = JobQueue(
+        JobStore(JOBS_DB_PATH),
+        {"text": run_text_job, "url": run_url_job, "file": run_file_job},
+        JOBS_DIR / "inputs",
+        concurrency=JOB_MAX_CONCURRENCY,
+        heartbeat_interval=JOB_HEARTBEAT_INTERVAL,
+        max_attempts=JOB_MAX_ATTEMPTS,
+        result_ttl=JOB_RESULT_TTL,
+        callback_timeout=JOB_CALLBACK_TIMEOUT
+    )
+
+async def check_job_submission(callback_url):
+    """작업 추가 전 공통 확인 (작업 큐 사용 여부, API 키, 대기 작업 수, 콜백 주소)"""
+    if not job_queue:
+        raise HTTPException(status_code=404, detail="비동기 작업이 비활성화되어 있습니다.")
+    
+    if not openai_client:
+        raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
+    
+    if callback_url and not callback_url.startswith(('http://', 'https://')):
+        raise HTTPException(status_code=400, detail="콜백 주소는 http:// 또는 https://로 시작해야 합니다.")
+    
+    if JOB_MAX_QUEUED and await job_queue.pending_count() >= JOB_MAX_QUEUED:
+        raise HTTPException(
+            status_code=503,
+            detail="대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도하세요.",
+            headers={"Retry-After": "30"}
+        )
+
+def job_accepted_response(job):
+    """작업 추가 응답 (202 Accepted, 상태 조회 주소는 Location 헤더로도 전달)"""
+    status_url = f"/jobs/{job['id']}"
+    return JSONResponse(
+        status_code=202,
+        content={"job_id": job["id"], "status": job["status"], "status_url": status_url},
+        headers={"Location": status_url}
+    )
+
+def write_job_text(path, text):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(text)
+
+@app.post("/jobs/summarize/text", response_model=JobSubmitResponse, status_code=202)
+async def submit_text_job(
+    text: str = Form(...),
+    length: str = Form("medium"),
+    format: str = Form("paragraph"),
+    language: str = Form("auto"),
+    chunked: bool = Form(False),
+    callback_url: str = Form(None)
+):
+    """텍스트 요약 작업 추가 API (작업 ID를 바로 반환하고 요약은 백그라운드에서 진행)"""
+    await check_job_submission(callback_url)
+    
+    if not text.strip():
+        raise HTTPException(status_code=400, detail="요약할 텍스트를 입력하세요.")
+    
+    job_id = job_queue.new_job_id()
+    input_path = job_queue.new_input_path(job_id, ".txt")
+    await run_in_threadpool(write_job_text, input_path, text)
+    
+    params = {"length": length, "format": format, "language": language, "chunked": chunked}
+    job = await job_queue.submit("text", params, job_id=job_id, input_path=input_path, callback_url=callback_url)
+    return job_accepted_response(job)
+
+@app.post("/jobs/summarize/url", response_model=JobSubmitResponse, status_code=202)
+async def submit_url_job(
+    url: str = Form(...),
+    length: str = Form("medium"),
+    format: str = Form("paragraph"),
+    language: str = Form("auto"),
+    chunked: bool = Form(False),
+    callback_url: str = Form(None)
+):
+    """URL 요약 작업 추가 API"""
+    await check_job_submission(callback_url)
+    
+    url = url.strip()
+    if not url:
+        raise HTTPException(status_code=400, detail="요약할 URL을 입력하세요.")
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    
+    params = {"url": url, "length": length, "format": format, "language": language, "chunked": chunked}
+    job = await job_queue.submit("url", params, callback_url=callback_url)
+    return job_accepted_response(job)
+
+@app.post("/jobs/summarize/file", response_model=JobSubmitResponse, status_code=202)
+async def submit_file_job(
+    file: UploadFile = File(...),
+    length: str = Form("medium"),
+    format: str = Form("paragraph"),
+    language: str = Form("auto"),
+    chunked: bool = Form(False),
+    pages: str = Form(None),
+    callback_url: str = Form(None)
+):
+    """파일 요약 작업 추가 API (업로드 파일은 작업이 끝날 때까지 보관)"""
+    await check_job_submission(callback_url)
+    
+    file_ext = check_upload_extension(file)
+    # 페이지 범위 형식은 작업을 추가하기 전에 확인 (페이지 수는 작업 실행 시 반영)
+    try:
+        parse_page_range(pages, 0)
+    except PageRangeError as e:
+        await file.close()
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    job_id = job_queue.new_job_id()
+    input_path = job_queue.new_input_path(job_id, file_ext)
+    try:
+        check_upload_size(file)
+        file.file.seek(0)
         
-        if detected_language:
-            response["detected_language"] = detected_language
-            response["detected_language_name"] = SUPPORTED_LANGUAGES.get(detected_language, detected_language)
+        def save_upload():
+            try:
+                with open(input_path, 'wb') as output:
+                    shutil.copyfileobj(file.file, output, 1024 * 1024)
+            except BaseException:
+                # 일부만 저장된 입력 파일은 남기지 않음
+                input_path.unlink(missing_ok=True)
+                raise
         
-        return response
+        await run_in_threadpool(save_upload)
+    finally:
+        await file.close()
     
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"파일 처리 중 오류가 발생했습니다: {str(e)}")
+    params = {"length": length, "format": format, "language": language, "chunked": chunked, "pages": pages}
+    job = await job_queue.submit("file", params, job_id=job_id, input_path=input_path, callback_url=callback_url)
+    return job_accepted_response(job)
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """작업 상태와 결과 조회 API"""
+    if not job_queue:
+        raise HTTPException(status_code=404, detail="비동기 작업이 비활성화되어 있습니다.")
+    
+    job = await job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return public_job(job)
+
+@app.delete("/jobs/{job_id}", response_model=JobResponse)
+async def cancel_job(job_id: str):
+    """작업 취소 및 삭제 API
+    
+    대기 중인 작업은 취소하고, 완료된 작업은 결과와 함께 삭제합니다. 실행 중인 작업은 취소할 수 없습니다.
+    """
+    if not job_queue:
+        raise HTTPException(status_code=404, detail="비동기 작업이 비활성화되어 있습니다.")
+    
+    job = await job_queue.cancel(job_id)
+    if job:
+        return public_job(job)
+    
+    job = await job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    if job["status"] == "running":
+        raise HTTPException(status_code=409, detail="실행 중인 작업은 취소할 수 없습니다.")
+    
+    await job_queue.delete(job_id)
+    return public_job(job)
 
 @app.post("/keywords/text", response_model=KeywordsResponse)
 async def extract_keywords_text(
@@ -464,12 +1228,62 @@ async def extract_keywords_text(
         raise HTTPException(status_code=400, detail="키워드를 추출할 텍스트를 입력하세요.")
     
     try:
-        keywords = openai_client.extract_keywords(text, count, language)
+        keywords = await openai_client.extract_keywords(text, count, language)
         return {"keywords": keywords}
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"키워드 추출 중 오류가 발생했습니다: {str(e)}")
 
+@app.post("/analyze/text", response_model=AnalysisResponse)
+async def analyze_text(
+    request: AnalyzeTextRequest = None,
+    text: str = Form(None),
+    length: str = Form("medium"),
+    format: str = Form("paragraph"),
+    language: str = Form("auto"),
+    keyword_count: int = Form(10)
+):
+    """텍스트 통합 분석 API (요약, 키워드, 언어 감지를 한 번의 모델 호출로 처리)"""
+    # 디버깅 로그 추가
+    print(f"통합 분석 요청 받음: request={request}, text 길이={len(text) if text else 0}, length={length}, format={format}, language={language}, keyword_count={keyword_count}")
+    
+    if not openai_client:
+        raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
+    
+    # JSON 요청과 Form 요청 모두 처리
+    if request:
+        text = request.text
+        length = request.length
+        format = request.format
+        language = request.language
+        keyword_count = request.keyword_count
+        print(f"JSON 요청 처리: text 길이={len(text)}, length={length}, format={format}, language={language}, keyword_count={keyword_count}")
+    elif text is None:
+        print("텍스트가 제공되지 않음")
+        raise HTTPException(status_code=400, detail="텍스트가 제공되지 않았습니다.")
+    
+    if not text or not text.strip():
+        print("텍스트가 비어있음")
+        raise HTTPException(status_code=400, detail="분석할 텍스트를 입력하세요.")
+    
+    try:
+        analysis = await openai_client.analyze_text(text, length, format, language, keyword_count)
+        detected_language = analysis["detected_language"]
+        
+        response = {
+            "summary": analysis["summary"],
+            "keywords": analysis["keywords"]
+        }
+        
+        if detected_language:
+            response["detected_language"] = detected_language
+            response["detected_language_name"] = SUPPORTED_LANGUAGES.get(detected_language, detected_language)
+        
+        return response
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"분석 중 오류가 발생했습니다: {str(e)}")
+
 @app.post("/detect-language", response_model=LanguageResponse)
 async def detect_language(
     request: LanguageDetectionRequest = None,
@@ -495,7 +1309,7 @@ async def detect_language(
         raise HTTPException(status_code=400, detail="언어를 감지할 텍스트를 입력하세요.")
     
     try:
-        detected_language = openai_client.detect_language(text)
+        detected_language = await openai_client.detect_language(text)
         return {
             "language": detected_language,
             "language_name": SUPPORTED_LANGUAGES.get(detected_language, detected_language)
@@ -504,6 +1318,30 @@ async def detect_language(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"언어 감지 중 오류가 발생했습니다: {str(e)}")
 
+@app.post("/detect-language/batch", response_model=LanguageBatchResponse)
+async def detect_language_batch(request: LanguageBatchDetectionRequest):
+    """여러 텍스트 언어 일괄 감지 API"""
+    if not openai_client:
+        raise HTTPException(status_code=500, detail="OpenAI API 키가 설정되지 않았습니다.")
+    
+    if not request.texts:
+        raise HTTPException(status_code=400, detail="언어를 감지할 텍스트를 입력하세요.")
+    
+    try:
+        detected_languages = await openai_client.detect_languages(request.texts)
+        return {
+            "results": [
+                {
+                    "language": detected_language,
+                    "language_name": SUPPORTED_LANGUAGES.get(detected_language, detected_language)
+                }
+                for detected_language in detected_languages
+            ]
+        }
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"언어 감지 중 오류가 발생했습니다: {str(e)}")
+
 @app.post("/download")
 async def download_summary(
     summary: str = Form(...),
@@ -534,9 +1372,29 @@ async def download_summary(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"파일 다운로드 중 오류가 발생했습니다: {str(e)}")
 
-def run_api_server(host='0.0.0.0', port=8000, reload=False):
-    """API 서버 실행"""
-    uvicorn.run("src.api_server:app", host=host, port=port, reload=reload)
+def run_api_server(host='0.0.0.0', port=8000, reload=False, workers=None):
+    """API 서버 실행
+    
+    Args:
+        host (str): 서버 호스트
+        port (int): 서버 포트
+        reload (bool): 코드 변경 시 자동 재시작 (여러 워커와 함께 사용할 수 없음)
+        workers (int): 워커 프로세스 수 (None이면 WEB_CONCURRENCY 환경 변수 값, 기본값 1)
+    """
+    import uvicorn
+    
+    workers = max(1, workers or SERVER_WORKERS)
+    if reload and workers > 1:
+        print("자동 재시작 모드에서는 워커 프로세스를 하나만 사용합니다.")
+        workers = 1
+    
+    # 워커 프로세스가 같은 워커 수로 토큰 한도와 PDF 추출 프로세스 수를 나누도록 환경 변수로 전달
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    if workers > 1:
+        print(f"워커 프로세스 {workers}개로 실행합니다.")
+        # 이전 실행의 워커 지표가 합계에 섞이지 않도록 정리
+        reset_multiprocess_dir(METRICS_MULTIPROCESS_DIR)
+    uvicorn.run("src.api_server:app", host=host, port=port, reload=reload, workers=workers)
 
 if __name__ == "__main__":
     run_api_server(reload=True) 
\ No newline at end of file
@@ -0,0 +1,242 @@
+import os
+import re
+import glob
+import json
+import time
+import asyncio
+import concurrent.futures
+from src.config import SUPPORTED_TEXT_FORMATS, SUPPORTED_DOCUMENT_FORMATS, DOCUMENT_MAX_TOKENS
+from src.utils.cache import make_cache_key
+
+# 글롭 패턴으로 취급할 문자
+_GLOB_MAGIC_PATTERN = re.compile(r'[*?\[]')
+
+# 일괄 처리 대상 파일 확장자
+SUPPORTED_BATCH_FORMATS = frozenset(SUPPORTED_TEXT_FORMATS + SUPPORTED_DOCUMENT_FORMATS)
+
+def _is_supported(path):
+    return os.path.splitext(path)[1].lower() in SUPPORTED_BATCH_FORMATS
+
+def _read_manifest(manifest_path):
+    """목록 파일에서 입력 항목 읽기
+    
+    한 줄에 파일 경로 하나를 적거나, {"path": ..., "pages": ..., "id": ...} 형식의 JSON 객체를 적습니다.
+    빈 줄과 '#'으로 시작하는 줄은 건너뛰고, 상대 경로는 목록 파일 위치 기준으로 해석합니다.
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    items = []
+    with open(manifest_path, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            if line.startswith('{'):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"목록 파일 {line_number}번째 줄을 해석할 수 없습니다: {str(e)}")
+                if not isinstance(entry, dict) or not entry.get("path"):
+                    raise ValueError(f"목록 파일 {line_number}번째 줄에 path 항목이 없습니다.")
+            else:
+                entry = {"path": line}
+            
+            path = os.path.join(base_dir, os.path.expanduser(entry["path"]))
+            items.append({
+                "id": str(entry.get("id") or entry["path"]),
+                "path": os.path.normpath(path),
+                "pages": entry.get("pages")
+            })
+    return items
+
+def collect_inputs(source, pages=None):
+    """일괄 처리할 입력 파일 목록 생성
+    
+    Args:
+        source (str): 디렉토리(하위 디렉토리 포함), 글롭 패턴("docs/**/*.pdf" 등) 또는 목록 파일 경로
+        pages (str): 목록 파일에 페이지 범위가 없는 항목에 적용할 PDF 페이지 범위
+    
+    Returns:
+        list: {"id", "path", "pages"} 항목 목록 (디렉토리와 글롭은 경로 순으로 정렬)
+    
+    Raises:
+        ValueError: 입력을 찾을 수 없거나 목록 파일 형식이 잘못된 경우
+    """
+    if os.path.isdir(source):
+        paths = []
+        for directory, _, file_names in os.walk(source):
+            paths.extend(os.path.join(directory, name) for name in file_names if _is_supported(name))
+        items = [{"id": os.path.relpath(path, source), "path": path, "pages": None} for path in sorted(paths)]
+    elif _GLOB_MAGIC_PATTERN.search(source):
+        paths = sorted(path for path in glob.glob(source, recursive=True) if os.path.isfile(path) and _is_supported(path))
+        items = [{"id": path, "path": path, "pages": None} for path in paths]
+    elif os.path.isfile(source):
+        items = _read_manifest(source)
+    else:
+        raise ValueError(f"일괄 처리 입력을 찾을 수 없습니다: {source}")
+    
+    for item in items:
+        if item["pages"] is None:
+            item["pages"] = pages
+    return items
+
+def item_key(item, length, format, language, chunked):
+    """재개할 때 완료 여부를 판단하는 항목 키
+    
+    파일 내용 대신 경로, 크기, 수정 시각으로 만들므로 키를 계산할 때 파일을 읽지 않으며,
+    파일이 바뀌거나 요약 옵션이 달라지면 다시 처리합니다.
+    
+    Returns:
+        str: 항목 키 (파일이 없으면 경로와 옵션만으로 생성)
+    """
+    try:
+        stat = os.stat(item["path"])
+        size, mtime_ns = stat.st_size, stat.st_mtime_ns
+    except OSError:
+        size, mtime_ns = None, None
+    return make_cache_key(
+        "batch", "", os.path.abspath(item["path"]), size, mtime_ns,
+        item["pages"], length, format, language, chunked
+    )
+
+def load_completed_keys(output_path):
+    """결과 파일에서 성공한 항목 키 읽기 (중단 후 재개용)
+    
+    중단 중에 잘린 마지막 줄처럼 해석할 수 없는 줄은 무시합니다.
+    
+    Returns:
+        set: status가 "ok"인 항목 키 집합
+    """
+    completed = set()
+    if not os.path.exists(output_path):
+        return completed
+    
+    with open(output_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and record.get("status") == "ok" and record.get("key"):
+                completed.add(record["key"])
+    return completed
+
+def _open_results(output_path):
+    """결과 파일을 이어 쓰기 모드로 열기 (잘린 마지막 줄이 있으면 줄바꿈을 먼저 추가)"""
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_dir, exist_ok=True)
+    
+    needs_newline = False
+    if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+        with open(output_path, 'rb') as file:
+            file.seek(-1, os.SEEK_END)
+            needs_newline = file.read(1) != b'\n'
+    
+    output_file = open(output_path, 'a', encoding='utf-8')
+    if needs_newline:
+        output_file.write('\n')
+    return output_file
+
+def _init_extract_worker():
+    """추출 프로세스 초기화 (프로세스 안에서 PDF용 프로세스 풀을 다시 만들지 않도록 설정)"""
+    import src.utils.file_handler as file_handler
+    file_handler.PDF_MAX_WORKERS = 1
+
+def _extract(path, pages):
+    """파일에서 텍스트 추출 (프로세스 풀 작업 함수)"""
+    from src.utils.file_handler import FileHandler
+    return FileHandler.read_file(path, pages=pages, max_tokens=DOCUMENT_MAX_TOKENS or None)
+
+async def run_batch(items, output_path, client, length="medium", format="paragraph", language="auto",
+                    chunked=False, workers=None, concurrency=8, resume=True):
+    """여러 파일을 추출하고 요약하여 JSONL 파일에 결과 기록
+    
+    파일 추출은 프로세스 풀에서 병렬로 진행하고, 요약은 최대 concurrency개까지 동시에 요청합니다.
+    추출이 요약보다 workers개만큼 앞서 진행되므로 요약을 기다리는 동안 다음 파일을 미리 추출하며,
+    메모리에는 진행 중인 항목의 텍스트만 유지합니다.
+    결과는 항목이 끝날 때마다 한 줄씩 기록하므로, 중단 후 다시 실행하면 성공한 항목은 건너뜁니다.
+    
+    Args:
+        items (list): collect_inputs가 반환한 항목 목록
+        output_path (str): 결과 JSONL 파일 경로
+        client (AsyncOpenAIClient): 비동기 OpenAI 클라이언트
+        length (str): 요약 길이 ("short", "medium", "long")
+        format (str): 요약 형식 ("bullet", "paragraph", "structured")
+        language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        chunked (bool): 분할 요약 여부
+        workers (int): 추출 프로세스 수 (None이면 CPU 수)
+        concurrency (int): 동시에 진행할 최대 요약 수
+        resume (bool): 결과 파일에 이미 성공으로 기록된 항목을 건너뛸지 여부
+    
+    Returns:
+        dict: 처리 결과 수 {"total", "ok", "error", "skipped"}
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    concurrency = max(1, concurrency)
+    
+    completed = load_completed_keys(output_path) if resume else set()
+    queue = asyncio.Queue()
+    counts = {"total": len(items), "ok": 0, "error": 0, "skipped": 0}
+    for item in items:
+        key = item_key(item, length, format, language, chunked)
+        if key in completed:
+            counts["skipped"] += 1
+        else:
+            queue.put_nowait((key, item))
+    
+    if counts["skipped"]:
+        print(f"이미 처리된 항목 {counts['skipped']}개를 건너뜁니다.")
+    if queue.empty():
+        return counts
+    
+    loop = asyncio.get_running_loop()
+    summary_slots = asyncio.Semaphore(concurrency)
+    pending_count = queue.qsize()
+    
+    async def process(key, item):
+        start = time.perf_counter()
+        record = {"key": key, "id": item["id"], "path": item["path"], "pages": item["pages"]}
+        try:
+            text = await loop.run_in_executor(executor, _extract, item["path"], item["pages"])
+            
+            async with summary_slots:
+                detected_language = None
+                if language == 'auto':
+                    detected_language, summary = await asyncio.gather(
+                        client.detect_language(text),
+                        client.summarize_or_raise(text, length, format, language, chunked)
+                    )
+                else:
+                    summary = await client.summarize_or_raise(text, length, format, language, chunked)
+            
+            record.update(status="ok", summary=summary, detected_language=detected_language)
+        except Exception as e:
+            record.update(status="error", error=str(e) or type(e).__name__)
+        record["elapsed"] = round(time.perf_counter() - start, 3)
+        return record
+    
+    async def worker():
+        while True:
+            try:
+                key, item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            
+            record = await process(key, item)
+            output_file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            output_file.flush()
+            
+            counts[record["status"]] += 1
+            done = counts["ok"] + counts["error"]
+            status = "완료" if record["status"] == "ok" else f"오류: {record['error']}"
+            print(f"[{done}/{pending_count}] {item['id']} - {status} ({record['elapsed']}초)")
+    
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_extract_worker)
+    output_file = _open_results(output_path)
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(pending_count, concurrency + workers))))
+    finally:
+        output_file.close()
+        executor.shutdown(wait=True, cancel_futures=True)
+    
+    return counts
@@ -17,10 +17,118 @@ RESOURCES_DIR = BASE_DIR / "src" / "resources"
 TEMP_DIR = BASE_DIR / "temp"
 OUTPUT_DIR = BASE_DIR / "output"
 
+# 서버 실행 설정
+SERVER_WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))  # API 서버 워커 프로세스 수 (uvicorn과 같은 환경 변수 사용)
+
+# 캐시 공통 설정
+CACHE_DISK_BACKEND = os.getenv("CACHE_DISK_BACKEND", "sqlite")  # 디스크 계층 저장 방식 ("sqlite": 워커끼리 공유하는 WAL 모드 SQLite 파일, "files": 항목마다 JSON 파일)
+
 # OpenAI API 설정
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL = "gpt-4o-mini"  # GPT-4o Mini 모델 사용
 MAX_TOKENS = 128000  # 최대 토큰 수 (GPT-4o Mini의 컨텍스트 윈도우)
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))  # API 요청 제한 시간 (초)
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))  # 비동기 클라이언트의 최대 동시 연결 수
+OPENAI_TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "200000"))  # 분당 토큰 한도 (0이면 제한 없음, API 서버에서는 워커 수로 나눠 적용)
+
+# 웹 스크래핑 설정
+SCRAPE_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+SCRAPE_TIMEOUT = float(os.getenv("SCRAPE_TIMEOUT", "10"))  # 웹 페이지 요청 제한 시간 (초)
+SCRAPE_MAX_CONNECTIONS = int(os.getenv("SCRAPE_MAX_CONNECTIONS", "100"))  # 전체 최대 동시 연결 수
+SCRAPE_MAX_CONNECTIONS_PER_HOST = int(os.getenv("SCRAPE_MAX_CONNECTIONS_PER_HOST", "6"))  # 호스트별 최대 동시 요청 수
+SCRAPE_KEEPALIVE_EXPIRY = float(os.getenv("SCRAPE_KEEPALIVE_EXPIRY", "30"))  # 유휴 연결 유지 시간 (초)
+HTML_PARSER = os.getenv("HTML_PARSER", "html.parser")  # BeautifulSoup 파서 ("lxml"은 더 빠르지만 잘못 중첩된 태그를 다르게 고쳐 본문이 달라질 수 있음, "auto"이면 lxml이 설치된 경우 lxml 사용)
+
+# 웹 페이지 캐시 설정
+SCRAPE_CACHE_ENABLED = os.getenv("SCRAPE_CACHE_ENABLED", "true").lower() == "true"
+SCRAPE_CACHE_TTL = int(os.getenv("SCRAPE_CACHE_TTL", "300"))  # 재검증 없이 캐시를 그대로 사용할 시간 (초)
+SCRAPE_CACHE_MAX_AGE = int(os.getenv("SCRAPE_CACHE_MAX_AGE", str(7 * 24 * 60 * 60)))  # 조건부 요청으로 재검증할 수 있도록 보관할 시간 (초)
+SCRAPE_CACHE_MAX_ENTRIES = int(os.getenv("SCRAPE_CACHE_MAX_ENTRIES", "500"))  # 메모리 계층 최대 항목 수
+SCRAPE_CACHE_MAX_MEMORY_BYTES = int(os.getenv("SCRAPE_CACHE_MAX_MEMORY_BYTES", str(64 * 1024 * 1024)))  # 메모리 계층 최대 크기
+SCRAPE_CACHE_DISK_ENABLED = os.getenv("SCRAPE_CACHE_DISK_ENABLED", "true").lower() == "true"
+SCRAPE_CACHE_DIR = TEMP_DIR / "page_cache"
+SCRAPE_CACHE_MAX_DISK_BYTES = int(os.getenv("SCRAPE_CACHE_MAX_DISK_BYTES", str(512 * 1024 * 1024)))  # 디스크 계층 최대 크기
+SCRAPE_CONTENT_CACHE_ENABLED = os.getenv("SCRAPE_CONTENT_CACHE_ENABLED", "true").lower() == "true"  # 추출된 본문도 캐시
+
+# 파일 업로드 설정
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(20 * 1024 * 1024)))  # 업로드 파일 최대 크기
+UPLOAD_FORM_OVERHEAD_BYTES = 64 * 1024  # 요청 본문에서 파일 외 폼 필드와 multipart 경계에 허용할 크기
+
+# 문서 추출 설정
+PDF_MAX_WORKERS = int(os.getenv("PDF_MAX_WORKERS", str(max(1, min(4, (os.cpu_count() or 1) // SERVER_WORKERS)))))  # 서버 워커마다 사용할 PDF 페이지 추출 프로세스 수 (1이면 순차 추출)
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))  # 이보다 페이지가 적으면 프로세스 풀을 사용하지 않음
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "8"))  # 프로세스 풀 작업 하나가 추출할 페이지 수
+TEXT_BLOCK_CHARS = 64 * 1024  # 문서를 블록 단위로 읽을 때 블록 하나의 대략적인 글자 수
+TEXT_MMAP_MIN_BYTES = int(os.getenv("TEXT_MMAP_MIN_BYTES", str(16 * 1024 * 1024)))  # 이보다 큰 텍스트 파일은 메모리 매핑으로 읽음
+DOCUMENT_MAX_TOKENS = int(os.getenv("DOCUMENT_MAX_TOKENS", "0"))  # 업로드 문서에서 추출할 최대 토큰 수 (0이면 제한 없음)
+
+# 문서 추출 캐시 설정
+EXTRACTION_CACHE_ENABLED = os.getenv("EXTRACTION_CACHE_ENABLED", "true").lower() == "true"
+EXTRACTION_CACHE_MAX_ENTRIES = int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", "200"))  # 메모리 계층 최대 항목 수
+EXTRACTION_CACHE_MAX_MEMORY_BYTES = int(os.getenv("EXTRACTION_CACHE_MAX_MEMORY_BYTES", str(64 * 1024 * 1024)))  # 메모리 계층 최대 크기
+EXTRACTION_CACHE_TTL = int(os.getenv("EXTRACTION_CACHE_TTL", str(30 * 24 * 60 * 60)))  # 캐시 유효 시간 (초)
+EXTRACTION_CACHE_DISK_ENABLED = os.getenv("EXTRACTION_CACHE_DISK_ENABLED", "true").lower() == "true"
+EXTRACTION_CACHE_DIR = TEMP_DIR / "extraction_cache"
+EXTRACTION_CACHE_MAX_DISK_BYTES = int(os.getenv("EXTRACTION_CACHE_MAX_DISK_BYTES", str(512 * 1024 * 1024)))  # 디스크 계층 최대 크기
+
+# 요약 캐시 설정
+SUMMARY_CACHE_ENABLED = os.getenv("SUMMARY_CACHE_ENABLED", "true").lower() == "true"
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "1000"))  # 메모리 계층 최대 항목 수
+SUMMARY_CACHE_MAX_MEMORY_BYTES = int(os.getenv("SUMMARY_CACHE_MAX_MEMORY_BYTES", str(32 * 1024 * 1024)))  # 메모리 계층 최대 크기
+SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", str(24 * 60 * 60)))  # 캐시 유효 시간 (초)
+SUMMARY_CACHE_DISK_ENABLED = os.getenv("SUMMARY_CACHE_DISK_ENABLED", "true").lower() == "true"
+SUMMARY_CACHE_DIR = TEMP_DIR / "summary_cache"
+SUMMARY_CACHE_MAX_DISK_BYTES = int(os.getenv("SUMMARY_CACHE_MAX_DISK_BYTES", str(256 * 1024 * 1024)))  # 디스크 계층 최대 크기
+
+# 언어 감지 설정
+LANGUAGE_DETECTION_SAMPLE_SIZE = int(os.getenv("LANGUAGE_DETECTION_SAMPLE_SIZE", "1000"))  # 로컬 감지에 사용할 샘플 글자 수
+LANGUAGE_DETECTION_MIN_CONFIDENCE = float(os.getenv("LANGUAGE_DETECTION_MIN_CONFIDENCE", "0.8"))  # 이보다 낮으면 LLM으로 감지
+LANGUAGE_DETECTION_MAX_BLOCKS = int(os.getenv("LANGUAGE_DETECTION_MAX_BLOCKS", "5"))  # 블록 단위 업로드에서 감지 샘플에 쓸 앞쪽 블록 수
+
+# 토큰 예산 설정
+MAX_OUTPUT_TOKENS = 16384  # 응답 최대 토큰 수 (GPT-4o Mini의 출력 제한)
+PROMPT_RESERVED_TOKENS = 1000  # 프롬프트 지시문과 추정 오차를 위해 남겨 둘 토큰 수
+SUMMARY_MAX_OUTPUT_TOKENS = {  # 요약 길이별 응답 최대 토큰 수
+    "short": 400,
+    "medium": 1000,
+    "long": 2000
+}
+KEYWORD_OUTPUT_TOKENS = 10  # 키워드 하나당 응답 토큰 수
+LANGUAGE_OUTPUT_TOKENS = 10  # 언어 감지 응답 최대 토큰 수
+FILTER_INPUT_MAX_TOKENS = int(os.getenv("FILTER_INPUT_MAX_TOKENS", "12000"))  # 웹 콘텐츠 필터링 입력 최대 토큰 수
+FILTER_MAX_OUTPUT_TOKENS = int(os.getenv("FILTER_MAX_OUTPUT_TOKENS", "8000"))  # 웹 콘텐츠 필터링 응답 최대 토큰 수
+TIKTOKEN_ENABLED = os.getenv("TIKTOKEN_ENABLED", "true").lower() == "true"  # tiktoken이 설치된 경우 사용 여부
+
+# 긴 문서 분할 요약 설정
+CHUNK_MAX_TOKENS = int(os.getenv("CHUNK_MAX_TOKENS", "4000"))  # 청크당 최대 토큰 수
+CHUNK_MAX_WORKERS = int(os.getenv("CHUNK_MAX_WORKERS", "4"))  # 동시에 요약할 최대 청크 수
+
+# 일괄 요약 설정
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "1000"))  # 한 번에 요청할 수 있는 최대 항목 수
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "8"))  # 동시에 처리할 최대 항목 수
+
+# 비동기 작업 설정
+JOBS_ENABLED = os.getenv("JOBS_ENABLED", "true").lower() == "true"  # /jobs 엔드포인트와 작업 워커 사용 여부
+JOBS_DIR = TEMP_DIR / "jobs"  # 작업 데이터베이스와 입력 파일 보관 디렉토리
+JOBS_DB_PATH = Path(os.getenv("JOBS_DB_PATH", str(JOBS_DIR / "jobs.sqlite3")))  # 작업 상태와 결과를 저장할 SQLite 파일
+JOB_MAX_CONCURRENCY = int(os.getenv("JOB_MAX_CONCURRENCY", "4"))  # 프로세스마다 동시에 처리할 최대 작업 수
+JOB_MAX_QUEUED = int(os.getenv("JOB_MAX_QUEUED", "1000"))  # 대기 중인 작업이 이보다 많으면 새 작업을 받지 않음
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))  # 서버 중단으로 중단된 작업을 다시 시도할 최대 횟수
+JOB_HEARTBEAT_INTERVAL = float(os.getenv("JOB_HEARTBEAT_INTERVAL", "10"))  # 실행 중인 작업 갱신 간격 (3배 동안 갱신이 없으면 중단된 것으로 판단)
+JOB_RESULT_TTL = int(os.getenv("JOB_RESULT_TTL", str(7 * 24 * 60 * 60)))  # 완료된 작업과 결과 보관 시간 (초)
+JOB_CALLBACK_TIMEOUT = float(os.getenv("JOB_CALLBACK_TIMEOUT", "10"))  # 작업 완료 콜백 요청 제한 시간 (초)
+
+# 서버 시작 워밍업 설정
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"  # 시작 직후 무거운 모듈과 클라이언트를 미리 준비 (끝나면 /ready가 200 응답)
+WARMUP_CONNECT_UPSTREAM = os.getenv("WARMUP_CONNECT_UPSTREAM", "true").lower() == "true"  # 워밍업 중 OpenAI API 연결을 미리 열어 둠 (모델 목록 요청 한 번)
+WARMUP_TIMEOUT = float(os.getenv("WARMUP_TIMEOUT", "10"))  # OpenAI API 연결 준비 제한 시간 (초)
+
+# 지표 및 추적 설정
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"  # 요청 지표 기록과 /metrics 엔드포인트 사용 여부
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"  # 응답에 단계별 소요 시간(Server-Timing)과 요청 ID 헤더 추가
+TRACE_LOG_FILE = os.getenv("TRACE_LOG_FILE", "")  # 요청별 추적 기록을 JSON Lines로 남길 파일 경로 (비어 있으면 기록하지 않음)
+METRICS_MULTIPROCESS_DIR = Path(os.getenv("METRICS_MULTIPROCESS_DIR", str(TEMP_DIR / "metrics")))  # 워커가 여러 개일 때 워커별 지표 값을 저장해 /metrics에서 합칠 디렉토리
+METRICS_SYNC_INTERVAL = float(os.getenv("METRICS_SYNC_INTERVAL", "5"))  # 워커별 지표 값을 저장하는 간격 (초)
 
 # UI 설정
 DEFAULT_WINDOW_WIDTH = 1200
@@ -0,0 +1,571 @@
+import asyncio
+from src.config import (
+    OPENAI_TIMEOUT, OPENAI_MAX_CONNECTIONS, LANGUAGE_DETECTION_MIN_CONFIDENCE, CHUNK_MAX_WORKERS,
+    LANGUAGE_OUTPUT_TOKENS, OPENAI_TOKENS_PER_MINUTE
+)
+from src.models.openai_client import OpenAIClient
+from src.utils.language_detector import get_language_detector
+from src.utils.token_estimator import estimate_tokens, estimate_message_tokens
+from src.utils.rate_limiter import TokenBucket
+from src.utils.single_flight import SingleFlight
+from src.utils.cache import make_cache_key
+from src.utils.metrics import track_llm_call
+from src.utils.tracing import span
+
+class AsyncOpenAIClient(OpenAIClient):
+    """OpenAI API와 비동기로 통신하기 위한 클라이언트 클래스
+    
+    API 서버처럼 이벤트 루프 위에서 동작하는 코드에서 사용합니다.
+    하나의 커넥션 풀을 공유하므로 여러 요청이 한 워커에서 동시에 진행됩니다.
+    프롬프트 구성과 응답 해석은 OpenAIClient의 구현을 그대로 사용합니다.
+    """
+    
+    def __init__(self, tokens_per_minute=OPENAI_TOKENS_PER_MINUTE):
+        """비동기 OpenAI 클라이언트 초기화
+        
+        Args:
+            tokens_per_minute (int): 이 클라이언트에 적용할 분당 토큰 한도 (0이면 제한 없음)
+        """
+        super().__init__()
+        # 동시에 많은 요청을 보내도 분당 토큰 한도를 넘지 않도록 제한
+        self.rate_limiter = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        # 같은 요청이 동시에 여러 번 들어오면 API 호출을 하나로 합침
+        self.flights = SingleFlight("openai")
+    
+    def _create_client(self):
+        """비동기 OpenAI SDK 클라이언트 생성
+        
+        Returns:
+            openai.AsyncOpenAI: 비동기 OpenAI 클라이언트
+        """
+        import httpx
+        import openai
+        
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_MAX_CONNECTIONS
+            ),
+            timeout=OPENAI_TIMEOUT
+        )
+        return openai.AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=http_client,
+            timeout=OPENAI_TIMEOUT
+        )
+    
+    async def close(self):
+        """커넥션 풀 정리 (SDK 클라이언트를 만들지 않았으면 아무것도 하지 않음)"""
+        if self._client is not None:
+            await self._client.close()
+    
+    async def warm_up(self, connect=True, timeout=10.0):
+        """첫 요청이 느려지지 않도록 SDK 클라이언트를 만들고 커넥션 풀에 연결을 미리 열어 둠
+        
+        연결은 토큰을 사용하지 않는 모델 목록 요청 한 번으로 확인하며, 같은 커넥션 풀을 쓰므로
+        이후 요약 요청은 TCP/TLS 연결 과정 없이 바로 전송됩니다.
+        
+        Args:
+            connect (bool): API 서버에 실제로 연결할지 여부 (False이면 SDK 클라이언트만 생성)
+            timeout (float): 연결 확인 제한 시간 (초)
+        
+        Returns:
+            bool: API 서버가 응답했으면 True (connect가 False이면 항상 True)
+        """
+        # openai 패키지 가져오기는 CPU를 사용하므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        client = await asyncio.to_thread(lambda: self.client)
+        if not connect:
+            return True
+        
+        import openai
+        try:
+            await client.with_options(max_retries=0, timeout=timeout).models.list()
+        except openai.APIStatusError:
+            # 오류 응답이어도 연결은 열렸으므로 준비된 것으로 봄
+            pass
+        except Exception as e:
+            print(f"OpenAI API 연결 준비 중 오류가 발생했습니다: {str(e)}")
+            return False
+        return True
+    
+    async def _reserve_tokens(self, tokens):
+        """분당 토큰 한도 안에서 요청에 쓸 토큰 예약
+        
+        Returns:
+            int: 예약한 토큰 수 (제한이 없으면 0)
+        """
+        if self.rate_limiter is None:
+            return 0
+        return await self.rate_limiter.acquire(tokens)
+    
+    def _refund_tokens(self, reserved):
+        """요청이 실패해 사용하지 않은 예약 토큰을 돌려줌"""
+        if self.rate_limiter is not None and reserved:
+            self.rate_limiter.settle(reserved, 0)
+    
+    def _settle_tokens(self, reserved, usage_entry):
+        """예약한 토큰 수를 실제 사용량으로 정산"""
+        if self.rate_limiter is None or usage_entry["prompt_tokens"] is None:
+            return
+        self.rate_limiter.settle(reserved, usage_entry["prompt_tokens"] + (usage_entry["completion_tokens"] or 0))
+    
+    async def _get_cached_async(self, key):
+        """캐시된 결과 반환 (디스크 계층 조회는 스레드 풀에서 실행, 캐시가 없으면 None)"""
+        if self.cache is None:
+            return None
+        return await self.cache.get_async(key)
+    
+    async def _set_cached_async(self, key, value):
+        """성공한 결과를 캐시에 저장 (디스크 계층 쓰기는 스레드 풀에서 실행)"""
+        if self.cache is not None:
+            await self.cache.set_async(key, value)
+    
+    async def _fit_to_budget_async(self, text, max_tokens):
+        """입력 텍스트를 컨텍스트 윈도우에 맞게 자름 (긴 텍스트의 토큰 계산은 스레드 풀에서 실행)"""
+        return await asyncio.to_thread(self._fit_to_budget, text, max_tokens)
+    
+    async def _exceeds_summary_budget_async(self, text, length):
+        """한 번의 요청으로 요약하기에 입력이 너무 긴지 확인 (스레드 풀에서 실행)"""
+        return await asyncio.to_thread(self._exceeds_summary_budget, text, length)
+    
+    async def _create_completion(self, operation, messages, max_tokens, temperature=0.3, **kwargs):
+        """Chat Completions API 호출 후 토큰 사용량 기록 (비동기)
+        
+        메시지와 매개변수가 같은 호출이 진행 중이면 새로 요청하지 않고 그 응답을 함께 사용합니다.
+        
+        Returns:
+            API 응답 객체
+        """
+        key = make_cache_key("completion", "", self.model, messages, max_tokens, temperature, kwargs)
+        return await self.flights.do(
+            key, lambda: self._send_completion(operation, messages, max_tokens, temperature, **kwargs)
+        )
+    
+    async def _send_completion(self, operation, messages, max_tokens, temperature, **kwargs):
+        """Chat Completions API 요청 (토큰 한도 예약 및 사용량 기록)"""
+        estimated_prompt_tokens = await asyncio.to_thread(estimate_message_tokens, messages)
+        reserved = await self._reserve_tokens(estimated_prompt_tokens + max_tokens)
+        try:
+            with track_llm_call(operation), span(f"llm.{operation}"):
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs
+                )
+        except Exception:
+            # 실패한 요청은 토큰을 쓰지 않았으므로 예약을 돌려줘 이후 요청이 불필요하게 기다리지 않도록 함
+            self._refund_tokens(reserved)
+            raise
+        entry = self._record_usage(operation, estimated_prompt_tokens, max_tokens, getattr(response, "usage", None))
+        self._settle_tokens(reserved, entry)
+        return response
+    
+    async def summarize_text(self, text, length="medium", format="paragraph", language="auto"):
+        """텍스트 요약 기능 (비동기)
+        
+        Args:
+            text (str): 요약할 텍스트
+            length (str): 요약 길이 ("short", "medium", "long")
+            format (str): 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        
+        Returns:
+            str: 요약된 텍스트
+        """
+        if not text:
+            return "요약할 텍스트가 없습니다."
+        
+        # 컨텍스트 윈도우를 넘는 입력은 분할 요약으로 처리
+        if await self._exceeds_summary_budget_async(text, length):
+            return await self.summarize_chunked(text, length, format, language)
+        
+        try:
+            return await self._request_summary(text, length, format, language)
+        
+        except Exception as e:
+            return f"요약 중 오류가 발생했습니다: {str(e)}"
+    
+    async def summarize_chunked(self, text, length="medium", format="paragraph", language="auto"):
+        """긴 문서 분할 요약 (map-reduce, 비동기)
+        
+        문단/문장 경계로 나눈 청크를 최대 CHUNK_MAX_WORKERS개까지 동시에 요약한 뒤,
+        부분 요약을 다시 합쳐 하나의 청크에 들어갈 때까지 계층적으로 요약합니다.
+        
+        Args:
+            text (str): 요약할 텍스트
+            length (str): 최종 요약 길이 ("short", "medium", "long")
+            format (str): 최종 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        
+        Returns:
+            str: 요약된 텍스트
+        """
+        if not text:
+            return "요약할 텍스트가 없습니다."
+        
+        try:
+            combined = await self._reduce_for_summary(text, language)
+            return await self._request_summary(combined, length, format, language)
+        
+        except Exception as e:
+            return f"요약 중 오류가 발생했습니다: {str(e)}"
+    
+    async def summarize_or_raise(self, text, length="medium", format="paragraph", language="auto", chunked=False):
+        """텍스트 요약 (오류를 요약 문자열 대신 예외로 전달, 비동기)
+        
+        일괄 처리처럼 실패한 항목을 따로 기록하고 다시 시도해야 하는 호출에서 사용합니다.
+        
+        Args:
+            text (str): 요약할 텍스트
+            length (str): 요약 길이 ("short", "medium", "long")
+            format (str): 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
+            chunked (bool): 분할 요약 여부 (False여도 입력이 너무 길면 분할 요약)
+        
+        Returns:
+            str: 요약된 텍스트
+        
+        Raises:
+            ValueError: 요약할 텍스트가 없는 경우
+        """
+        if not text or not text.strip():
+            raise ValueError("요약할 텍스트가 없습니다.")
+        
+        if chunked or await self._exceeds_summary_budget_async(text, length):
+            text = await self._reduce_for_summary(text, language)
+        return await self._request_summary(text, length, format, language)
+    
+    async def summarize_blocks(self, blocks, length="medium", format="paragraph", language="auto"):
+        """텍스트 블록 이터레이터 분할 요약 (map-reduce, 비동기)
+        
+        블록은 파일 추출처럼 블로킹 이터레이터여도 되며, 다음 청크는 스레드 풀에서 가져옵니다.
+        
+        Args:
+            blocks (iterable): 텍스트 블록 이터레이터 (블록 경계는 문단 경계로 취급)
+            length (str): 최종 요약 길이 ("short", "medium", "long")
+            format (str): 최종 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        
+        Returns:
+            str: 요약된 텍스트
+        """
+        try:
+            combined = await self._reduce_blocks(blocks, language)
+            if combined is None:
+                return "요약할 텍스트가 없습니다."
+            
+            return await self._request_summary(combined, length, format, language)
+        
+        except Exception as e:
+            return f"요약 중 오류가 발생했습니다: {str(e)}"
+    
+    async def _reduce_for_summary(self, text, language):
+        """분할 요약의 map/reduce 단계를 수행해 최종 요약에 넣을 청크 하나를 만듦
+        
+        Args:
+            text (str): 요약할 텍스트
+            language (str): 부분 요약 언어
+        
+        Returns:
+            str: 최종 요약 단계의 입력 텍스트 (청크가 하나면 원문 그대로)
+        """
+        return await self._reduce_blocks([text], language) or ""
+    
+    async def _reduce_blocks(self, blocks, language):
+        """블록 이터레이터로 map/reduce 단계를 수행해 최종 요약에 넣을 청크 하나를 만듦
+        
+        청크가 만들어지는 대로 부분 요약을 시작하며, 추출이 요약보다 너무 앞서 나가지 않도록
+        진행 중인 부분 요약은 CHUNK_MAX_WORKERS의 두 배까지만 유지합니다.
+        
+        Args:
+            blocks (iterable): 텍스트 블록 이터레이터
+            language (str): 부분 요약 언어
+        
+        Returns:
+            str: 최종 요약 단계의 입력 텍스트 (청크가 하나면 원문 그대로, 텍스트가 없으면 None)
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(CHUNK_MAX_WORKERS)
+        
+        async def summarize_chunk(chunk):
+            async with semaphore:
+                return await self._request_summary(chunk, "medium", "paragraph", language)
+        
+        chunks = self._iter_summary_chunks(blocks)
+        first_chunk = None
+        chunk_count = 0
+        tasks = []
+        try:
+            while True:
+                in_flight = [task for task in tasks if not task.done()]
+                if len(in_flight) >= CHUNK_MAX_WORKERS * 2:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                
+                chunk = await loop.run_in_executor(None, next, chunks, None)
+                if chunk is None:
+                    break
+                chunk_count += 1
+                # 청크가 하나뿐이면 부분 요약 없이 바로 최종 요약하므로 두 번째 청크가 나올 때까지 보류
+                if chunk_count == 1:
+                    first_chunk = chunk
+                    continue
+                if first_chunk is not None:
+                    tasks.append(asyncio.ensure_future(summarize_chunk(first_chunk)))
+                    first_chunk = None
+                tasks.append(asyncio.ensure_future(summarize_chunk(chunk)))
+            
+            partial_summaries = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            try:
+                chunks.close()
+            except ValueError:
+                # 취소된 경우 스레드 풀에서 다음 청크를 만드는 중일 수 있음 (끝나면 가비지 컬렉션으로 정리됨)
+                pass
+        
+        if chunk_count <= 1:
+            return first_chunk
+        
+        chunk_list = self._next_level_chunks(partial_summaries, chunk_count)
+        while len(chunk_list) > 1:
+            partial_summaries = await asyncio.gather(*(summarize_chunk(chunk) for chunk in chunk_list))
+            chunk_list = self._next_level_chunks(partial_summaries, len(chunk_list))
+        return chunk_list[0]
+    
+    async def stream_summary(self, text, length="medium", format="paragraph", language="auto", chunked=False):
+        """요약 결과를 모델이 생성하는 대로 조각 단위로 전달 (비동기 제너레이터)
+        
+        분할 요약이 필요하면 부분 요약 단계를 먼저 마친 뒤 최종 요약만 스트리밍합니다.
+        캐시에 결과가 있으면 전체 요약을 한 번에 전달합니다. 오류는 예외로 전달됩니다.
+        
+        Args:
+            text (str): 요약할 텍스트
+            length (str): 요약 길이 ("short", "medium", "long")
+            format (str): 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
+            chunked (bool): 분할 요약 사용 여부 (입력이 컨텍스트 윈도우를 넘으면 자동 사용)
+        
+        Yields:
+            tuple: ("delta", 새로 생성된 텍스트 조각) 또는
+                   마지막으로 ("done", summary와 usage 키를 가진 dict)
+        """
+        if chunked or await self._exceeds_summary_budget_async(text, length):
+            text = await self._reduce_for_summary(text, language)
+        
+        cache_key = self._summary_cache_key(text, length, format, language)
+        cached = await self._get_cached_async(cache_key)
+        if cached is not None:
+            yield "delta", cached
+            yield "done", {"summary": cached, "usage": {"operation": "summary", "cached": True}}
+            return
+        
+        max_tokens = self._summary_max_tokens(length)
+        messages = self._build_summary_messages(await self._fit_to_budget_async(text, max_tokens), length, format, language)
+        estimated_prompt_tokens = await asyncio.to_thread(estimate_message_tokens, messages)
+        reserved = await self._reserve_tokens(estimated_prompt_tokens + max_tokens)
+        
+        parts = []
+        usage = None
+        # 호출 시간은 마지막 청크를 받을 때까지로 기록
+        with track_llm_call("summary"), span("llm.summary"):
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=0.3,
+                    stream=True,
+                    # 마지막 청크로 실제 사용량을 받음 (SDK에 매개변수가 없어 요청 본문에 직접 추가)
+                    extra_body={"stream_options": {"include_usage": True}},
+                )
+            except Exception:
+                # 응답을 받기 전에 실패한 요청은 예약을 돌려줌 (스트리밍 도중 실패하면 사용량을 알 수 없어 그대로 둠)
+                self._refund_tokens(reserved)
+                raise
+            async for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    yield "delta", chunk.choices[0].delta.content
+        
+        summary = "".join(parts).strip()
+        entry = self._record_usage("summary", estimated_prompt_tokens, max_tokens, usage)
+        self._settle_tokens(reserved, entry)
+        entry = dict(entry, cached=False, estimated_completion_tokens=estimate_tokens(summary))
+        await self._set_cached_async(cache_key, summary)
+        yield "done", {"summary": summary, "usage": entry}
+    
+    async def _request_summary(self, text, length, format, language):
+        """요약 API 호출 (캐시 사용, 오류 시 예외 발생)
+        
+        Returns:
+            str: 요약된 텍스트
+        """
+        cache_key = self._summary_cache_key(text, length, format, language)
+        cached = await self._get_cached_async(cache_key)
+        if cached is not None:
+            return cached
+        
+        max_tokens = self._summary_max_tokens(length)
+        messages = self._build_summary_messages(await self._fit_to_budget_async(text, max_tokens), length, format, language)
+        response = await self._create_completion("summary", messages, max_tokens)
+        
+        summary = response.choices[0].message.content.strip()
+        await self._set_cached_async(cache_key, summary)
+        return summary
+    
+    async def extract_keywords(self, text, count=10, language="auto"):
+        """텍스트에서 키워드 추출 (비동기)
+        
+        Args:
+            text (str): 키워드를 추출할 텍스트
+            count (int): 추출할 키워드 수
+            language (str): 키워드 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        
+        Returns:
+            list: 추출된 키워드 목록
+        """
+        if not text:
+            return ["키워드를 추출할 텍스트가 없습니다."]
+        
+        cache_key = self._keywords_cache_key(text, count, language)
+        cached = await self._get_cached_async(cache_key)
+        if cached is not None:
+            return cached
+        
+        max_tokens = self._keywords_max_tokens(count)
+        messages = self._build_keywords_messages(await self._fit_to_budget_async(text, max_tokens), count, language)
+        
+        try:
+            response = await self._create_completion("keywords", messages, max_tokens)
+            
+            keywords = self._parse_keywords(response.choices[0].message.content)
+            await self._set_cached_async(cache_key, keywords)
+            return keywords
+        
+        except Exception as e:
+            return [f"키워드 추출 중 오류가 발생했습니다: {str(e)}"]
+    
+    async def analyze_text(self, text, length="medium", format="paragraph", language="auto", keyword_count=10):
+        """요약, 키워드 추출, 언어 감지를 한 번의 요청으로 수행 (비동기)
+        
+        Args:
+            text (str): 분석할 텍스트
+            length (str): 요약 길이 ("short", "medium", "long")
+            format (str): 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 및 키워드 언어 ("auto", "ko", "en", "ja", "zh" 등)
+            keyword_count (int): 추출할 키워드 수
+        
+        Returns:
+            dict: summary(str), keywords(list), detected_language(str) 키를 가진 분석 결과
+        """
+        if not text:
+            return {"summary": "분석할 텍스트가 없습니다.", "keywords": [], "detected_language": None}
+        
+        cache_key = self._analysis_cache_key(text, length, format, language, keyword_count)
+        cached = await self._get_cached_async(cache_key)
+        if cached is not None:
+            return cached
+        
+        max_tokens = self._summary_max_tokens(length) + self._keywords_max_tokens(keyword_count) + LANGUAGE_OUTPUT_TOKENS
+        messages = self._build_analysis_messages(
+            await self._fit_to_budget_async(text, max_tokens), length, format, language, keyword_count
+        )
+        
+        try:
+            response = await self._create_completion(
+                "analysis", messages, max_tokens, response_format={"type": "json_object"}
+            )
+            
+            analysis = self._build_analysis_result(text, response.choices[0].message.content)
+            await self._set_cached_async(cache_key, analysis)
+            return analysis
+        
+        except Exception as e:
+            return {"summary": f"분석 중 오류가 발생했습니다: {str(e)}", "keywords": [], "detected_language": None}
+    
+    async def detect_language(self, text):
+        """텍스트의 언어 감지 (비동기)
+        
+        Args:
+            text (str): 언어를 감지할 텍스트
+        
+        Returns:
+            str: 감지된 언어 코드 ("ko", "en", "ja", "zh" 등)
+        """
+        if not text:
+            return "en"
+        
+        # 로컬 감지기로 먼저 판별하고, 신뢰도가 낮을 때만 LLM 사용
+        local_language = self._detect_language_locally(text)
+        if local_language:
+            return local_language
+        
+        messages = self._build_language_messages(text)
+        
+        try:
+            response = await self._create_completion("language", messages, LANGUAGE_OUTPUT_TOKENS, temperature=0.1)
+            
+            return self._parse_language(response.choices[0].message.content)
+        
+        except Exception as e:
+            print(f"언어 감지 중 오류가 발생했습니다: {str(e)}")
+            return "en"
+    
+    async def detect_languages(self, texts):
+        """여러 텍스트의 언어를 한 번에 감지 (비동기)
+        
+        로컬 감지기로 일괄 판별한 뒤 신뢰도가 낮은 텍스트만 LLM으로 동시에 다시 감지합니다.
+        
+        Args:
+            texts (list): 언어를 감지할 텍스트 목록
+        
+        Returns:
+            list: 감지된 언어 코드 목록 (입력 순서 유지)
+        """
+        results = get_language_detector().detect_batch(texts)
+        languages = [
+            result.language if result.language and result.confidence >= LANGUAGE_DETECTION_MIN_CONFIDENCE else None
+            for result in results
+        ]
+        
+        uncertain = [index for index, language in enumerate(languages) if language is None]
+        if uncertain:
+            detected = await asyncio.gather(*(self.detect_language(texts[index]) for index in uncertain))
+            for index, language in zip(uncertain, detected):
+                languages[index] = language
+        
+        return languages
+    
+    async def filter_web_content(self, text, title, url):
+        """웹 스크래핑 콘텐츠에서 주요 내용만 필터링 (비동기)
+        
+        Args:
+            text (str): 필터링할 원본 텍스트
+            title (str): 웹 페이지 제목
+            url (str): 웹 페이지 URL
+        
+        Returns:
+            str: 필터링된 텍스트
+        """
+        if not text:
+            return "필터링할 콘텐츠가 없습니다."
+        
+        text = await asyncio.to_thread(self._truncate_web_content, text)
+        messages = self._build_filter_messages(text, title, url)
+        
+        try:
+            response = await self._create_completion("filter", messages, self._filter_max_tokens(text))
+            
+            return response.choices[0].message.content.strip()
+        
+        except Exception as e:
+            print(f"콘텐츠 필터링 중 오류가 발생했습니다: {str(e)}")
+            # 오류 발생 시 원본 텍스트 반환
+            return text
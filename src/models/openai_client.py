@@ -1,27 +1,158 @@
 import os
-import openai
-from src.config import OPENAI_API_KEY, OPENAI_MODEL, MAX_TOKENS
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from src.config import (
+    OPENAI_API_KEY, OPENAI_MODEL, MAX_TOKENS,
+    SUMMARY_CACHE_ENABLED, SUMMARY_CACHE_MAX_ENTRIES, SUMMARY_CACHE_MAX_MEMORY_BYTES,
+    SUMMARY_CACHE_TTL, SUMMARY_CACHE_DISK_ENABLED, SUMMARY_CACHE_DIR, SUMMARY_CACHE_MAX_DISK_BYTES, CACHE_DISK_BACKEND,
+    LANGUAGE_DETECTION_MIN_CONFIDENCE, CHUNK_MAX_TOKENS, CHUNK_MAX_WORKERS,
+    MAX_OUTPUT_TOKENS, PROMPT_RESERVED_TOKENS, SUMMARY_MAX_OUTPUT_TOKENS, KEYWORD_OUTPUT_TOKENS,
+    LANGUAGE_OUTPUT_TOKENS, FILTER_INPUT_MAX_TOKENS, FILTER_MAX_OUTPUT_TOKENS
+)
+from src.utils.cache import TieredCache, make_cache_key
+from src.utils.language_detector import get_language_detector, sample_text
+from src.utils.metrics import track_llm_call, record_llm_tokens
+from src.utils.tracing import span
+from src.utils.text_chunker import chunk_text, iter_chunks
+from src.utils.token_estimator import (
+    TokenUsageTracker, estimate_tokens, estimate_message_tokens, truncate_to_tokens
+)
+
+# 언어 코드별 프롬프트에 사용할 언어 이름
+LANGUAGE_NAMES = {
+    "ko": "한국어",
+    "en": "영어",
+    "ja": "일본어",
+    "zh": "중국어",
+    "es": "스페인어",
+    "fr": "프랑스어",
+    "de": "독일어",
+    "ru": "러시아어",
+    "pt": "포르투갈어",
+    "it": "이탈리아어",
+    "nl": "네덜란드어",
+    "ar": "아랍어",
+    "hi": "힌디어",
+    "vi": "베트남어",
+    "th": "태국어",
+    "id": "인도네시아어",
+    "tr": "터키어",
+    "pl": "폴란드어",
+    "sv": "스웨덴어",
+    "da": "덴마크어",
+    "fi": "핀란드어",
+    "no": "노르웨이어",
+    "cs": "체코어",
+    "hu": "헝가리어",
+    "el": "그리스어",
+    "he": "히브리어",
+    "ro": "루마니아어",
+    "uk": "우크라이나어",
+    "fa": "페르시아어",
+    "ms": "말레이어"
+}
+
+# 모델이 언어 이름을 반환한 경우를 위한 영문 언어 이름 → 코드 매핑
+LANGUAGE_CODES_BY_NAME = {
+    "korean": "ko",
+    "english": "en",
+    "japanese": "ja",
+    "chinese": "zh",
+    "spanish": "es",
+    "french": "fr",
+    "german": "de",
+    "russian": "ru",
+    "portuguese": "pt",
+    "italian": "it",
+    "dutch": "nl",
+    "arabic": "ar",
+    "hindi": "hi",
+    "vietnamese": "vi",
+    "thai": "th",
+    "indonesian": "id",
+    "turkish": "tr",
+    "polish": "pl",
+    "swedish": "sv",
+    "danish": "da",
+    "finnish": "fi",
+    "norwegian": "no",
+    "czech": "cs",
+    "hungarian": "hu",
+    "greek": "el",
+    "hebrew": "he",
+    "romanian": "ro",
+    "ukrainian": "uk",
+    "persian": "fa",
+    "malay": "ms"
+}
+
+# 지원하는 언어 코드 목록
+SUPPORTED_LANGUAGE_CODES = list(LANGUAGE_NAMES.keys())
+
+# 요약 및 키워드 결과 캐시 (같은 프로세스의 모든 클라이언트가 공유)
+summary_cache = None
+if SUMMARY_CACHE_ENABLED:
+    summary_cache = TieredCache(
+        "summary",
+        max_entries=SUMMARY_CACHE_MAX_ENTRIES,
+        max_memory_bytes=SUMMARY_CACHE_MAX_MEMORY_BYTES,
+        ttl=SUMMARY_CACHE_TTL,
+        disk_dir=SUMMARY_CACHE_DIR if SUMMARY_CACHE_DISK_ENABLED else None,
+        max_disk_bytes=SUMMARY_CACHE_MAX_DISK_BYTES,
+        disk_backend=CACHE_DISK_BACKEND
+    )
 
 class OpenAIClient:
-    """OpenAI API와 통신하기 위한 클라이언트 클래스"""
+    """OpenAI API와 통신하기 위한 클라이언트 클래스
+    
+    프롬프트 구성과 응답 해석은 이 클래스에 모아 두고,
+    비동기 클라이언트(AsyncOpenAIClient)가 이를 그대로 재사용합니다.
+    """
     
     def __init__(self):
         """OpenAI 클라이언트 초기화"""
         self.api_key = OPENAI_API_KEY
         self.model = OPENAI_MODEL
+        self.cache = summary_cache
+        self.usage = TokenUsageTracker()
         
         if not self.api_key:
             raise ValueError("OpenAI API 키가 설정되지 않았습니다. 환경 변수 OPENAI_API_KEY를 설정하세요.")
         
+        self._client = None
+    
+    @property
+    def client(self):
+        """OpenAI SDK 클라이언트
+        
+        openai 패키지는 가져오는 데 시간이 걸리므로 처음 사용할 때(또는 warm_up에서) 생성합니다.
+        """
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+    
+    @client.setter
+    def client(self, client):
+        self._client = client
+    
+    def _create_client(self):
+        """OpenAI SDK 클라이언트 생성
+        
+        Returns:
+            openai.OpenAI: 동기 OpenAI 클라이언트
+        """
+        import openai
+        
         # 최신 버전의 OpenAI 라이브러리와 호환되도록 수정
         try:
             # 최신 버전 방식으로 초기화 시도
-            self.client = openai.OpenAI(api_key=self.api_key)
+            return openai.OpenAI(api_key=self.api_key)
         except TypeError as e:
             if 'proxies' in str(e):
                 # proxies 매개변수 문제가 발생한 경우 대체 방법 사용
                 import httpx
-                self.client = openai.OpenAI(
+                return openai.OpenAI(
                     api_key=self.api_key,
                     http_client=httpx.Client()
                 )
@@ -29,21 +160,76 @@ class OpenAIClient:
                 # 다른 오류인 경우 다시 발생
                 raise
     
-    def summarize_text(self, text, length="medium", format="paragraph", language="auto"):
-        """텍스트 요약 기능
+    def _create_completion(self, operation, messages, max_tokens, temperature=0.3, **kwargs):
+        """Chat Completions API 호출 후 토큰 사용량 기록
+        
+        Args:
+            operation (str): 작업 종류 (사용량 통계용)
+            messages (list): 요청 메시지 목록
+            max_tokens (int): 응답 최대 토큰 수
+            temperature (float): 샘플링 온도
+            **kwargs: API에 그대로 전달할 추가 매개변수
+        
+        Returns:
+            API 응답 객체
+        """
+        estimated_prompt_tokens = estimate_message_tokens(messages)
+        with track_llm_call(operation), span(f"llm.{operation}"):
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs
+            )
+        self._record_usage(operation, estimated_prompt_tokens, max_tokens, getattr(response, "usage", None))
+        return response
+    
+    def _record_usage(self, operation, estimated_prompt_tokens, max_tokens, usage):
+        """호출 한 번의 토큰 사용량을 통계(/stats)와 토큰 카운터(/metrics)에 기록
+        
+        Returns:
+            dict: 이번 호출의 사용량 기록
+        """
+        entry = self.usage.record(operation, estimated_prompt_tokens, max_tokens, usage)
+        record_llm_tokens(operation, entry)
+        return entry
+    
+    def _summary_cache_key(self, text, length, format, language):
+        """요약 결과 캐시 키 (정규화된 텍스트, 요약 옵션, 모델 기준)"""
+        return make_cache_key("summary", text, length, format, language, self.model)
+    
+    def _keywords_cache_key(self, text, count, language):
+        """키워드 결과 캐시 키 (정규화된 텍스트, 키워드 옵션, 모델 기준)"""
+        return make_cache_key("keywords", text, count, language, self.model)
+    
+    def _analysis_cache_key(self, text, length, format, language, keyword_count):
+        """통합 분석 결과 캐시 키 (정규화된 텍스트, 분석 옵션, 모델 기준)"""
+        return make_cache_key("analysis", text, length, format, language, keyword_count, self.model)
+    
+    def _get_cached(self, key):
+        """캐시된 결과 반환 (캐시가 비활성화되었거나 없으면 None)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+    
+    def _set_cached(self, key, value):
+        """성공한 결과를 캐시에 저장"""
+        if self.cache is not None:
+            self.cache.set(key, value)
+    
+    @staticmethod
+    def _summary_option_prompts(length="medium", format="paragraph", language="auto"):
+        """요약 옵션별 프롬프트 문장 구성
         
         Args:
-            text (str): 요약할 텍스트
             length (str): 요약 길이 ("short", "medium", "long")
             format (str): 요약 형식 ("bullet", "paragraph", "structured")
             language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
-            
+        
         Returns:
-            str: 요약된 텍스트
+            tuple: (길이 프롬프트, 형식 프롬프트, 언어 프롬프트)
         """
-        if not text:
-            return "요약할 텍스트가 없습니다."
-        
         # 요약 길이에 따른 프롬프트 조정
         length_prompt = ""
         if length == "short":
@@ -67,45 +253,53 @@ class OpenAIClient:
         if language == "auto":
             language_prompt = "원본 텍스트와 동일한 언어로 요약해주세요."
         else:
-            language_map = {
-                "ko": "한국어",
-                "en": "영어",
-                "ja": "일본어",
-                "zh": "중국어",
-                "es": "스페인어",
-                "fr": "프랑스어",
-                "de": "독일어",
-                "ru": "러시아어",
-                "pt": "포르투갈어",
-                "it": "이탈리아어",
-                "nl": "네덜란드어",
-                "ar": "아랍어",
-                "hi": "힌디어",
-                "vi": "베트남어",
-                "th": "태국어",
-                "id": "인도네시아어",
-                "tr": "터키어",
-                "pl": "폴란드어",
-                "sv": "스웨덴어",
-                "da": "덴마크어",
-                "fi": "핀란드어",
-                "no": "노르웨이어",
-                "cs": "체코어",
-                "hu": "헝가리어",
-                "el": "그리스어",
-                "he": "히브리어",
-                "ro": "루마니아어",
-                "uk": "우크라이나어",
-                "fa": "페르시아어",
-                "ms": "말레이어"
-            }
-            target_language = language_map.get(language)
+            target_language = LANGUAGE_NAMES.get(language)
             if target_language:
                 language_prompt = f"{target_language}로 요약해주세요."
             else:
                 # 지원하지 않는 언어 코드인 경우 영어로 대체
                 language_prompt = "영어로 요약해주세요."
         
+        return length_prompt, format_prompt, language_prompt
+    
+    @staticmethod
+    def _keywords_language_prompt(language="auto"):
+        """키워드 언어 설정에 따른 프롬프트 문장 구성
+        
+        Args:
+            language (str): 키워드 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        
+        Returns:
+            str: 언어 프롬프트
+        """
+        # 언어 설정에 따른 프롬프트 조정
+        language_prompt = ""
+        if language == "auto":
+            language_prompt = "원본 텍스트와 동일한 언어로 키워드를 추출해주세요."
+        else:
+            target_language = LANGUAGE_NAMES.get(language)
+            if target_language:
+                language_prompt = f"{target_language}로 키워드를 추출해주세요."
+            else:
+                # 지원하지 않는 언어 코드인 경우 영어로 대체
+                language_prompt = "영어로 키워드를 추출해주세요."
+        
+        return language_prompt
+    
+    def _build_summary_messages(self, text, length="medium", format="paragraph", language="auto"):
+        """요약 요청 메시지 구성
+        
+        Args:
+            text (str): 요약할 텍스트
+            length (str): 요약 길이 ("short", "medium", "long")
+            format (str): 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        
+        Returns:
+            list: Chat Completions API에 전달할 메시지 목록
+        """
+        length_prompt, format_prompt, language_prompt = self._summary_option_prompts(length, format, language)
+        
         # 프롬프트 구성
         prompt = f"""
         다음 텍스트를 요약해주세요:
@@ -125,79 +319,23 @@ class OpenAIClient:
         4. 요약 결과는 사용자가 바로 사용할 수 있는 깔끔한 텍스트여야 합니다.
         """
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 전문적인 콘텐츠 요약 도구입니다. 주어진 텍스트를 명확하고 간결하게 요약하는 것이 당신의 임무입니다. 제목이나 레이블 없이 요약 내용만 직접 제공하세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1000,
-                temperature=0.3,
-            )
-            
-            return response.choices[0].message.content.strip()
-        
-        except Exception as e:
-            return f"요약 중 오류가 발생했습니다: {str(e)}"
+        return [
+            {"role": "system", "content": "당신은 전문적인 콘텐츠 요약 도구입니다. 주어진 텍스트를 명확하고 간결하게 요약하는 것이 당신의 임무입니다. 제목이나 레이블 없이 요약 내용만 직접 제공하세요."},
+            {"role": "user", "content": prompt}
+        ]
     
-    def extract_keywords(self, text, count=10, language="auto"):
-        """텍스트에서 키워드 추출
+    def _build_keywords_messages(self, text, count=10, language="auto"):
+        """키워드 추출 요청 메시지 구성
         
         Args:
             text (str): 키워드를 추출할 텍스트
             count (int): 추출할 키워드 수
             language (str): 키워드 언어 ("auto", "ko", "en", "ja", "zh" 등)
-            
+        
         Returns:
-            list: 추출된 키워드 목록
+            list: Chat Completions API에 전달할 메시지 목록
         """
-        if not text:
-            return ["키워드를 추출할 텍스트가 없습니다."]
-        
-        # 언어 설정에 따른 프롬프트 조정
-        language_prompt = ""
-        if language == "auto":
-            language_prompt = "원본 텍스트와 동일한 언어로 키워드를 추출해주세요."
-        else:
-            language_map = {
-                "ko": "한국어",
-                "en": "영어",
-                "ja": "일본어",
-                "zh": "중국어",
-                "es": "스페인어",
-                "fr": "프랑스어",
-                "de": "독일어",
-                "ru": "러시아어",
-                "pt": "포르투갈어",
-                "it": "이탈리아어",
-                "nl": "네덜란드어",
-                "ar": "아랍어",
-                "hi": "힌디어",
-                "vi": "베트남어",
-                "th": "태국어",
-                "id": "인도네시아어",
-                "tr": "터키어",
-                "pl": "폴란드어",
-                "sv": "스웨덴어",
-                "da": "덴마크어",
-                "fi": "핀란드어",
-                "no": "노르웨이어",
-                "cs": "체코어",
-                "hu": "헝가리어",
-                "el": "그리스어",
-                "he": "히브리어",
-                "ro": "루마니아어",
-                "uk": "우크라이나어",
-                "fa": "페르시아어",
-                "ms": "말레이어"
-            }
-            target_language = language_map.get(language)
-            if target_language:
-                language_prompt = f"{target_language}로 키워드를 추출해주세요."
-            else:
-                # 지원하지 않는 언어 코드인 경우 영어로 대체
-                language_prompt = "영어로 키워드를 추출해주세요."
+        language_prompt = self._keywords_language_prompt(language)
         
         prompt = f"""
         다음 텍스트에서 가장 중요한 키워드 {count}개를 추출해주세요:
@@ -213,132 +351,48 @@ class OpenAIClient:
         4. 각 키워드는 1-3단어로 구성된 간결한 형태여야 합니다.
         """
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 텍스트 분석 전문가입니다. 주어진 텍스트에서 가장 중요한 키워드를 추출하는 것이 당신의 임무입니다. 제목이나 레이블 없이 키워드만 쉼표로 구분하여 제공하세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=100,
-                temperature=0.3,
-            )
-            
-            keywords_text = response.choices[0].message.content.strip()
-            keywords = [k.strip() for k in keywords_text.split(',')]
-            return keywords
-        
-        except Exception as e:
-            return [f"키워드 추출 중 오류가 발생했습니다: {str(e)}"]
+        return [
+            {"role": "system", "content": "당신은 텍스트 분석 전문가입니다. 주어진 텍스트에서 가장 중요한 키워드를 추출하는 것이 당신의 임무입니다. 제목이나 레이블 없이 키워드만 쉼표로 구분하여 제공하세요."},
+            {"role": "user", "content": prompt}
+        ]
     
-    def detect_language(self, text):
-        """텍스트의 언어 감지
+    def _build_language_messages(self, text):
+        """언어 감지 요청 메시지 구성
         
         Args:
             text (str): 언어를 감지할 텍스트
-            
+        
         Returns:
-            str: 감지된 언어 코드 ("ko", "en", "ja", "zh" 등)
+            list: Chat Completions API에 전달할 메시지 목록
         """
-        if not text:
-            return "en"  # 기본값은 영어로 변경
-        
-        # 언어 감지를 위한 짧은 샘플 텍스트 추출 (최대 500자)
-        sample_text = text[:500]
+        # 언어 감지를 위한 짧은 샘플 텍스트 추출 (문서 전체에서 최대 500자)
+        sample = sample_text(text, 500)
         
         prompt = f"""
         다음 텍스트의 언어를 감지해주세요:
         
-        {sample_text}
+        {sample}
         
         언어 코드만 반환해주세요. 다음 중 하나여야 합니다:
         ko, en, ja, zh, es, fr, de, ru, pt, it, nl, ar, hi, vi, th, id, tr, pl, sv, da, fi, no, cs, hu, el, he, ro, uk, fa, ms
         """
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 언어 감지 전문가입니다. 주어진 텍스트의 언어를 정확하게 감지하는 것이 당신의 임무입니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=10,
-                temperature=0.1,
-            )
-            
-            detected_language = response.choices[0].message.content.strip().lower()
-            
-            # 언어 코드 정규화
-            language_map = {
-                "korean": "ko",
-                "english": "en",
-                "japanese": "ja",
-                "chinese": "zh",
-                "spanish": "es",
-                "french": "fr",
-                "german": "de",
-                "russian": "ru",
-                "portuguese": "pt",
-                "italian": "it",
-                "dutch": "nl",
-                "arabic": "ar",
-                "hindi": "hi",
-                "vietnamese": "vi",
-                "thai": "th",
-                "indonesian": "id",
-                "turkish": "tr",
-                "polish": "pl",
-                "swedish": "sv",
-                "danish": "da",
-                "finnish": "fi",
-                "norwegian": "no",
-                "czech": "cs",
-                "hungarian": "hu",
-                "greek": "el",
-                "hebrew": "he",
-                "romanian": "ro",
-                "ukrainian": "uk",
-                "persian": "fa",
-                "malay": "ms"
-            }
-            
-            # 지원하는 언어 코드 목록
-            supported_codes = [
-                "ko", "en", "ja", "zh", "es", "fr", "de", "ru", "pt", "it", "nl", 
-                "ar", "hi", "vi", "th", "id", "tr", "pl", "sv", "da", "fi", "no", 
-                "cs", "hu", "el", "he", "ro", "uk", "fa", "ms"
-            ]
-            
-            # 언어 코드가 이미 지원하는 코드인 경우 그대로 반환
-            if detected_language in supported_codes:
-                return detected_language
-            
-            # 언어 이름이 반환된 경우 코드로 변환
-            return language_map.get(detected_language, "en")  # 기본값을 영어로 변경
-        
-        except Exception as e:
-            print(f"언어 감지 중 오류가 발생했습니다: {str(e)}")
-            return "en"  # 오류 발생 시 기본값은 영어로 변경
+        return [
+            {"role": "system", "content": "당신은 언어 감지 전문가입니다. 주어진 텍스트의 언어를 정확하게 감지하는 것이 당신의 임무입니다."},
+            {"role": "user", "content": prompt}
+        ]
     
-    def filter_web_content(self, text, title, url):
-        """웹 스크래핑 콘텐츠에서 주요 내용만 필터링
+    def _build_filter_messages(self, text, title, url):
+        """웹 콘텐츠 필터링 요청 메시지 구성
         
         Args:
             text (str): 필터링할 원본 텍스트
             title (str): 웹 페이지 제목
             url (str): 웹 페이지 URL
-            
+        
         Returns:
-            str: 필터링된 텍스트
+            list: Chat Completions API에 전달할 메시지 목록
         """
-        if not text:
-            return "필터링할 콘텐츠가 없습니다."
-        
-        # 텍스트가 너무 길면 토큰 제한에 걸릴 수 있으므로 적절히 잘라냄
-        # 약 8000자 정도로 제한 (GPT-4o-mini의 토큰 제한 고려)
-        if len(text) > 8000:
-            text = text[:8000]
-        
         prompt = f"""
         다음은 '{url}' 웹사이트에서 스크래핑한 콘텐츠입니다. 제목은 '{title}'입니다.
         이 콘텐츠에서 주요 내용만 추출하고, 다음과 같은 불필요한 요소를 모두 제거해주세요:
@@ -361,17 +415,508 @@ class OpenAIClient:
         {text}
         """
         
+        return [
+            {"role": "system", "content": "당신은 웹 콘텐츠에서 주요 내용만 추출하는 전문가입니다. 불필요한 요소를 제거하고 핵심 내용만 깔끔하게 정리해주세요."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _build_analysis_messages(self, text, length="medium", format="paragraph", language="auto", keyword_count=10):
+        """통합 분석(요약, 키워드, 언어 감지) 요청 메시지 구성
+        
+        Args:
+            text (str): 분석할 텍스트
+            length (str): 요약 길이 ("short", "medium", "long")
+            format (str): 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 및 키워드 언어 ("auto", "ko", "en", "ja", "zh" 등)
+            keyword_count (int): 추출할 키워드 수
+        
+        Returns:
+            list: Chat Completions API에 전달할 메시지 목록
+        """
+        length_prompt, format_prompt, language_prompt = self._summary_option_prompts(length, format, language)
+        keywords_language_prompt = self._keywords_language_prompt(language)
+        
+        prompt = f"""
+        다음 텍스트를 분석하여 요약, 키워드, 언어를 한 번에 제공해주세요:
+        
+        {text}
+        
+        요약 조건:
+        {length_prompt}
+        {format_prompt}
+        {language_prompt}
+        주요 키워드와 핵심 아이디어를 포함해주세요.
+        
+        키워드 조건:
+        가장 중요한 키워드 {keyword_count}개를 추출해주세요.
+        {keywords_language_prompt}
+        각 키워드는 1-3단어로 구성된 간결한 형태여야 합니다.
+        
+        응답은 다음 키를 가진 JSON 객체여야 합니다:
+        - "summary": 요약 문자열
+        - "keywords": 키워드 문자열 배열
+        - "language": 원본 텍스트의 언어 코드 (ko, en, ja, zh, es, fr, de, ru, pt, it, nl, ar, hi, vi, th, id, tr, pl, sv, da, fi, no, cs, hu, el, he, ro, uk, fa, ms 중 하나)
+        
+        중요:
+        1. 요약과 키워드에 "Summary:", "요약:", "Keywords:", "키워드:" 등의 제목이나 레이블을 포함하지 마세요.
+        2. 별표(**)나 기타 마크다운 형식을 사용하지 마세요.
+        3. JSON 객체 외의 다른 내용은 출력하지 마세요.
+        """
+        
+        return [
+            {"role": "system", "content": "당신은 전문적인 콘텐츠 분석 도구입니다. 주어진 텍스트를 요약하고 키워드와 언어를 분석하여 JSON 객체로만 응답하세요."},
+            {"role": "user", "content": prompt}
+        ]
+    
+    @staticmethod
+    def _summary_max_tokens(length):
+        """요약 길이에 맞는 응답 최대 토큰 수"""
+        return SUMMARY_MAX_OUTPUT_TOKENS.get(length, SUMMARY_MAX_OUTPUT_TOKENS["medium"])
+    
+    @staticmethod
+    def _keywords_max_tokens(count):
+        """키워드 수에 맞는 응답 최대 토큰 수"""
+        return min(MAX_OUTPUT_TOKENS, 10 + max(1, count) * KEYWORD_OUTPUT_TOKENS)
+    
+    @staticmethod
+    def _input_token_budget(max_tokens):
+        """응답 토큰과 프롬프트 지시문을 제외하고 입력 텍스트에 쓸 수 있는 토큰 수"""
+        return MAX_TOKENS - max_tokens - PROMPT_RESERVED_TOKENS
+    
+    def _fit_to_budget(self, text, max_tokens):
+        """입력 텍스트를 모델 컨텍스트 윈도우에 들어가도록 자름
+        
+        Args:
+            text (str): 원본 텍스트
+            max_tokens (int): 요청할 응답 최대 토큰 수
+        
+        Returns:
+            str: 예산 안으로 잘린 텍스트
+        """
+        return truncate_to_tokens(text, self._input_token_budget(max_tokens))
+    
+    @staticmethod
+    def _truncate_web_content(text):
+        """필터링 요청에 넣을 웹 콘텐츠를 토큰 예산에 맞게 제한
+        
+        글자 수가 아닌 토큰 수 기준으로 자르므로 한국어, 일본어처럼 글자당 토큰이
+        많은 언어와 영어처럼 적은 언어 모두 같은 예산을 사용합니다.
+        
+        Args:
+            text (str): 원본 텍스트
+        
+        Returns:
+            str: 길이가 제한된 텍스트
+        """
+        return truncate_to_tokens(text, FILTER_INPUT_MAX_TOKENS)
+    
+    @staticmethod
+    def _filter_max_tokens(text):
+        """필터링 응답 최대 토큰 수 (필터링 결과는 입력보다 길지 않음)"""
+        return max(256, min(FILTER_MAX_OUTPUT_TOKENS, estimate_tokens(text)))
+    
+    def _exceeds_summary_budget(self, text, length):
+        """한 번의 요청으로 요약하기에 입력이 너무 긴지 확인 (예산을 넘는 앞부분까지만 계산)"""
+        budget = self._input_token_budget(self._summary_max_tokens(length))
+        return len(truncate_to_tokens(text, budget)) < len(text)
+    
+    @staticmethod
+    def _chunk_for_summary(text):
+        """분할 요약을 위해 텍스트를 토큰 수 기준 청크로 나눔"""
+        return chunk_text(text, CHUNK_MAX_TOKENS, measure=estimate_tokens)
+    
+    @staticmethod
+    def _iter_summary_chunks(blocks):
+        """텍스트 블록 이터레이터에서 토큰 수 기준 청크를 만드는 대로 생성"""
+        return iter_chunks(blocks, CHUNK_MAX_TOKENS, measure=estimate_tokens)
+    
+    def _next_level_chunks(self, partial_summaries, previous_count):
+        """부분 요약을 합쳐 다음 단계(reduce)의 청크 구성
+        
+        Args:
+            partial_summaries (list): 이전 단계의 부분 요약 목록
+            previous_count (int): 이전 단계의 청크 수
+        
+        Returns:
+            list: 다음 단계 청크 목록 (하나면 최종 요약 단계)
+        """
+        combined = "\n\n".join(partial_summaries)
+        chunks = self._chunk_for_summary(combined)
+        # 부분 요약이 줄어들지 않는 경우 무한 반복을 막기 위해 하나로 합침
+        if len(chunks) >= previous_count:
+            return [combined]
+        return chunks
+    
+    @staticmethod
+    def _detect_language_locally(text):
+        """로컬 감지기로 언어 감지
+        
+        Args:
+            text (str): 언어를 감지할 텍스트
+        
+        Returns:
+            str: 감지된 언어 코드 (신뢰도가 낮으면 None)
+        """
+        with span("language.local"):
+            result = get_language_detector().detect(text)
+        if result.language and result.confidence >= LANGUAGE_DETECTION_MIN_CONFIDENCE:
+            return result.language
+        return None
+    
+    @staticmethod
+    def _parse_keywords(content):
+        """쉼표로 구분된 키워드 응답을 목록으로 변환
+        
+        Args:
+            content (str): 모델 응답 텍스트
+        
+        Returns:
+            list: 키워드 목록
+        """
+        keywords_text = content.strip()
+        return [k.strip() for k in keywords_text.split(',')]
+    
+    @staticmethod
+    def _parse_analysis(content):
+        """통합 분석 JSON 응답 해석
+        
+        Args:
+            content (str): 모델 응답 텍스트
+        
+        Returns:
+            dict: summary, keywords, language 키를 가진 분석 결과 (language는 없을 수 있음)
+        """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 웹 콘텐츠에서 주요 내용만 추출하는 전문가입니다. 불필요한 요소를 제거하고 핵심 내용만 깔끔하게 정리해주세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1500,
-                temperature=0.3,
+            data = json.loads(content)
+        except ValueError:
+            # JSON 형식이 아닌 경우 전체 응답을 요약으로 간주
+            return {"summary": content.strip(), "keywords": [], "language": None}
+        
+        if not isinstance(data, dict):
+            return {"summary": content.strip(), "keywords": [], "language": None}
+        
+        keywords = data.get("keywords") or []
+        if isinstance(keywords, str):
+            keywords = OpenAIClient._parse_keywords(keywords)
+        else:
+            keywords = [str(keyword).strip() for keyword in keywords if str(keyword).strip()]
+        
+        language = data.get("language")
+        
+        return {
+            "summary": str(data.get("summary") or "").strip(),
+            "keywords": keywords,
+            "language": OpenAIClient._parse_language(str(language)) if language else None
+        }
+    
+    @staticmethod
+    def _parse_language(content):
+        """언어 감지 응답을 지원하는 언어 코드로 정규화
+        
+        Args:
+            content (str): 모델 응답 텍스트
+        
+        Returns:
+            str: 언어 코드
+        """
+        detected_language = content.strip().lower()
+        
+        # 언어 코드가 이미 지원하는 코드인 경우 그대로 반환
+        if detected_language in SUPPORTED_LANGUAGE_CODES:
+            return detected_language
+        
+        # 언어 이름이 반환된 경우 코드로 변환
+        return LANGUAGE_CODES_BY_NAME.get(detected_language, "en")  # 기본값을 영어로 변경
+    
+    def summarize_text(self, text, length="medium", format="paragraph", language="auto"):
+        """텍스트 요약 기능
+        
+        Args:
+            text (str): 요약할 텍스트
+            length (str): 요약 길이 ("short", "medium", "long")
+            format (str): 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        
+        Returns:
+            str: 요약된 텍스트
+        """
+        if not text:
+            return "요약할 텍스트가 없습니다."
+        
+        # 컨텍스트 윈도우를 넘는 입력은 분할 요약으로 처리
+        if self._exceeds_summary_budget(text, length):
+            return self.summarize_chunked(text, length, format, language)
+        
+        try:
+            return self._request_summary(text, length, format, language)
+        
+        except Exception as e:
+            return f"요약 중 오류가 발생했습니다: {str(e)}"
+    
+    def summarize_chunked(self, text, length="medium", format="paragraph", language="auto"):
+        """긴 문서 분할 요약 (map-reduce)
+        
+        문단/문장 경계로 나눈 청크를 동시에 요약한 뒤, 부분 요약을 다시 합쳐
+        하나의 청크에 들어갈 때까지 계층적으로 요약합니다.
+        
+        Args:
+            text (str): 요약할 텍스트
+            length (str): 최종 요약 길이 ("short", "medium", "long")
+            format (str): 최종 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        
+        Returns:
+            str: 요약된 텍스트
+        """
+        if not text:
+            return "요약할 텍스트가 없습니다."
+        
+        return self.summarize_blocks([text], length, format, language)
+    
+    def summarize_blocks(self, blocks, length="medium", format="paragraph", language="auto"):
+        """텍스트 블록 이터레이터 분할 요약 (map-reduce)
+        
+        FileHandler.iter_file처럼 페이지 단위로 추출되는 문서에서 청크가 만들어지는 대로
+        부분 요약을 시작하므로 문서 추출과 요약이 겹쳐 진행됩니다.
+        
+        Args:
+            blocks (iterable): 텍스트 블록 이터레이터 (블록 경계는 문단 경계로 취급)
+            length (str): 최종 요약 길이 ("short", "medium", "long")
+            format (str): 최종 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 결과 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        
+        Returns:
+            str: 요약된 텍스트
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=CHUNK_MAX_WORKERS) as executor:
+                combined = self._reduce_blocks(executor, blocks, language)
+            if combined is None:
+                return "요약할 텍스트가 없습니다."
+            
+            return self._request_summary(combined, length, format, language)
+        
+        except Exception as e:
+            return f"요약 중 오류가 발생했습니다: {str(e)}"
+    
+    def _reduce_blocks(self, executor, blocks, language):
+        """분할 요약의 map/reduce 단계를 수행해 최종 요약에 넣을 청크 하나를 만듦
+        
+        추출이 요약보다 너무 앞서 나가지 않도록 진행 중인 부분 요약은 CHUNK_MAX_WORKERS의 두 배까지만 유지합니다.
+        
+        Args:
+            executor (ThreadPoolExecutor): 부분 요약을 실행할 스레드 풀
+            blocks (iterable): 텍스트 블록 이터레이터
+            language (str): 부분 요약 언어
+        
+        Returns:
+            str: 최종 요약 단계의 입력 텍스트 (청크가 하나면 원문 그대로, 텍스트가 없으면 None)
+        """
+        def summarize_chunk(chunk):
+            return self._request_summary(chunk, "medium", "paragraph", language)
+        
+        first_chunk = None
+        chunk_count = 0
+        pending = deque()
+        partial_summaries = []
+        for chunk in self._iter_summary_chunks(blocks):
+            chunk_count += 1
+            # 청크가 하나뿐이면 부분 요약 없이 바로 최종 요약하므로 두 번째 청크가 나올 때까지 보류
+            if chunk_count == 1:
+                first_chunk = chunk
+                continue
+            if first_chunk is not None:
+                pending.append(executor.submit(summarize_chunk, first_chunk))
+                first_chunk = None
+            pending.append(executor.submit(summarize_chunk, chunk))
+            while len(pending) > CHUNK_MAX_WORKERS * 2:
+                partial_summaries.append(pending.popleft().result())
+        partial_summaries.extend(future.result() for future in pending)
+        
+        if chunk_count <= 1:
+            return first_chunk
+        
+        chunks = self._next_level_chunks(partial_summaries, chunk_count)
+        while len(chunks) > 1:
+            partial_summaries = list(executor.map(summarize_chunk, chunks))
+            chunks = self._next_level_chunks(partial_summaries, len(chunks))
+        return chunks[0]
+    
+    def _request_summary(self, text, length, format, language):
+        """요약 API 호출 (캐시 사용, 오류 시 예외 발생)
+        
+        Returns:
+            str: 요약된 텍스트
+        """
+        cache_key = self._summary_cache_key(text, length, format, language)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        max_tokens = self._summary_max_tokens(length)
+        messages = self._build_summary_messages(self._fit_to_budget(text, max_tokens), length, format, language)
+        response = self._create_completion("summary", messages, max_tokens)
+        
+        summary = response.choices[0].message.content.strip()
+        self._set_cached(cache_key, summary)
+        return summary
+    
+    def extract_keywords(self, text, count=10, language="auto"):
+        """텍스트에서 키워드 추출
+        
+        Args:
+            text (str): 키워드를 추출할 텍스트
+            count (int): 추출할 키워드 수
+            language (str): 키워드 언어 ("auto", "ko", "en", "ja", "zh" 등)
+        
+        Returns:
+            list: 추출된 키워드 목록
+        """
+        if not text:
+            return ["키워드를 추출할 텍스트가 없습니다."]
+        
+        cache_key = self._keywords_cache_key(text, count, language)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        max_tokens = self._keywords_max_tokens(count)
+        messages = self._build_keywords_messages(self._fit_to_budget(text, max_tokens), count, language)
+        
+        try:
+            response = self._create_completion("keywords", messages, max_tokens)
+            
+            keywords = self._parse_keywords(response.choices[0].message.content)
+            self._set_cached(cache_key, keywords)
+            return keywords
+        
+        except Exception as e:
+            return [f"키워드 추출 중 오류가 발생했습니다: {str(e)}"]
+    
+    def analyze_text(self, text, length="medium", format="paragraph", language="auto", keyword_count=10):
+        """요약, 키워드 추출, 언어 감지를 한 번의 요청으로 수행
+        
+        Args:
+            text (str): 분석할 텍스트
+            length (str): 요약 길이 ("short", "medium", "long")
+            format (str): 요약 형식 ("bullet", "paragraph", "structured")
+            language (str): 요약 및 키워드 언어 ("auto", "ko", "en", "ja", "zh" 등)
+            keyword_count (int): 추출할 키워드 수
+        
+        Returns:
+            dict: summary(str), keywords(list), detected_language(str) 키를 가진 분석 결과
+        """
+        if not text:
+            return {"summary": "분석할 텍스트가 없습니다.", "keywords": [], "detected_language": None}
+        
+        cache_key = self._analysis_cache_key(text, length, format, language, keyword_count)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        max_tokens = self._summary_max_tokens(length) + self._keywords_max_tokens(keyword_count) + LANGUAGE_OUTPUT_TOKENS
+        messages = self._build_analysis_messages(
+            self._fit_to_budget(text, max_tokens), length, format, language, keyword_count
+        )
+        
+        try:
+            response = self._create_completion(
+                "analysis", messages, max_tokens, response_format={"type": "json_object"}
             )
             
+            analysis = self._build_analysis_result(text, response.choices[0].message.content)
+            self._set_cached(cache_key, analysis)
+            return analysis
+        
+        except Exception as e:
+            return {"summary": f"분석 중 오류가 발생했습니다: {str(e)}", "keywords": [], "detected_language": None}
+    
+    def _build_analysis_result(self, text, content):
+        """모델 응답으로 통합 분석 결과 구성
+        
+        로컬 감지기의 신뢰도가 충분하면 그 결과를, 아니면 모델이 판단한 언어를 사용합니다.
+        
+        Args:
+            text (str): 분석한 텍스트
+            content (str): 모델 응답 텍스트
+        
+        Returns:
+            dict: summary, keywords, detected_language 키를 가진 분석 결과
+        """
+        parsed = self._parse_analysis(content)
+        return {
+            "summary": parsed["summary"],
+            "keywords": parsed["keywords"],
+            "detected_language": self._detect_language_locally(text) or parsed["language"] or "en"
+        }
+    
+    def detect_language(self, text):
+        """텍스트의 언어 감지
+        
+        Args:
+            text (str): 언어를 감지할 텍스트
+        
+        Returns:
+            str: 감지된 언어 코드 ("ko", "en", "ja", "zh" 등)
+        """
+        if not text:
+            return "en"  # 기본값은 영어로 변경
+        
+        # 로컬 감지기로 먼저 판별하고, 신뢰도가 낮을 때만 LLM 사용
+        local_language = self._detect_language_locally(text)
+        if local_language:
+            return local_language
+        
+        messages = self._build_language_messages(text)
+        
+        try:
+            response = self._create_completion("language", messages, LANGUAGE_OUTPUT_TOKENS, temperature=0.1)
+            
+            return self._parse_language(response.choices[0].message.content)
+        
+        except Exception as e:
+            print(f"언어 감지 중 오류가 발생했습니다: {str(e)}")
+            return "en"  # 오류 발생 시 기본값은 영어로 변경
+    
+    def detect_languages(self, texts):
+        """여러 텍스트의 언어를 한 번에 감지
+        
+        로컬 감지기로 일괄 판별한 뒤 신뢰도가 낮은 텍스트만 LLM으로 다시 감지합니다.
+        
+        Args:
+            texts (list): 언어를 감지할 텍스트 목록
+        
+        Returns:
+            list: 감지된 언어 코드 목록 (입력 순서 유지)
+        """
+        results = get_language_detector().detect_batch(texts)
+        return [
+            result.language
+            if result.language and result.confidence >= LANGUAGE_DETECTION_MIN_CONFIDENCE
+            else self.detect_language(text)
+            for text, result in zip(texts, results)
+        ]
+    
+    def filter_web_content(self, text, title, url):
+        """웹 스크래핑 콘텐츠에서 주요 내용만 필터링
+        
+        Args:
+            text (str): 필터링할 원본 텍스트
+            title (str): 웹 페이지 제목
+            url (str): 웹 페이지 URL
+        
+        Returns:
+            str: 필터링된 텍스트
+        """
+        if not text:
+            return "필터링할 콘텐츠가 없습니다."
+        
+        text = self._truncate_web_content(text)
+        messages = self._build_filter_messages(text, title, url)
+        
+        try:
+            response = self._create_completion("filter", messages, self._filter_max_tokens(text))
+            
             filtered_content = response.choices[0].message.content.strip()
             return filtered_content
         
@@ -3,7 +3,7 @@ import os
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QLabel, QPushButton, QTextEdit, QComboBox, QFileDialog, 
-    QTabWidget, QSplitter, QMessageBox, QProgressBar, QStatusBar
+    QTabWidget, QSplitter, QMessageBox, QProgressBar, QStatusBar, QCheckBox
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QIcon
@@ -23,17 +23,21 @@ class SummarizeThread(QThread):
     finished = pyqtSignal(str)  # 요약 완료 시그널
     error = pyqtSignal(str)     # 오류 발생 시그널
     
-    def __init__(self, text, length="medium", format="paragraph", language="auto"):
+    def __init__(self, text, length="medium", format="paragraph", language="auto", chunked=False):
         super().__init__()
         self.text = text
         self.length = length
         self.format = format
         self.language = language
+        self.chunked = chunked  # 긴 문서 분할 요약 여부
         self.client = OpenAIClient()
     
     def run(self):
         try:
-            summary = self.client.summarize_text(self.text, self.length, self.format, self.language)
+            if self.chunked:
+                summary = self.client.summarize_chunked(self.text, self.length, self.format, self.language)
+            else:
+                summary = self.client.summarize_text(self.text, self.length, self.format, self.language)
             self.finished.emit(summary)
         except Exception as e:
             self.error.emit(str(e))
@@ -134,6 +138,11 @@ class MainWindow(QMainWindow):
         self.default_format = "paragraph"
         self.default_language = "auto"
         
+        # 긴 문서 분할 요약 옵션 (끄면 모델 컨텍스트 윈도우를 넘는 입력만 분할 요약)
+        self.chunked_checkbox = QCheckBox("긴 문서 분할 요약")
+        self.chunked_checkbox.setToolTip("문서를 여러 부분으로 나누어 요약한 뒤 합칩니다. 요청 수가 늘어나 비용과 시간이 더 듭니다.")
+        input_layout.addWidget(self.chunked_checkbox)
+        
         # 요약 버튼
         self.summarize_button = QPushButton("요약하기")
         self.summarize_button.clicked.connect(self.summarize_text)
@@ -268,6 +277,7 @@ class MainWindow(QMainWindow):
         length = self.default_length
         format = self.default_format
         language = self.default_language
+        chunked = self.chunked_checkbox.isChecked()
         
         # UI 상태 업데이트
         self.summarize_button.setEnabled(False)
@@ -275,7 +285,7 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("요약 중...")
         
         # 요약 스레드 시작
-        self.summarize_thread = SummarizeThread(text, length, format, language)
+        self.summarize_thread = SummarizeThread(text, length, format, language, chunked)
         self.summarize_thread.finished.connect(self.on_summarize_finished)
         self.summarize_thread.error.connect(self.on_summarize_error)
         self.summarize_thread.start()
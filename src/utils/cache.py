@@ -0,0 +1,452 @@
+import os
+import re
+import json
+import time
+import asyncio
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+
+# 캐시 키 계산 시 공백 차이를 무시하기 위한 패턴
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def normalize_text(text):
+    """캐시 키 계산을 위한 텍스트 정규화
+    
+    유니코드 NFC 정규화 후 연속된 공백을 하나로 합치고 양 끝 공백을 제거합니다.
+    
+    Args:
+        text (str): 원본 텍스트
+    
+    Returns:
+        str: 정규화된 텍스트
+    """
+    text = unicodedata.normalize('NFC', text)
+    return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+def make_cache_key(kind, text, *params):
+    """콘텐츠 주소 기반 캐시 키 생성
+    
+    Args:
+        kind (str): 작업 종류 ("summary", "keywords" 등)
+        text (str): 입력 텍스트 (정규화 후 해시에 포함)
+        *params: 결과에 영향을 주는 추가 매개변수 (길이, 형식, 언어, 모델 등)
+    
+    Returns:
+        str: SHA-256 16진수 문자열
+    """
+    payload = json.dumps([kind, normalize_text(text), *params], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+class DiskStore:
+    """캐시 항목을 디렉토리에 JSON 파일로 저장하는 디스크 계층"""
+    
+    def __init__(self, directory, max_bytes):
+        """디스크 저장소 초기화
+        
+        Args:
+            directory (Path): 캐시 파일을 저장할 디렉토리
+            max_bytes (int): 디스크 계층 최대 크기 (바이트)
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.total_bytes = sum(path.stat().st_size for path in self._iter_files())
+    
+    def _iter_files(self):
+        return self.directory.glob('*/*.json')
+    
+    def _path(self, key):
+        # 한 디렉토리에 파일이 몰리지 않도록 키 앞 두 글자로 분산
+        return self.directory / key[:2] / f"{key}.json"
+    
+    def get(self, key):
+        """저장된 항목 반환
+        
+        Returns:
+            tuple: (만료 시각, 값) 또는 항목이 없으면 None
+        """
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as file:
+                entry = json.load(file)
+            return entry["expires_at"], entry["value"]
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def set(self, key, value, expires_at):
+        """항목 저장 후 최대 크기를 넘으면 오래된 파일부터 삭제"""
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        data = json.dumps({"expires_at": expires_at, "value": value}, ensure_ascii=False).encode('utf-8')
+        
+        previous_size = path.stat().st_size if path.exists() else 0
+        # 다른 스레드/프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
+        
+        self.total_bytes += len(data) - previous_size
+        if self.total_bytes > self.max_bytes:
+            self._evict()
+    
+    def delete(self, key):
+        path = self._path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+            self.total_bytes -= size
+        except OSError:
+            pass
+    
+    def _evict(self):
+        """수정 시각이 오래된 파일부터 지워 최대 크기의 90% 이하로 줄임"""
+        files = []
+        for path in self._iter_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+        
+        total = sum(size for _, size, _ in files)
+        target = self.max_bytes * 0.9
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+        self.total_bytes = total
+    
+    def clear(self):
+        for path in list(self._iter_files()):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self.total_bytes = 0
+
+class SqliteStore:
+    """캐시 항목을 SQLite 파일(WAL 모드) 하나에 저장하는 디스크 계층
+    
+    여러 워커 프로세스가 같은 파일을 열어 캐시를 공유합니다. WAL 모드에서는 읽기가 쓰기를 기다리지 않으며,
+    전체 크기는 프로세스마다 따로 세지 않고 데이터베이스에서 계산하므로 워커 수와 관계없이 한도가 지켜집니다.
+    DiskStore와 같은 인터페이스를 제공합니다.
+    """
+    
+    def __init__(self, path, max_bytes, timeout=5.0):
+        """SQLite 저장소 초기화
+        
+        Args:
+            path (Path): 데이터베이스 파일 경로
+            max_bytes (int): 디스크 계층 최대 크기 (바이트)
+            timeout (float): 다른 프로세스의 쓰기를 기다릴 최대 시간 (초)
+        
+        Raises:
+            sqlite3.Error: 데이터베이스를 열 수 없을 경우
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        
+        connection = self._connect()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL, stored_at REAL NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS entries_stored_at ON entries (stored_at)")
+        self._sets_since_check = 0
+    
+    def _connect(self):
+        # 스레드 풀의 각 스레드가 자기 연결을 사용 (연결 하나를 잠금으로 나눠 쓰지 않음)
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+    
+    @property
+    def total_bytes(self):
+        try:
+            return self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+    
+    def get(self, key):
+        """저장된 항목 반환
+        
+        Returns:
+            tuple: (만료 시각, 값) 또는 항목이 없으면 None
+        """
+        try:
+            row = self._connect().execute("SELECT expires_at, value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            return row[0], json.loads(row[1])
+        except (sqlite3.Error, ValueError):
+            return None
+    
+    def set(self, key, value, expires_at):
+        """항목 저장 후 최대 크기를 넘으면 오래된 항목부터 삭제
+        
+        Raises:
+            OSError: 데이터베이스에 쓸 수 없을 경우 (TieredCache가 디스크 계층 오류로 처리)
+        """
+        data = json.dumps(value, ensure_ascii=False)
+        try:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, expires_at, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data.encode('utf-8')), expires_at, time.time())
+            )
+            # 크기 합계 계산은 전체를 읽으므로 매번 하지 않음
+            self._sets_since_check += 1
+            if self._sets_since_check >= 20:
+                self._sets_since_check = 0
+                if self.total_bytes > self.max_bytes:
+                    self._evict()
+        except sqlite3.Error as e:
+            raise OSError(str(e))
+    
+    def delete(self, key):
+        try:
+            self._connect().execute("DELETE FROM entries WHERE key = ?", (key,))
+        except sqlite3.Error:
+            pass
+    
+    def _evict(self):
+        """만료된 항목과 저장 시각이 오래된 항목을 지워 최대 크기의 90% 이하로 줄임"""
+        connection = self._connect()
+        connection.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+        connection.execute(
+            "DELETE FROM entries WHERE key IN ("
+            "SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY stored_at DESC, key) AS running FROM entries) "
+            "WHERE running > ?)",
+            (self.max_bytes * 0.9,)
+        )
+    
+    def clear(self):
+        try:
+            self._connect().execute("DELETE FROM entries")
+        except sqlite3.Error:
+            pass
+
+class TieredCache:
+    """메모리 LRU 계층과 선택적 디스크 계층으로 구성된 캐시
+    
+    값은 JSON으로 직렬화할 수 있어야 합니다. 메모리 계층은 항목 수와 크기로,
+    디스크 계층은 전체 크기로 제한되며 두 계층 모두 TTL이 지나면 만료됩니다.
+    메모리 계층은 프로세스마다 따로 있고, 디스크 계층은 같은 디렉토리를 쓰는 워커 프로세스끼리 공유됩니다.
+    """
+    
+    def __init__(self, name, max_entries=1000, max_memory_bytes=32 * 1024 * 1024,
+                 ttl=24 * 60 * 60, disk_dir=None, max_disk_bytes=256 * 1024 * 1024, disk_backend="sqlite"):
+        """캐시 초기화
+        
+        Args:
+            name (str): 캐시 이름 (통계 출력용)
+            max_entries (int): 메모리 계층 최대 항목 수
+            max_memory_bytes (int): 메모리 계층 최대 크기 (바이트)
+            ttl (int): 항목 유효 시간 (초), 0 이하이면 만료되지 않음
+            disk_dir (Path): 디스크 계층 디렉토리 (None이면 메모리 계층만 사용)
+            max_disk_bytes (int): 디스크 계층 최대 크기 (바이트)
+            disk_backend (str): 디스크 계층 저장 방식 ("sqlite": SQLite 파일 하나, "files": 항목마다 JSON 파일)
+        """
+        self.name = name
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl = ttl
+        self.disk = None
+        if disk_dir is not None:
+            try:
+                if disk_backend == "sqlite":
+                    self.disk = SqliteStore(Path(disk_dir) / "cache.sqlite3", max_disk_bytes)
+                else:
+                    self.disk = DiskStore(disk_dir, max_disk_bytes)
+            except (OSError, sqlite3.Error) as e:
+                print(f"{name} 캐시 디스크 계층을 사용할 수 없습니다: {str(e)}")
+        
+        self._entries = OrderedDict()  # key -> (만료 시각, 값, 크기)
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def _expires_at(self):
+        return time.time() + self.ttl if self.ttl > 0 else None
+    
+    @staticmethod
+    def _is_expired(expires_at):
+        return expires_at is not None and expires_at <= time.time()
+    
+    def _store_in_memory(self, key, value, expires_at):
+        size = len(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+        if size > self.max_memory_bytes:
+            return
+        
+        with self._lock:
+            if key in self._entries:
+                self._memory_bytes -= self._entries.pop(key)[2]
+            self._entries[key] = (expires_at, value, size)
+            self._memory_bytes += size
+            
+            # LRU 순서대로 제거
+            while len(self._entries) > self.max_entries or self._memory_bytes > self.max_memory_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted_size
+                self.evictions += 1
+    
+    def get(self, key):
+        """캐시된 값 반환
+        
+        Args:
+            key (str): 캐시 키
+        
+        Returns:
+            캐시된 값 또는 항목이 없거나 만료되었으면 None
+        """
+        found, value = self._get_from_memory(key)
+        if found:
+            return value
+        
+        if self.disk is not None:
+            found, value = self._get_from_disk(key)
+            if found:
+                return value
+        
+        return self._record_miss()
+    
+    async def get_async(self, key):
+        """캐시된 값 반환 (비동기)
+        
+        메모리 계층은 바로 조회하고, 디스크 계층 조회는 다른 워커의 쓰기가 끝나기를
+        기다릴 수 있으므로 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다.
+        
+        Args:
+            key (str): 캐시 키
+        
+        Returns:
+            캐시된 값 또는 항목이 없거나 만료되었으면 None
+        """
+        found, value = self._get_from_memory(key)
+        if found:
+            return value
+        
+        if self.disk is not None:
+            found, value = await asyncio.to_thread(self._get_from_disk, key)
+            if found:
+                return value
+        
+        return self._record_miss()
+    
+    def _get_from_memory(self, key):
+        """메모리 계층 조회 (찾았는지 여부, 값)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._is_expired(entry[0]):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self.memory_hits += 1
+                    return True, entry[1]
+                self._memory_bytes -= self._entries.pop(key)[2]
+        return False, None
+    
+    def _get_from_disk(self, key):
+        """디스크 계층 조회 (찾았는지 여부, 값), 찾은 값은 메모리 계층에도 저장"""
+        stored = self.disk.get(key)
+        if stored is not None:
+            expires_at, value = stored
+            if not self._is_expired(expires_at):
+                self._store_in_memory(key, value, expires_at)
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                return True, value
+            self.disk.delete(key)
+        return False, None
+    
+    def _record_miss(self):
+        with self._lock:
+            self.misses += 1
+        return None
+    
+    def set(self, key, value):
+        """값을 캐시에 저장
+        
+        Args:
+            key (str): 캐시 키
+            value: JSON으로 직렬화할 수 있는 값
+        """
+        expires_at = self._expires_at()
+        self._store_in_memory(key, value, expires_at)
+        
+        if self.disk is not None:
+            self._store_on_disk(key, value, expires_at)
+    
+    async def set_async(self, key, value):
+        """값을 캐시에 저장 (비동기)
+        
+        디스크 계층 쓰기는 다른 워커의 쓰기를 기다리거나 오래된 항목을 정리할 수 있으므로
+        스레드 풀에서 실행해 이벤트 루프를 막지 않습니다.
+        
+        Args:
+            key (str): 캐시 키
+            value: JSON으로 직렬화할 수 있는 값
+        """
+        expires_at = self._expires_at()
+        self._store_in_memory(key, value, expires_at)
+        
+        if self.disk is not None:
+            await asyncio.to_thread(self._store_on_disk, key, value, expires_at)
+    
+    def _store_on_disk(self, key, value, expires_at):
+        try:
+            self.disk.set(key, value, expires_at)
+        except OSError as e:
+            print(f"{self.name} 캐시 디스크 저장 중 오류가 발생했습니다: {str(e)}")
+    
+    def clear(self):
+        """모든 항목 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self._memory_bytes = 0
+        if self.disk is not None:
+            self.disk.clear()
+    
+    def stats(self):
+        """캐시 통계 반환
+        
+        Returns:
+            dict: 적중/실패 횟수와 계층별 사용량
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "memory_entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self.disk.total_bytes if self.disk is not None else 0
+            }
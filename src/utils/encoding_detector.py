@@ -0,0 +1,55 @@
+import codecs
+
+# 인코딩 추정에 사용할 앞부분 표본 크기 (바이트)
+SAMPLE_SIZE = 64 * 1024
+
+# BOM과 해당 인코딩 (UTF-32 LE BOM은 UTF-16 LE BOM으로 시작하므로 먼저 확인)
+_BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16')
+]
+
+# 기본 인코딩으로 디코딩하지 못했을 때 사용할 인코딩 (한국어 Windows 환경의 텍스트 파일)
+FALLBACK_ENCODING = 'cp949'
+
+def detect_encoding(data):
+    """BOM과 바이트 통계로 텍스트 인코딩 추정
+    
+    앞부분 표본만 검사하므로 파일 전체를 여러 번 디코딩하지 않습니다.
+    표본이 ASCII뿐이면 UTF-8로 추정하며, 이후 부분이 UTF-8이 아니면
+    호출한 쪽에서 FALLBACK_ENCODING으로 다시 디코딩해야 합니다.
+    
+    Args:
+        data: bytes, bytearray, memoryview, mmap 등 바이트 버퍼 (앞부분만 있어도 됨)
+    
+    Returns:
+        str: 인코딩 이름 ("utf-8", "utf-8-sig", "utf-16", "utf-16-le", "utf-16-be", "utf-32", "cp949")
+    """
+    sample = bytes(data[:SAMPLE_SIZE])
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    
+    if sample.isascii():
+        # NUL 바이트가 짝수/홀수 위치 한쪽에 몰려 있으면 BOM 없는 UTF-16
+        half = len(sample) // 2
+        if half and 0 in sample:
+            even_nuls = sample[0::2].count(0)
+            odd_nuls = sample[1::2].count(0)
+            if odd_nuls > half * 0.3 and even_nuls < half * 0.05:
+                return 'utf-16-le'
+            if even_nuls > half * 0.3 and odd_nuls < half * 0.05:
+                return 'utf-16-be'
+        return 'utf-8'
+    
+    try:
+        sample.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        # 표본 끝에서 잘린 멀티바이트 문자는 UTF-8로 인정
+        if len(sample) == SAMPLE_SIZE and e.start >= len(sample) - 3 and e.reason == 'unexpected end of data':
+            return 'utf-8'
+        return FALLBACK_ENCODING
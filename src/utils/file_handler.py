@@ -1,22 +1,287 @@
+import io
 import os
-import PyPDF2
-import docx
+import mmap
+import codecs
+import hashlib
+import shutil
+import tempfile
+import threading
+import collections
+import concurrent.futures
 from pathlib import Path
-from src.config import SUPPORTED_TEXT_FORMATS, SUPPORTED_DOCUMENT_FORMATS
+from src.config import (
+    SUPPORTED_TEXT_FORMATS, SUPPORTED_DOCUMENT_FORMATS, TEMP_DIR,
+    PDF_MAX_WORKERS, PDF_PARALLEL_MIN_PAGES, PDF_PAGES_PER_TASK, TEXT_BLOCK_CHARS, TEXT_MMAP_MIN_BYTES,
+    EXTRACTION_CACHE_ENABLED, EXTRACTION_CACHE_MAX_ENTRIES, EXTRACTION_CACHE_MAX_MEMORY_BYTES,
+    EXTRACTION_CACHE_TTL, EXTRACTION_CACHE_DISK_ENABLED, EXTRACTION_CACHE_DIR, EXTRACTION_CACHE_MAX_DISK_BYTES,
+    CACHE_DISK_BACKEND
+)
+from src.utils.cache import TieredCache, make_cache_key
+from src.utils.encoding_detector import detect_encoding, FALLBACK_ENCODING
+from src.utils.text_normalizer import DOCUMENT_PIPELINE, normalize_line_endings
+from src.utils.token_estimator import estimate_tokens
+from src.utils.tracing import span
+
+# 추출 방식이 바뀌어 결과가 달라지면 값을 올려 기존 캐시 항목을 무효화
+EXTRACTOR_VERSION = "1"
+
+# 파서로 추출하는 문서 형식 (추출 결과를 캐시함)
+_PARSED_FORMATS = ('.pdf', '.docx', '.doc')
+
+def _parser_version(file_extension):
+    """문서 형식별 파서 버전 (캐시 키에 포함)
+    
+    PyPDF2와 python-docx는 가져오는 데 시간이 걸리므로 모듈을 처음 사용할 때 가져옵니다.
+    """
+    if file_extension == '.pdf':
+        import PyPDF2
+        return f"PyPDF2-{PyPDF2.__version__}"
+    import docx
+    return f"python-docx-{getattr(docx, '__version__', 'unknown')}"
+
+# 문서에서 추출한 텍스트 캐시 (파일 내용의 SHA-256 기준)
+extraction_cache = None
+if EXTRACTION_CACHE_ENABLED:
+    extraction_cache = TieredCache(
+        "extraction",
+        max_entries=EXTRACTION_CACHE_MAX_ENTRIES,
+        max_memory_bytes=EXTRACTION_CACHE_MAX_MEMORY_BYTES,
+        ttl=EXTRACTION_CACHE_TTL,
+        disk_dir=EXTRACTION_CACHE_DIR if EXTRACTION_CACHE_DISK_ENABLED else None,
+        max_disk_bytes=EXTRACTION_CACHE_MAX_DISK_BYTES,
+        disk_backend=CACHE_DISK_BACKEND
+    )
+
+_pdf_executor = None
+_pdf_executor_lock = threading.Lock()
+
+class PageRangeError(ValueError):
+    """페이지 범위 형식이 잘못된 경우 발생하는 예외"""
+
+def parse_page_range(pages, page_count):
+    """페이지 범위 문자열을 0부터 시작하는 페이지 번호 목록으로 변환
+    
+    Args:
+        pages (str): 1부터 시작하는 페이지 범위 (예: "1-5,8,10-", None이면 전체 페이지)
+        page_count (int): 문서 전체 페이지 수
+    
+    Returns:
+        list: 범위에 포함된 페이지 번호 목록 (지정한 순서, 중복 제외)
+    
+    Raises:
+        PageRangeError: 페이지 범위 형식이 잘못된 경우
+    """
+    if pages is None or not str(pages).strip():
+        return list(range(page_count))
+    
+    page_indices = []
+    seen = set()
+    for part in str(pages).split(','):
+        part = part.strip()
+        if not part:
+            continue
+        start, separator, end = part.partition('-')
+        try:
+            first = int(start) if start.strip() else 1
+            last = (int(end) if end.strip() else max(first, page_count)) if separator else first
+        except ValueError:
+            raise PageRangeError(f"잘못된 페이지 범위입니다: {part}")
+        if first < 1 or last < first:
+            raise PageRangeError(f"잘못된 페이지 범위입니다: {part}")
+        
+        for index in range(first - 1, min(last, page_count)):
+            if index not in seen:
+                seen.add(index)
+                page_indices.append(index)
+    return page_indices
+
+def file_digest(source, chunk_size=1024 * 1024):
+    """파일 내용의 SHA-256 계산
+    
+    Args:
+        source (Path or file): 파일 경로 또는 바이너리 파일 객체 (처음부터 읽은 뒤 위치를 처음으로 되돌림)
+        chunk_size (int): 한 번에 읽을 크기 (바이트)
+    
+    Returns:
+        str: SHA-256 16진수 문자열
+    """
+    digest = hashlib.sha256()
+    if isinstance(source, Path):
+        with open(source, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                digest.update(chunk)
+    else:
+        source.seek(0)
+        for chunk in iter(lambda: source.read(chunk_size), b''):
+            digest.update(chunk)
+        source.seek(0)
+    return digest.hexdigest()
+
+def preload_parsers():
+    """PyPDF2와 python-docx를 미리 가져옴 (서버 시작 시 워밍업용, 첫 문서 요청의 지연 방지)"""
+    for file_extension in ('.pdf', '.docx'):
+        _parser_version(file_extension)
+
+def _get_pdf_executor():
+    """PDF 페이지 추출용 프로세스 풀 반환 (처음 사용할 때 생성)"""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is None:
+            _pdf_executor = concurrent.futures.ProcessPoolExecutor(max_workers=PDF_MAX_WORKERS)
+        return _pdf_executor
+
+def _extract_pdf_pages(pdf_path, page_indices):
+    """PDF에서 지정한 페이지의 텍스트 추출 (프로세스 풀 작업 함수)
+    
+    Args:
+        pdf_path (str): PDF 파일 경로
+        page_indices (list): 추출할 페이지 번호 목록
+    
+    Returns:
+        list: 페이지별 텍스트
+    """
+    import PyPDF2
+    pdf_reader = PyPDF2.PdfReader(pdf_path)
+    return [pdf_reader.pages[index].extract_text() for index in page_indices]
+
+def _iter_pdf_pages_parallel(pdf_path, page_indices):
+    """페이지 묶음을 프로세스 풀에서 추출하고 문서 순서대로 페이지 텍스트 생성
+    
+    작업자 수의 두 배만큼만 미리 제출하므로, 호출한 쪽이 순회를 멈추면 나머지 페이지는 추출하지 않습니다.
+    """
+    executor = _get_pdf_executor()
+    batches = collections.deque(
+        page_indices[i:i + PDF_PAGES_PER_TASK] for i in range(0, len(page_indices), PDF_PAGES_PER_TASK)
+    )
+    pending = collections.deque()
+    try:
+        while batches or pending:
+            while batches and len(pending) < PDF_MAX_WORKERS * 2:
+                pending.append(executor.submit(_extract_pdf_pages, pdf_path, batches.popleft()))
+            for page_text in pending.popleft().result():
+                yield page_text
+    finally:
+        # 시작하지 않은 작업은 취소하고, 실행 중인 작업은 파일을 정리하기 전에 끝나기를 기다림
+        for future in pending:
+            future.cancel()
+        concurrent.futures.wait(pending)
+
+def _join_pages(page_texts, max_tokens=None):
+    """페이지 텍스트를 이어 붙이고, 토큰 예산에 도달하면 나머지 페이지는 읽지 않음
+    
+    Args:
+        page_texts (iterable): 페이지별 텍스트
+        max_tokens (int): 최대 토큰 수 (None이면 제한 없음)
+    
+    Returns:
+        str: 페이지를 빈 줄로 구분한 텍스트
+    """
+    parts = []
+    tokens = 0
+    for page_text in page_texts:
+        parts.append(page_text + "\n\n")
+        if max_tokens:
+            tokens += estimate_tokens(page_text)
+            if tokens >= max_tokens:
+                break
+    if hasattr(page_texts, 'close'):
+        page_texts.close()
+    return "".join(parts)
 
 class FileHandler:
     """파일 처리를 위한 유틸리티 클래스"""
     
     @staticmethod
-    def read_file(file_path):
+    def read_file(file_path, normalize=True, pages=None, max_tokens=None):
         """파일 경로에서 텍스트 내용을 읽어옵니다.
         
         Args:
             file_path (str): 읽을 파일의 경로
-            
+            normalize (bool): 줄바꿈 통일, 제어 문자 제거 등 텍스트 정리 여부
+            pages (str): PDF에서 추출할 페이지 범위 (예: "1-5,8", None이면 전체)
+            max_tokens (int): PDF에서 추출할 최대 토큰 수 (도달하면 나머지 페이지는 읽지 않음)
+        
         Returns:
             str: 파일의 텍스트 내용
-            
+        
+        Raises:
+            ValueError: 지원하지 않는 파일 형식일 경우
+            FileNotFoundError: 파일을 찾을 수 없을 경우
+        """
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+        
+        file_extension = file_path.suffix.lower()
+        return FileHandler._extract_cached(file_path, file_extension, normalize, pages, max_tokens)
+    
+    @staticmethod
+    def read_stream(stream, file_extension, normalize=True, pages=None, max_tokens=None):
+        """파일 객체(업로드 스트림 등)에서 텍스트 내용을 읽어옵니다.
+        
+        임시 파일에 다시 저장하지 않고 스트림에서 바로 파싱합니다.
+        
+        Args:
+            stream: 읽기와 이동(seek)이 가능한 바이너리 파일 객체
+            file_extension (str): 파일 확장자 (예: ".pdf")
+            normalize (bool): 줄바꿈 통일, 제어 문자 제거 등 텍스트 정리 여부
+            pages (str): PDF에서 추출할 페이지 범위 (예: "1-5,8", None이면 전체)
+            max_tokens (int): PDF에서 추출할 최대 토큰 수 (도달하면 나머지 페이지는 읽지 않음)
+        
+        Returns:
+            str: 파일의 텍스트 내용
+        
+        Raises:
+            ValueError: 지원하지 않는 파일 형식이거나 파일을 읽을 수 없을 경우
+        """
+        stream.seek(0)
+        return FileHandler._extract_cached(stream, file_extension.lower(), normalize, pages, max_tokens)
+    
+    @staticmethod
+    def read_bytes(data, file_extension, normalize=True, pages=None, max_tokens=None):
+        """메모리에 있는 파일 내용(bytes, memoryview 등)에서 텍스트 내용을 읽어옵니다.
+        
+        텍스트 파일은 버퍼에서 바로 디코딩하고, PDF/Word 문서는 버퍼를 파일 객체로 감싸 파싱합니다.
+        
+        Args:
+            data: 파일 내용 (bytes, bytearray, memoryview)
+            file_extension (str): 파일 확장자 (예: ".pdf")
+            normalize (bool): 줄바꿈 통일, 제어 문자 제거 등 텍스트 정리 여부
+            pages (str): PDF에서 추출할 페이지 범위 (예: "1-5,8", None이면 전체)
+            max_tokens (int): PDF에서 추출할 최대 토큰 수 (도달하면 나머지 페이지는 읽지 않음)
+        
+        Returns:
+            str: 파일의 텍스트 내용
+        
+        Raises:
+            ValueError: 지원하지 않는 파일 형식이거나 파일을 읽을 수 없을 경우
+        """
+        file_extension = file_extension.lower()
+        if file_extension in SUPPORTED_TEXT_FORMATS:
+            text = FileHandler._decode_text(data, "<bytes>")
+            return DOCUMENT_PIPELINE.run(text) if normalize else text
+        
+        # BytesIO는 bytes만 복사하지 않고 공유하며, bytearray와 memoryview는 한 번 복사함
+        return FileHandler.read_stream(io.BytesIO(data), file_extension, normalize, pages, max_tokens)
+    
+    @staticmethod
+    def iter_file(file_path, normalize=True, pages=None, max_tokens=None):
+        """파일 경로에서 텍스트를 블록 단위로 읽어옵니다.
+        
+        PDF는 페이지, Word 문서는 문단 묶음, 텍스트 파일은 빈 줄에서 나눈 줄 묶음 단위로 생성하며,
+        앞쪽 블록을 처리하는 동안 뒤쪽 블록은 아직 읽지 않으므로 긴 문서도 메모리 사용량이 일정합니다.
+        추출 결과가 캐시에 있으면 캐시된 텍스트를 한 블록으로 생성합니다.
+        
+        Args:
+            file_path (str): 읽을 파일의 경로
+            normalize (bool): 줄바꿈 통일, 제어 문자 제거 등 텍스트 정리 여부
+            pages (str): PDF에서 추출할 페이지 범위 (예: "1-5,8", None이면 전체)
+            max_tokens (int): 추출할 최대 토큰 수 (도달하면 나머지 블록은 읽지 않음)
+        
+        Returns:
+            iterator: 빈 블록을 제외한 텍스트 블록 이터레이터
+        
         Raises:
             ValueError: 지원하지 않는 파일 형식일 경우
             FileNotFoundError: 파일을 찾을 수 없을 경우
@@ -27,69 +292,384 @@ class FileHandler:
             raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
         
         file_extension = file_path.suffix.lower()
+        FileHandler._check_extension(file_extension)
+        return FileHandler._iter_blocks(file_path, file_extension, normalize, pages, max_tokens)
+    
+    @staticmethod
+    def iter_stream(stream, file_extension, normalize=True, pages=None, max_tokens=None):
+        """파일 객체(업로드 스트림 등)에서 텍스트를 블록 단위로 읽어옵니다.
+        
+        Args:
+            stream: 읽기와 이동(seek)이 가능한 바이너리 파일 객체
+            file_extension (str): 파일 확장자 (예: ".pdf")
+            normalize (bool): 줄바꿈 통일, 제어 문자 제거 등 텍스트 정리 여부
+            pages (str): PDF에서 추출할 페이지 범위 (예: "1-5,8", None이면 전체)
+            max_tokens (int): 추출할 최대 토큰 수 (도달하면 나머지 블록은 읽지 않음)
+        
+        Returns:
+            iterator: 빈 블록을 제외한 텍스트 블록 이터레이터
         
+        Raises:
+            ValueError: 지원하지 않는 파일 형식일 경우
+        """
+        file_extension = file_extension.lower()
+        FileHandler._check_extension(file_extension)
+        stream.seek(0)
+        return FileHandler._iter_blocks(stream, file_extension, normalize, pages, max_tokens)
+    
+    @staticmethod
+    def _check_extension(file_extension):
+        """지원하는 입력 형식인지 확인합니다."""
+        if file_extension not in SUPPORTED_TEXT_FORMATS + ['.pdf', '.docx', '.doc']:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_extension}")
+    
+    @staticmethod
+    def _iter_blocks(source, file_extension, normalize, pages, max_tokens):
+        """형식별 블록 이터레이터 (캐시에 있으면 캐시된 텍스트 하나)"""
+        if extraction_cache is not None and file_extension in _PARSED_FORMATS:
+            cached = extraction_cache.get(
+                FileHandler._extraction_cache_key(source, file_extension, normalize, pages, max_tokens)
+            )
+            if cached is not None:
+                if cached:
+                    yield cached
+                return
+        
+        if file_extension in SUPPORTED_TEXT_FORMATS:
+            blocks = FileHandler._iter_text_blocks(source)
+        elif file_extension == '.pdf':
+            blocks = FileHandler._iter_pdf_pages(source, pages)
+        else:
+            blocks = FileHandler._iter_docx_blocks(source)
+        
+        tokens = 0
+        try:
+            for block in blocks:
+                if normalize:
+                    block = DOCUMENT_PIPELINE.run(block)
+                if block.strip():
+                    yield block
+                if max_tokens:
+                    tokens += estimate_tokens(block)
+                    if tokens >= max_tokens:
+                        break
+        finally:
+            blocks.close()
+    
+    @staticmethod
+    def _extraction_cache_key(source, file_extension, normalize, pages, max_tokens):
+        """파일 내용 해시와 추출 옵션, 파서 버전으로 캐시 키 생성"""
+        return make_cache_key(
+            "extraction", "", file_digest(source), file_extension, normalize, pages, max_tokens,
+            EXTRACTOR_VERSION, _parser_version(file_extension)
+        )
+    
+    @staticmethod
+    def _extract_cached(source, file_extension, normalize, pages, max_tokens):
+        """문서 파일은 내용 해시로 추출 결과 캐시를 조회하고, 없을 때만 파싱합니다.
+        
+        텍스트 파일은 디코딩이 해시 계산보다 빠르므로 캐시를 사용하지 않습니다.
+        
+        Args:
+            source (Path or file): 읽을 파일의 경로 또는 바이너리 파일 객체
+            file_extension (str): 소문자 확장자
+            normalize (bool): 텍스트 정리 여부
+            pages (str): PDF에서 추출할 페이지 범위
+            max_tokens (int): PDF에서 추출할 최대 토큰 수
+        
+        Returns:
+            str: 파일의 텍스트 내용
+        """
+        cache_key = None
+        if extraction_cache is not None and file_extension in _PARSED_FORMATS:
+            with span("extract.cache"):
+                cache_key = FileHandler._extraction_cache_key(source, file_extension, normalize, pages, max_tokens)
+                cached = extraction_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        with span("extract.parse"):
+            text = FileHandler._extract_text(source, file_extension, pages, max_tokens)
+        if normalize:
+            with span("extract.normalize"):
+                text = DOCUMENT_PIPELINE.run(text)
+        
+        if cache_key is not None:
+            extraction_cache.set(cache_key, text)
+        return text
+    
+    @staticmethod
+    def _extract_text(source, file_extension, pages=None, max_tokens=None):
+        """파일 형식에 맞게 텍스트를 추출합니다.
+        
+        Args:
+            source (Path or file): 읽을 파일의 경로 또는 바이너리 파일 객체
+            file_extension (str): 소문자 확장자
+            pages (str): PDF에서 추출할 페이지 범위
+            max_tokens (int): PDF에서 추출할 최대 토큰 수
+        
+        Returns:
+            str: 정리하지 않은 텍스트 내용
+        """
         # 텍스트 파일 처리
         if file_extension in SUPPORTED_TEXT_FORMATS:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    return file.read()
-            except UnicodeDecodeError:
-                # UTF-8로 읽기 실패 시 다른 인코딩 시도
-                try:
-                    with open(file_path, 'r', encoding='cp949') as file:
-                        return file.read()
-                except UnicodeDecodeError:
-                    raise ValueError(f"파일 인코딩을 인식할 수 없습니다: {file_path}")
+            if isinstance(source, Path):
+                return FileHandler._read_text_file(source)
+            return FileHandler._decode_text(source.read(), source)
         
         # PDF 파일 처리
         elif file_extension == '.pdf':
-            return FileHandler._read_pdf(file_path)
+            return FileHandler._read_pdf(source, pages, max_tokens)
         
         # Word 문서 처리
         elif file_extension in ['.docx', '.doc']:
-            return FileHandler._read_docx(file_path)
+            return FileHandler._read_docx(source)
         
         else:
             raise ValueError(f"지원하지 않는 파일 형식입니다: {file_extension}")
     
     @staticmethod
-    def _read_pdf(file_path):
-        """PDF 파일에서 텍스트를 추출합니다.
+    def _read_text_file(file_path):
+        """텍스트 파일을 읽어 디코딩합니다.
+        
+        TEXT_MMAP_MIN_BYTES 이상인 파일은 메모리 매핑해 읽기 버퍼로 복사하지 않고
+        매핑된 페이지에서 바로 디코딩합니다.
+        
+        Args:
+            file_path (Path): 텍스트 파일 경로
+        
+        Returns:
+            str: 줄바꿈을 LF로 통일한 텍스트
+        """
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < TEXT_MMAP_MIN_BYTES:
+                return FileHandler._decode_text(file.read(), file_path)
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return FileHandler._decode_text(mapped, file_path)
+    
+    @staticmethod
+    def _decode_text(data, source):
+        """텍스트 파일 내용을 디코딩합니다.
+        
+        BOM과 앞부분 바이트 통계로 인코딩을 추정한 뒤 한 번만 디코딩하며,
+        앞부분이 ASCII뿐이어서 UTF-8로 추정했는데 실패한 경우에만 CP949로 다시 디코딩합니다.
         
         Args:
-            file_path (Path): PDF 파일 경로
+            data: 파일 내용 (bytes, memoryview, mmap 등 바이트 버퍼)
+            source (Path or file): 오류 메시지에 표시할 파일 경로 또는 파일 객체
+        
+        Returns:
+            str: 줄바꿈을 LF로 통일한 텍스트
+        """
+        encoding = detect_encoding(data)
+        try:
+            text = str(data, encoding)
+        except UnicodeDecodeError:
+            if encoding != 'utf-8':
+                raise ValueError(f"파일 인코딩을 인식할 수 없습니다: {getattr(source, 'name', source)}")
+            try:
+                text = str(data, FALLBACK_ENCODING)
+            except UnicodeDecodeError:
+                raise ValueError(f"파일 인코딩을 인식할 수 없습니다: {getattr(source, 'name', source)}")
+        # 텍스트 모드로 파일을 열었을 때와 같이 줄바꿈 통일
+        return normalize_line_endings(text)
+    
+    @staticmethod
+    def _iter_bytes(source, chunk_size=1024 * 1024):
+        """파일 경로 또는 파일 객체의 내용을 처음부터 조각 단위로 생성"""
+        if isinstance(source, Path):
+            with open(source, 'rb') as file:
+                yield from iter(lambda: file.read(chunk_size), b'')
+        else:
+            source.seek(0)
+            yield from iter(lambda: source.read(chunk_size), b'')
+    
+    @staticmethod
+    def _iter_text_blocks(source):
+        """텍스트 파일을 TEXT_BLOCK_CHARS 글자 이후의 첫 빈 줄에서 나눈 블록 단위로 생성
+        
+        빈 줄이 없으면 블록 크기의 네 배를 넘을 때 줄 끝에서 나눕니다.
+        앞부분이 ASCII뿐인 동안은 인코딩 결정을 미루고, ASCII가 아닌 바이트가 처음 나온 조각의
+        BOM과 바이트 통계로 인코딩을 추정합니다.
+        """
+        encoding = None
+        decoder = None
+        max_chars = TEXT_BLOCK_CHARS * 4
+        pending = ""
+        chunks = FileHandler._iter_bytes(source, TEXT_BLOCK_CHARS)
+        while True:
+            data = next(chunks, None)
+            final = data is None
+            data = data or b''
+            if decoder is None:
+                if not final and data.isascii() and 0 not in data:
+                    # ASCII 부분은 UTF-8과 CP949에서 같으므로 그대로 디코딩 (NUL이 있으면 BOM 없는 UTF-16일 수 있음)
+                    pending += data.decode('ascii')
+                    data = b''
+                else:
+                    encoding = detect_encoding(data)
+                    decoder = codecs.getincrementaldecoder(encoding)()
+            if decoder is not None:
+                # 디코더가 아직 디코딩하지 않고 갖고 있는 앞 조각 끝의 바이트
+                buffered = decoder.getstate()[0]
+                try:
+                    pending += decoder.decode(data, final)
+                except UnicodeDecodeError:
+                    # UTF-8로 추정했는데 뒤쪽이 UTF-8이 아닌 경우 (남은 바이트와 함께 CP949로 다시 디코딩)
+                    if encoding != 'utf-8':
+                        raise ValueError(f"파일 인코딩을 인식할 수 없습니다: {getattr(source, 'name', source)}")
+                    encoding = FALLBACK_ENCODING
+                    decoder = codecs.getincrementaldecoder(encoding)()
+                    try:
+                        pending += decoder.decode(buffered + data, final)
+                    except UnicodeDecodeError:
+                        raise ValueError(f"파일 인코딩을 인식할 수 없습니다: {getattr(source, 'name', source)}")
+            
+            # CR 뒤의 LF가 다음 조각에 있을 수 있으므로 끝의 CR은 다음 조각과 함께 처리
+            carry = '\r' if not final and pending.endswith('\r') else ''
+            pending = normalize_line_endings(pending[:len(pending) - len(carry)])
             
+            while len(pending) > TEXT_BLOCK_CHARS:
+                cut = pending.find('\n\n', TEXT_BLOCK_CHARS)
+                if cut == -1:
+                    if len(pending) < max_chars:
+                        break
+                    cut = pending.rfind('\n', 0, max_chars)
+                    if cut <= 0:
+                        cut = max_chars
+                yield pending[:cut]
+                pending = pending[cut:]
+            
+            pending += carry
+            if final:
+                break
+        
+        if pending:
+            yield pending
+    
+    @staticmethod
+    def _read_pdf(source, pages=None, max_tokens=None):
+        """PDF 파일에서 텍스트를 추출합니다.
+        
+        페이지가 많으면 페이지 묶음을 프로세스 풀에 나눠 추출하고,
+        토큰 예산에 도달하면 나머지 페이지는 추출하지 않습니다.
+        
+        Args:
+            source (Path or file): PDF 파일 경로 또는 바이너리 파일 객체
+            pages (str): 추출할 페이지 범위 (예: "1-5,8", None이면 전체)
+            max_tokens (int): 추출할 최대 토큰 수 (None이면 제한 없음)
+        
         Returns:
             str: 추출된 텍스트
+        
+        Raises:
+            PageRangeError: 페이지 범위 형식이 잘못된 경우
         """
-        text = ""
+        return _join_pages(FileHandler._iter_pdf_pages(source, pages), max_tokens)
+    
+    @staticmethod
+    def _iter_pdf_pages(source, pages=None):
+        """PDF 페이지 텍스트를 문서 순서대로 생성합니다.
+        
+        Args:
+            source (Path or file): PDF 파일 경로 또는 바이너리 파일 객체
+            pages (str): 추출할 페이지 범위 (예: "1-5,8", None이면 전체)
+        
+        Yields:
+            str: 페이지 텍스트
+        """
+        import PyPDF2
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text() + "\n\n"
-            return text
+            pdf_reader = PyPDF2.PdfReader(source)
+            page_count = len(pdf_reader.pages)
+        except Exception as e:
+            raise ValueError(f"PDF 파일을 읽는 중 오류가 발생했습니다: {str(e)}")
+        
+        page_indices = parse_page_range(pages, page_count)
+        
+        spooled_path = None
+        page_texts = None
+        try:
+            if PDF_MAX_WORKERS > 1 and len(page_indices) >= PDF_PARALLEL_MIN_PAGES:
+                # 작업 프로세스가 각자 파일을 열 수 있도록 경로 전달 (스트림은 임시 파일로 한 번만 복사)
+                if isinstance(source, Path):
+                    pdf_path = str(source)
+                else:
+                    spooled_path = FileHandler._spool_to_file(source, '.pdf')
+                    pdf_path = spooled_path
+                page_texts = _iter_pdf_pages_parallel(pdf_path, page_indices)
+            else:
+                page_texts = (pdf_reader.pages[index].extract_text() for index in page_indices)
+            
+            for page_text in page_texts:
+                yield page_text
         except Exception as e:
             raise ValueError(f"PDF 파일을 읽는 중 오류가 발생했습니다: {str(e)}")
+        finally:
+            # 진행 중인 페이지 추출을 마친 뒤 임시 파일 삭제
+            if page_texts is not None:
+                page_texts.close()
+            if spooled_path:
+                os.remove(spooled_path)
+    
+    @staticmethod
+    def _spool_to_file(stream, suffix):
+        """스트림 내용을 임시 파일로 복사합니다.
+        
+        Args:
+            stream: 바이너리 파일 객체
+            suffix (str): 임시 파일 확장자
+        
+        Returns:
+            str: 임시 파일 경로 (사용 후 삭제해야 함)
+        """
+        os.makedirs(TEMP_DIR, exist_ok=True)
+        stream.seek(0)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=TEMP_DIR) as temp_file:
+            shutil.copyfileobj(stream, temp_file)
+        return temp_file.name
     
     @staticmethod
-    def _read_docx(file_path):
+    def _read_docx(source):
         """Word 문서에서 텍스트를 추출합니다.
         
         Args:
-            file_path (Path): Word 문서 경로
-            
+            source (Path or file): Word 문서 경로 또는 바이너리 파일 객체
+        
         Returns:
             str: 추출된 텍스트
         """
+        import docx
         try:
-            doc = docx.Document(file_path)
+            doc = docx.Document(source)
             text = "\n\n".join([paragraph.text for paragraph in doc.paragraphs if paragraph.text])
             return text
         except Exception as e:
             raise ValueError(f"Word 문서를 읽는 중 오류가 발생했습니다: {str(e)}")
     
+    @staticmethod
+    def _iter_docx_blocks(source):
+        """Word 문서 문단을 TEXT_BLOCK_CHARS 글자 정도의 묶음 단위로 생성"""
+        import docx
+        try:
+            doc = docx.Document(source)
+        except Exception as e:
+            raise ValueError(f"Word 문서를 읽는 중 오류가 발생했습니다: {str(e)}")
+        
+        paragraphs = []
+        size = 0
+        for paragraph in doc.paragraphs:
+            if not paragraph.text:
+                continue
+            paragraphs.append(paragraph.text)
+            size += len(paragraph.text)
+            if size >= TEXT_BLOCK_CHARS:
+                yield "\n\n".join(paragraphs)
+                paragraphs = []
+                size = 0
+        if paragraphs:
+            yield "\n\n".join(paragraphs)
+    
     @staticmethod
     def save_text(text, file_path, file_format='.txt'):
         """텍스트를 파일로 저장합니다.
@@ -98,10 +678,10 @@ class FileHandler:
             text (str): 저장할 텍스트
             file_path (str): 저장할 파일 경로 (확장자 없이)
             file_format (str): 파일 형식 ('.txt', '.pdf', '.docx')
-            
+        
         Returns:
             str: 저장된 파일의 전체 경로
-            
+        
         Raises:
             ValueError: 지원하지 않는 출력 형식일 경우
         """
@@ -119,6 +699,7 @@ class FileHandler:
         
         # Word 문서로 저장
         elif file_format == '.docx':
+            import docx
             doc = docx.Document()
             for paragraph in text.split('\n'):
                 if paragraph.strip():
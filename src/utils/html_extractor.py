@@ -0,0 +1,309 @@
+import re
+import importlib.util
+from src.config import HTML_PARSER
+
+# lxml과 BeautifulSoup은 가져오는 데 시간이 걸리므로 설치 여부만 확인하고 처음 파싱할 때 가져옴
+_LXML_INSTALLED = importlib.util.find_spec("lxml") is not None
+
+# 본문 추출 시 하위 요소까지 통째로 제거할 태그
+PRUNED_TAGS = frozenset(['script', 'style', 'nav', 'footer', 'iframe', 'aside'])
+
+# 광고, 사이드바, 관련 기사 등을 포함할 가능성이 높은 class/id 이름 (부분 문자열로 비교)
+BOILERPLATE_NAMES = [
+    'ad', 'ads', 'advertisement', 'banner', 'sidebar', 'related', 'footer',
+    'menu', 'nav', 'share', 'social', 'comment', 'copyright'
+]
+
+# 주요 콘텐츠 영역 후보 (앞에 있을수록 우선)
+CONTENT_CONTAINERS = ['article', 'main', '.article', '.content', '.post', '.entry', '#article', '#content', '#main']
+
+# 본문 텍스트를 가져올 태그
+TEXT_TAGS = frozenset(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+# 이보다 짧은 텍스트 블록은 메뉴, 버튼 등으로 보고 건너뜀
+MIN_TEXT_LENGTH = 20
+
+# class/id 값 중 하나라도 이름을 포함하면 제거 (소문자로 비교)
+_BOILERPLATE_PATTERN = re.compile('|'.join(re.escape(name) for name in BOILERPLATE_NAMES))
+
+# 텍스트 추출에서 제외되는 요소 (BeautifulSoup이 별도 문자열 타입으로 취급하는 태그)
+_NON_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+def _detect_parser():
+    """사용할 파서 이름 반환 ("auto"이면 lxml이 설치된 경우 lxml 사용)"""
+    if HTML_PARSER != "auto":
+        return HTML_PARSER
+    return "lxml" if _LXML_INSTALLED else "html.parser"
+
+PARSER = _detect_parser()
+
+def _is_boilerplate(name, classes, element_id):
+    """제거 대상 요소인지 확인 (태그 이름, class, id 기준)"""
+    if name in PRUNED_TAGS:
+        return True
+    # class 이름끼리 공백으로 이어 붙여도 공백 없는 패턴의 일치 여부는 같음
+    if classes and _BOILERPLATE_PATTERN.search(classes.lower()):
+        return True
+    if element_id and _BOILERPLATE_PATTERN.search(element_id.lower()):
+        return True
+    return False
+
+def _container_matches(name, classes, element_id):
+    """요소가 해당하는 주요 콘텐츠 영역 후보 선택자 목록"""
+    matches = []
+    if name in ('article', 'main'):
+        matches.append(name)
+    if classes:
+        class_names = classes.split()
+        for class_name in ('article', 'content', 'post', 'entry'):
+            if class_name in class_names:
+                matches.append('.' + class_name)
+    if element_id in ('article', 'content', 'main'):
+        matches.append('#' + element_id)
+    return matches
+
+class HtmlDocument:
+    """파싱된 HTML 문서에서 제목, 전체 텍스트, 본문을 추출하는 기본 클래스
+    
+    파서별 하위 클래스는 요소 순회와 속성 조회, 요소 제거, 문자열 조회만 구현합니다.
+    """
+    
+    parser = None
+    
+    def _children(self, element):
+        """하위 요소(태그) 목록"""
+        raise NotImplementedError
+    
+    def _describe(self, element):
+        """요소의 (태그 이름, class 문자열, id 문자열)"""
+        raise NotImplementedError
+    
+    def _get_attribute(self, element, name):
+        raise NotImplementedError
+    
+    def _remove(self, element):
+        """요소를 문서에서 제거 (뒤따르는 텍스트는 유지)"""
+        raise NotImplementedError
+    
+    def _strings(self, element):
+        """요소 안의 텍스트 조각 목록 (문서 순서)"""
+        raise NotImplementedError
+    
+    def _root_elements(self):
+        raise NotImplementedError
+    
+    def title(self):
+        """문서 제목
+        
+        Returns:
+            str: 제목 (없으면 "제목 없음")
+        """
+        raise NotImplementedError
+    
+    def text(self):
+        """스크립트와 스타일을 제거한 문서 전체 텍스트 (문서에서 해당 요소를 제거함)
+        
+        Returns:
+            str: 줄 단위로 구분된 전체 텍스트
+        """
+        raise NotImplementedError
+    
+    def content(self):
+        """광고, 메뉴 등을 제거하고 본문 텍스트 추출 (문서에서 해당 요소를 제거함)
+        
+        문서를 한 번만 순회하면서 불필요한 요소를 제거하고, 메타 설명과
+        주요 콘텐츠 영역 후보, 본문 텍스트 태그의 위치를 함께 기록합니다.
+        
+        Returns:
+            str: 메타 설명과 본문 블록을 빈 줄로 구분한 텍스트 (찾지 못하면 빈 문자열)
+        """
+        meta_desc = None
+        containers = {}      # 후보 선택자 -> (요소, 순회 시작 번호)
+        container_ends = {}  # id(요소) -> 하위 요소 순회가 끝난 번호
+        text_tags = []       # (순회 시작 번호, 요소)
+        
+        # 전위 순회 (스택에 None을 넣어 하위 요소 순회가 끝난 시점을 기록)
+        counter = 0
+        stack = list(reversed(self._root_elements()))
+        while stack:
+            element = stack.pop()
+            if element is None:
+                container_ends[id(stack.pop())] = counter
+                continue
+            
+            name, classes, element_id = self._describe(element)
+            if _is_boilerplate(name, classes, element_id):
+                self._remove(element)
+                continue
+            
+            counter += 1
+            
+            if name == 'meta' and meta_desc is None and self._get_attribute(element, 'name') == 'description':
+                meta_desc = element
+            
+            is_container = False
+            for selector in _container_matches(name, classes, element_id):
+                if selector not in containers:
+                    containers[selector] = (element, counter)
+                    is_container = True
+            
+            if name in TEXT_TAGS:
+                text_tags.append((counter, element))
+            
+            if is_container:
+                stack.append(element)
+                stack.append(None)
+            stack.extend(reversed(self._children(element)))
+        
+        content = ""
+        
+        # 메타 설명 추가
+        if meta_desc is not None and self._get_attribute(meta_desc, 'content'):
+            content += self._get_attribute(meta_desc, 'content') + "\n\n"
+        
+        # 우선순위가 가장 높은 주요 콘텐츠 영역 안의 태그만 사용 (없으면 문서 전체)
+        selected = next((containers[selector] for selector in CONTENT_CONTAINERS if selector in containers), None)
+        if selected is not None:
+            element, start = selected
+            end = container_ends[id(element)]
+            text_tags = [(index, tag) for index, tag in text_tags if start < index <= end]
+        
+        for _, tag in text_tags:
+            text = "".join(string.strip() for string in self._strings(tag))
+            if text and len(text) > MIN_TEXT_LENGTH:  # 짧은 텍스트는 건너뜀
+                content += text + "\n\n"
+        
+        return content
+
+class SoupDocument(HtmlDocument):
+    """BeautifulSoup으로 파싱한 문서 (lxml이 없거나 lxml로 파싱할 수 없는 경우 사용)"""
+    
+    def __init__(self, html, parser="html.parser"):
+        from bs4 import BeautifulSoup, Tag
+        self.parser = parser
+        self.soup = BeautifulSoup(html, parser)
+        self._tag_type = Tag
+    
+    def _children(self, element):
+        return [child for child in element.contents if isinstance(child, self._tag_type)]
+    
+    def _root_elements(self):
+        return self._children(self.soup)
+    
+    def _describe(self, element):
+        attrs = element.attrs
+        classes = attrs.get('class')
+        if isinstance(classes, list):
+            classes = ' '.join(classes)
+        element_id = attrs.get('id')
+        if isinstance(element_id, list):
+            element_id = ' '.join(element_id)
+        return element.name, classes, element_id
+    
+    def _get_attribute(self, element, name):
+        return element.get(name)
+    
+    def _remove(self, element):
+        element.decompose()
+    
+    def _strings(self, element):
+        return element.strings
+    
+    def title(self):
+        # 캐시에 저장할 수 있도록 파싱 트리와 분리된 문자열로 변환
+        soup = self.soup
+        return str(soup.title.string) if soup.title and soup.title.string else "제목 없음"
+    
+    def text(self):
+        for element in self.soup.find_all(['script', 'style']):
+            element.decompose()
+        return self.soup.get_text(separator='\n', strip=True)
+
+class LxmlDocument(HtmlDocument):
+    """lxml로 파싱한 문서
+    
+    트리를 C 수준에서 만들기 때문에 BeautifulSoup보다 훨씬 빠릅니다.
+    lxml의 요소 제거는 뒤따르는 텍스트를 앞 텍스트와 합치므로, 요소를 실제로 지우는 대신
+    제거 목록에 넣고 텍스트를 모을 때 건너뛰어 BeautifulSoup과 같은 결과를 냅니다.
+    """
+    
+    parser = "lxml"
+    
+    def __init__(self, html):
+        import lxml.html
+        self.root = lxml.html.document_fromstring(html)
+        self._removed = set()
+    
+    def _children(self, element):
+        return [child for child in element if isinstance(child.tag, str) and child not in self._removed]
+    
+    def _root_elements(self):
+        return [self.root]
+    
+    def _describe(self, element):
+        return element.tag, element.get('class'), element.get('id')
+    
+    def _get_attribute(self, element, name):
+        return element.get(name)
+    
+    def _remove(self, element):
+        self._removed.add(element)
+    
+    def _strings(self, element):
+        """요소 안의 텍스트 조각 (제거된 요소, 주석, 스크립트 등의 내용은 제외)"""
+        # template 등의 안에 있는 요소는 BeautifulSoup에서도 텍스트가 없는 것으로 취급됨
+        if next(element.iterancestors(*_NON_TEXT_TAGS), None) is not None:
+            return []
+        
+        strings = []
+        if element.text:
+            strings.append(element.text)
+        stack = [(iter(element), None)]
+        while stack:
+            children, tail = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if tail:
+                    strings.append(tail)
+                continue
+            
+            if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS and child not in self._removed:
+                if child.text:
+                    strings.append(child.text)
+                stack.append((iter(child), child.tail))
+            elif child.tail:
+                strings.append(child.tail)
+        return strings
+    
+    def title(self):
+        title = self.root.find('.//title')
+        if title is None or len(title) or not title.text:
+            return "제목 없음"
+        return title.text
+    
+    def text(self):
+        for element in self.root.iter('script', 'style'):
+            self._removed.add(element)
+        strings = (string.strip() for string in self._strings(self.root))
+        return '\n'.join(string for string in strings if string)
+
+def parse_html(html, parser=None):
+    """HTML 파싱
+    
+    Args:
+        html (str): HTML 문자열
+        parser (str): 파서 이름 ("lxml", "html.parser" 등, None이면 HTML_PARSER 설정의 파서)
+    
+    Returns:
+        HtmlDocument: 파싱된 문서
+    """
+    parser = parser or PARSER
+    if parser == "lxml" and _LXML_INSTALLED:
+        from lxml import etree
+        try:
+            return LxmlDocument(html)
+        except (ValueError, etree.ParserError):
+            # 빈 문서이거나 인코딩 선언이 있는 XHTML 문자열은 BeautifulSoup으로 처리
+            return SoupDocument(html, "html.parser")
+    return SoupDocument(html, parser)
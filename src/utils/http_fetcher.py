@@ -0,0 +1,224 @@
+import time
+import asyncio
+import hashlib
+import weakref
+from collections import namedtuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from src.config import (
+    SCRAPE_USER_AGENT, SCRAPE_TIMEOUT, SCRAPE_MAX_CONNECTIONS,
+    SCRAPE_MAX_CONNECTIONS_PER_HOST, SCRAPE_KEEPALIVE_EXPIRY,
+    SCRAPE_CACHE_ENABLED, SCRAPE_CACHE_TTL, SCRAPE_CACHE_MAX_AGE, SCRAPE_CACHE_MAX_ENTRIES,
+    SCRAPE_CACHE_MAX_MEMORY_BYTES, SCRAPE_CACHE_DISK_ENABLED, SCRAPE_CACHE_DIR, SCRAPE_CACHE_MAX_DISK_BYTES,
+    CACHE_DISK_BACKEND
+)
+from src.utils.cache import TieredCache, make_cache_key
+
+# 가져온 웹 페이지 (status: "fresh" 캐시 그대로 사용, "revalidated" 304 응답으로 재검증, "downloaded" 새로 받음)
+FetchedPage = namedtuple("FetchedPage", ["url", "text", "digest", "status"])
+
+# 캐시 키에서 제외할 추적용 쿼리 매개변수
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid")
+
+# 가져온 웹 페이지 캐시 (본문과 검증자(ETag, Last-Modified) 저장)
+page_cache = None
+if SCRAPE_CACHE_ENABLED:
+    page_cache = TieredCache(
+        "page",
+        max_entries=SCRAPE_CACHE_MAX_ENTRIES,
+        max_memory_bytes=SCRAPE_CACHE_MAX_MEMORY_BYTES,
+        ttl=SCRAPE_CACHE_MAX_AGE,
+        disk_dir=SCRAPE_CACHE_DIR if SCRAPE_CACHE_DISK_ENABLED else None,
+        max_disk_bytes=SCRAPE_CACHE_MAX_DISK_BYTES,
+        disk_backend=CACHE_DISK_BACKEND
+    )
+
+def canonicalize_url(url):
+    """캐시 키로 사용할 정규화된 URL 반환
+    
+    스킴과 호스트를 소문자로 바꾸고, 기본 포트와 프래그먼트, 추적용 쿼리 매개변수를
+    제거한 뒤 쿼리 매개변수를 정렬합니다.
+    
+    Args:
+        url (str): 원본 URL
+        
+    Returns:
+        str: 정규화된 URL
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not (scheme == "http" and parts.port == 80 or scheme == "https" and parts.port == 443):
+        host = f"{host}:{parts.port}"
+    
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+class HttpFetcher:
+    """웹 페이지를 가져오기 위한 공유 비동기 HTTP 클라이언트
+    
+    하나의 커넥션 풀을 모든 요청이 공유하므로 같은 호스트에 대한
+    TCP 연결, DNS 조회 결과, TLS 세션이 keep-alive 동안 재사용됩니다.
+    호스트별 동시 요청 수를 제한하여 한 사이트가 풀을 독점하지 않도록 합니다.
+    """
+    
+    def __init__(self, max_connections=SCRAPE_MAX_CONNECTIONS,
+                 max_connections_per_host=SCRAPE_MAX_CONNECTIONS_PER_HOST,
+                 timeout=SCRAPE_TIMEOUT, keepalive_expiry=SCRAPE_KEEPALIVE_EXPIRY,
+                 cache=page_cache, cache_ttl=SCRAPE_CACHE_TTL):
+        """HTTP 페처 초기화
+        
+        Args:
+            max_connections (int): 전체 최대 동시 연결 수
+            max_connections_per_host (int): 호스트별 최대 동시 요청 수
+            timeout (float): 요청 제한 시간 (초)
+            keepalive_expiry (float): 유휴 연결 유지 시간 (초)
+            cache (TieredCache): 웹 페이지 캐시 (None이면 캐시 사용 안 함)
+            cache_ttl (int): 재검증 없이 캐시를 그대로 사용할 시간 (초)
+        """
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.keepalive_expiry = keepalive_expiry
+        self.client = None
+        # 사용 중인 호스트의 세마포어만 유지 (사용이 끝나면 자동으로 정리됨)
+        self._host_semaphores = weakref.WeakValueDictionary()
+        
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.fresh_hits = 0
+        self.revalidated = 0
+        self.downloads = 0
+    
+    def _get_client(self):
+        """커넥션 풀을 가진 httpx 클라이언트 반환 (최초 사용 시 생성)"""
+        if self.client is None:
+            import httpx
+            self.client = httpx.AsyncClient(
+                headers={'User-Agent': SCRAPE_USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                ),
+                timeout=self.timeout,
+                follow_redirects=True
+            )
+        return self.client
+    
+    def _get_host_semaphore(self, host):
+        """호스트별 동시 요청 제한용 세마포어 반환"""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+    
+    async def fetch(self, url, headers=None):
+        """URL의 내용을 가져옵니다.
+        
+        Args:
+            url (str): 가져올 URL
+            headers (dict): 추가 요청 헤더
+            
+        Returns:
+            httpx.Response: 응답 객체
+            
+        Raises:
+            httpx.HTTPError: 연결 오류이거나 오류 상태 코드를 받은 경우
+        """
+        response = await self._get(url, headers)
+        response.raise_for_status()  # 오류 발생 시 예외 발생
+        return response
+    
+    async def _get(self, url, headers=None):
+        """호스트별 동시 요청 제한 안에서 GET 요청"""
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._get_host_semaphore(host)
+        
+        async with semaphore:
+            return await self._get_client().get(url, headers=headers)
+    
+    async def fetch_page(self, url):
+        """캐시를 사용하여 웹 페이지 본문 가져오기
+        
+        캐시된 지 cache_ttl이 지나지 않은 페이지는 요청 없이 반환하고, 지났으면
+        ETag/Last-Modified로 조건부 요청을 보내 304 응답이면 캐시된 본문을 그대로 사용합니다.
+        
+        Args:
+            url (str): 가져올 URL
+            
+        Returns:
+            FetchedPage: 최종 URL, 본문, 본문 해시, 캐시 상태
+            
+        Raises:
+            httpx.HTTPError: 연결 오류이거나 오류 상태 코드를 받은 경우
+        """
+        if self.cache is None:
+            response = await self.fetch(url)
+            self.downloads += 1
+            return self._page_from_response(response, "downloaded")
+        
+        cache_key = make_cache_key("page", canonicalize_url(url))
+        entry = await self.cache.get_async(cache_key)
+        if entry is not None and time.time() - entry["fetched_at"] < self.cache_ttl:
+            self.fresh_hits += 1
+            return FetchedPage(entry["url"], entry["text"], entry["digest"], "fresh")
+        
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        response = await self._get(url, headers or None)
+        
+        if response.status_code == 304 and entry is not None:
+            # 변경되지 않은 페이지: 본문을 다시 받지 않고 캐시 유효 시간만 갱신
+            self.revalidated += 1
+            entry = dict(entry, fetched_at=time.time())
+            await self.cache.set_async(cache_key, entry)
+            return FetchedPage(entry["url"], entry["text"], entry["digest"], "revalidated")
+        
+        response.raise_for_status()  # 오류 발생 시 예외 발생
+        self.downloads += 1
+        page = self._page_from_response(response, "downloaded")
+        
+        if "no-store" not in response.headers.get("Cache-Control", "").lower():
+            await self.cache.set_async(cache_key, {
+                "url": page.url,
+                "text": page.text,
+                "digest": page.digest,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time()
+            })
+        return page
+    
+    @staticmethod
+    def _page_from_response(response, status):
+        text = response.text
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return FetchedPage(str(response.url), text, digest, status)
+    
+    def stats(self):
+        """페이지 캐시 통계 반환
+        
+        Returns:
+            dict: 캐시 그대로 사용, 재검증, 새로 받은 횟수와 캐시 저장소 통계
+        """
+        return {
+            "fresh_hits": self.fresh_hits,
+            "revalidated": self.revalidated,
+            "downloads": self.downloads,
+            "cache": self.cache.stats() if self.cache is not None else None
+        }
+    
+    async def close(self):
+        """커넥션 풀 정리"""
+        if self.client is not None:
+            await self.client.aclose()
+            self.client = None
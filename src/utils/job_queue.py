@@ -0,0 +1,456 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import asyncio
+import threading
+from pathlib import Path
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELED = "canceled"
+FINISHED_STATUSES = (SUCCEEDED, FAILED, CANCELED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    params TEXT NOT NULL,
+    input_path TEXT,
+    callback_url TEXT,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    heartbeat_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+class JobError(Exception):
+    """작업 실패 사유를 그대로 기록할 예외 (그 밖의 예외는 일반 오류 메시지와 함께 기록)"""
+
+class JobStore:
+    """작업 상태와 결과를 SQLite 파일에 저장하는 저장소
+    
+    WAL 모드를 사용하므로 작업을 처리하는 동안에도 상태 조회가 막히지 않고,
+    대기 중인 작업은 UPDATE 한 번으로 가져가므로 여러 프로세스가 같은 파일을 써도 한 작업이 두 번 실행되지 않습니다.
+    """
+    
+    def __init__(self, db_path):
+        """저장소 초기화 (데이터베이스 파일은 처음 사용할 때 엶)
+        
+        Args:
+            db_path (Path): SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._connection = None
+    
+    def open(self):
+        """데이터베이스 파일을 열고 테이블 생성 (이미 열었으면 무시)"""
+        with self._lock:
+            if self._connection is not None:
+                return
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+    
+    def _execute(self, sql, params=()):
+        if self._connection is None:
+            self.open()
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+    
+    @staticmethod
+    def _to_job(row):
+        if row is None:
+            return None
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["result"] = json.loads(job["result"]) if job["result"] is not None else None
+        return job
+    
+    def create(self, job_id, kind, params, input_path=None, callback_url=None):
+        """대기 중인 작업 추가
+        
+        Returns:
+            dict: 추가된 작업
+        """
+        rows = self._execute(
+            "INSERT INTO jobs (id, kind, status, params, input_path, callback_url, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) RETURNING *",
+            (job_id, kind, QUEUED, json.dumps(params, ensure_ascii=False),
+             str(input_path) if input_path else None, callback_url, time.time())
+        )
+        return self._to_job(rows[0])
+    
+    def get(self, job_id):
+        """작업 조회 (없으면 None)"""
+        rows = self._execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        return self._to_job(rows[0]) if rows else None
+    
+    def claim_next(self):
+        """가장 오래 기다린 대기 작업 하나를 실행 중으로 바꾸고 반환 (없으면 None)"""
+        now = time.time()
+        rows = self._execute(
+            "UPDATE jobs SET status = ?, started_at = ?, heartbeat_at = ?, attempts = attempts + 1 "
+            "WHERE id = (SELECT id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1) AND status = ? "
+            "RETURNING *",
+            (RUNNING, now, now, QUEUED, QUEUED)
+        )
+        return self._to_job(rows[0]) if rows else None
+    
+    def finish(self, job_id, status, result=None, error=None):
+        """실행 중인 작업을 완료 상태로 변경"""
+        self._execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ? AND status = ?",
+            (status, json.dumps(result, ensure_ascii=False) if result is not None else None,
+             error, time.time(), job_id, RUNNING)
+        )
+    
+    def release(self, job_id):
+        """서버 종료로 중단된 작업을 다시 대기 상태로 돌림 (시도 횟수에 포함하지 않음)"""
+        self._execute(
+            "UPDATE jobs SET status = ?, started_at = NULL, heartbeat_at = NULL, attempts = attempts - 1 "
+            "WHERE id = ? AND status = ?",
+            (QUEUED, job_id, RUNNING)
+        )
+    
+    def heartbeat(self, job_ids):
+        """실행 중인 작업이 아직 처리되고 있음을 기록"""
+        if not job_ids:
+            return
+        placeholders = ", ".join("?" for _ in job_ids)
+        self._execute(
+            f"UPDATE jobs SET heartbeat_at = ? WHERE status = ? AND id IN ({placeholders})",
+            (time.time(), RUNNING, *job_ids)
+        )
+    
+    def recover_stale(self, stale_before, max_attempts):
+        """처리하던 프로세스가 중단되어 갱신이 멈춘 작업을 다시 대기 상태로 돌림
+        
+        Args:
+            stale_before (float): 마지막 갱신이 이 시각보다 오래된 실행 중 작업을 중단된 것으로 판단
+            max_attempts (int): 최대 시도 횟수 (도달한 작업은 실패로 처리)
+        
+        Returns:
+            int: 다시 대기 상태로 돌리거나 실패 처리한 작업 수
+        """
+        failed = self._execute(
+            "UPDATE jobs SET status = ?, error = ?, finished_at = ? "
+            "WHERE status = ? AND heartbeat_at < ? AND attempts >= ? RETURNING id",
+            (FAILED, "작업을 처리하던 서버가 여러 번 중단되었습니다.", time.time(), RUNNING, stale_before, max_attempts)
+        )
+        requeued = self._execute(
+            "UPDATE jobs SET status = ?, started_at = NULL, heartbeat_at = NULL "
+            "WHERE status = ? AND heartbeat_at < ? RETURNING id",
+            (QUEUED, RUNNING, stale_before)
+        )
+        return len(failed) + len(requeued)
+    
+    def cancel(self, job_id):
+        """대기 중인 작업 취소
+        
+        Returns:
+            dict: 취소된 작업 (대기 중이 아니면 None)
+        """
+        rows = self._execute(
+            "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status = ? RETURNING *",
+            (CANCELED, time.time(), job_id, QUEUED)
+        )
+        return self._to_job(rows[0]) if rows else None
+    
+    def delete(self, job_id):
+        """완료된 작업 삭제
+        
+        Returns:
+            bool: 삭제 여부 (없거나 아직 완료되지 않았으면 False)
+        """
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        rows = self._execute(
+            f"DELETE FROM jobs WHERE id = ? AND status IN ({placeholders}) RETURNING id",
+            (job_id, *FINISHED_STATUSES)
+        )
+        return bool(rows)
+    
+    def purge(self, finished_before):
+        """완료된 지 오래된 작업 삭제
+        
+        Returns:
+            int: 삭제한 작업 수
+        """
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        rows = self._execute(
+            f"DELETE FROM jobs WHERE status IN ({placeholders}) AND finished_at < ? RETURNING id",
+            (*FINISHED_STATUSES, finished_before)
+        )
+        return len(rows)
+    
+    def count(self, status):
+        """상태별 작업 수"""
+        return self._execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,))[0][0]
+    
+    def counts(self):
+        """전체 상태별 작업 수"""
+        return {status: count for status, count in self._execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")}
+    
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+def public_job(job):
+    """API 응답으로 돌려줄 작업 정보 (입력 파일 경로, 콜백 주소 등 내부 정보 제외)"""
+    return {
+        "job_id": job["id"],
+        "kind": job["kind"],
+        "status": job["status"],
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "attempts": job["attempts"],
+        "result": job["result"],
+        "error": job["error"]
+    }
+
+class JobQueue:
+    """SQLite 저장소에 기록된 작업을 제한된 수의 비동기 워커로 처리하는 작업 큐
+    
+    작업 추가 시 대기 중인 워커를 바로 깨우고, 다른 프로세스가 추가했거나 서버 재시작 후 남은 작업은
+    주기적인 확인으로 가져갑니다. 실행 중인 작업은 주기적으로 갱신 시각을 기록하며, 갱신이 멈춘 작업
+    (처리하던 프로세스가 비정상 종료된 작업)은 max_attempts에 도달할 때까지 다시 대기 상태로 돌립니다.
+    작업이 끝나면 입력 파일을 삭제하고, 콜백 주소가 있으면 작업 정보를 JSON으로 POST합니다.
+    """
+    
+    def __init__(self, store, handlers, inputs_dir, concurrency=4, poll_interval=2.0,
+                 heartbeat_interval=10.0, max_attempts=3, result_ttl=7 * 24 * 60 * 60,
+                 callback_timeout=10.0, callback_retries=3):
+        """작업 큐 초기화
+        
+        Args:
+            store (JobStore): 작업 저장소
+            handlers (dict): 작업 종류별 처리 함수 (작업 dict를 받아 결과 dict를 반환하는 코루틴 함수)
+            inputs_dir (Path): 작업 입력 파일을 보관할 디렉토리
+            concurrency (int): 동시에 처리할 최대 작업 수
+            poll_interval (float): 깨우는 신호가 없을 때 대기 작업을 확인하는 간격 (초)
+            heartbeat_interval (float): 실행 중인 작업의 갱신 시각 기록 간격 (초)
+            max_attempts (int): 서버 중단으로 다시 시도할 최대 횟수
+            result_ttl (int): 완료된 작업 보관 시간 (초)
+            callback_timeout (float): 콜백 요청 제한 시간 (초)
+            callback_retries (int): 콜백 요청 최대 시도 횟수
+        """
+        self.store = store
+        self.handlers = handlers
+        self.inputs_dir = Path(inputs_dir)
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.max_attempts = max_attempts
+        self.result_ttl = result_ttl
+        self.callback_timeout = callback_timeout
+        self.callback_retries = callback_retries
+        
+        self._tasks = []
+        self._wakeup = None
+        self._running = {}  # 작업 ID -> 처리 중인 태스크
+        self._callback_client = None
+        
+        self.submitted = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.callbacks_failed = 0
+    
+    def start(self):
+        """저장소를 열고 워커와 유지 관리 태스크 시작 (이미 시작했으면 무시, 실행 중인 이벤트 루프에서 호출)
+        
+        모듈을 가져오기만 해서는 데이터베이스와 디렉토리가 만들어지지 않도록 서버 시작 시 엽니다.
+        """
+        if self._tasks:
+            return
+        self.store.open()
+        self.inputs_dir.mkdir(parents=True, exist_ok=True)
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.concurrency)]
+        self._tasks.append(asyncio.ensure_future(self._maintain()))
+    
+    async def stop(self):
+        """워커 종료 (처리 중이던 작업은 다시 대기 상태로 돌려 다음 실행 때 이어서 처리)"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._callback_client:
+            await self._callback_client.aclose()
+            self._callback_client = None
+    
+    def new_input_path(self, job_id, suffix):
+        """작업 입력 파일을 저장할 경로 (디렉토리가 없으면 생성)"""
+        self.inputs_dir.mkdir(parents=True, exist_ok=True)
+        return self.inputs_dir / f"{job_id}{suffix}"
+    
+    def new_job_id(self):
+        return uuid.uuid4().hex
+    
+    async def submit(self, kind, params, job_id=None, input_path=None, callback_url=None):
+        """작업 추가
+        
+        Args:
+            kind (str): 작업 종류 (handlers의 키)
+            params (dict): 처리 함수에 전달할 JSON 직렬화 가능한 매개변수
+            job_id (str): 작업 ID (입력 파일을 먼저 저장한 경우 그 경로에 사용한 ID, None이면 새로 생성)
+            input_path (Path): 작업 입력 파일 경로 (작업이 끝나면 삭제)
+            callback_url (str): 작업이 끝나면 결과를 POST할 주소
+        
+        Returns:
+            dict: 추가된 작업
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"알 수 없는 작업 종류입니다: {kind}")
+        
+        self.start()
+        job = await asyncio.to_thread(
+            self.store.create, job_id or self.new_job_id(), kind, params, input_path, callback_url
+        )
+        self.submitted += 1
+        self._wakeup.set()
+        return job
+    
+    async def get(self, job_id):
+        return await asyncio.to_thread(self.store.get, job_id)
+    
+    async def cancel(self, job_id):
+        """대기 중인 작업 취소 (취소되면 작업, 대기 중이 아니면 None 반환)"""
+        job = await asyncio.to_thread(self.store.cancel, job_id)
+        if job:
+            self._remove_input(job)
+        return job
+    
+    async def delete(self, job_id):
+        """완료된 작업 삭제"""
+        return await asyncio.to_thread(self.store.delete, job_id)
+    
+    async def pending_count(self):
+        """대기 중인 작업 수"""
+        return await asyncio.to_thread(self.store.count, QUEUED)
+    
+    async def _worker(self):
+        while True:
+            job = await asyncio.to_thread(self.store.claim_next)
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            self._running[job["id"]] = asyncio.current_task()
+            try:
+                await self._run(job)
+            except asyncio.CancelledError:
+                # 서버 종료로 중단된 작업은 다음 실행 때 처음부터 다시 처리
+                self.store.release(job["id"])
+                raise
+            finally:
+                self._running.pop(job["id"], None)
+    
+    async def _run(self, job):
+        """작업 하나 실행 후 결과 기록"""
+        print(f"작업 시작: {job['id']} ({job['kind']}, {job['attempts']}번째 시도)")
+        start = time.perf_counter()
+        try:
+            result = await self.handlers[job["kind"]](job)
+            status, error = SUCCEEDED, None
+            self.succeeded += 1
+        except JobError as e:
+            result, status, error = None, FAILED, str(e)
+            self.failed += 1
+        except Exception as e:
+            result, status, error = None, FAILED, f"작업 처리 중 오류가 발생했습니다: {str(e)}"
+            self.failed += 1
+        
+        await asyncio.to_thread(self.store.finish, job["id"], status, result, error)
+        self._remove_input(job)
+        print(f"작업 {'완료' if status == SUCCEEDED else '실패'}: {job['id']} ({time.perf_counter() - start:.2f}초)")
+        
+        if job["callback_url"]:
+            finished = await asyncio.to_thread(self.store.get, job["id"])
+            if finished:
+                await self._send_callback(job["callback_url"], public_job(finished))
+    
+    def _remove_input(self, job):
+        if job["input_path"]:
+            try:
+                os.remove(job["input_path"])
+            except OSError:
+                pass
+    
+    async def _send_callback(self, url, payload):
+        """작업 결과를 콜백 주소로 POST (실패하면 간격을 늘려 가며 다시 시도)"""
+        import httpx
+        if self._callback_client is None:
+            self._callback_client = httpx.AsyncClient(timeout=self.callback_timeout)
+        
+        for attempt in range(self.callback_retries):
+            try:
+                response = await self._callback_client.post(url, json=payload)
+                if response.status_code < 500:
+                    return
+                print(f"작업 콜백 응답 오류: {payload['job_id']} (HTTP {response.status_code})")
+            except httpx.HTTPError as e:
+                print(f"작업 콜백 전송 중 오류가 발생했습니다: {payload['job_id']} ({str(e)})")
+            if attempt + 1 < self.callback_retries:
+                await asyncio.sleep(2 ** attempt)
+        self.callbacks_failed += 1
+    
+    async def _maintain(self):
+        """실행 중인 작업 갱신, 중단된 작업 복구, 오래된 작업 삭제를 주기적으로 수행"""
+        last_purge = 0
+        while True:
+            try:
+                await asyncio.to_thread(self.store.heartbeat, list(self._running))
+                recovered = await asyncio.to_thread(
+                    self.store.recover_stale, time.time() - self.heartbeat_interval * 3, self.max_attempts
+                )
+                if recovered:
+                    print(f"중단된 작업 {recovered}개를 복구했습니다.")
+                    self._wakeup.set()
+                
+                if time.time() - last_purge > 60 * 60:
+                    last_purge = time.time()
+                    purged = await asyncio.to_thread(self.store.purge, time.time() - self.result_ttl)
+                    if purged:
+                        print(f"보관 기간이 지난 작업 {purged}개를 삭제했습니다.")
+            except sqlite3.Error as e:
+                print(f"작업 저장소 관리 중 오류가 발생했습니다: {str(e)}")
+            
+            await asyncio.sleep(self.heartbeat_interval)
+    
+    def stats(self):
+        """작업 큐 통계 반환
+        
+        Returns:
+            dict: 상태별 작업 수, 이 프로세스에서 처리 중인 작업 수, 누적 처리 결과
+        """
+        return {
+            "jobs": self.store.counts(),
+            "concurrency": self.concurrency,
+            "running": len(self._running),
+            "submitted": self.submitted,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "callbacks_failed": self.callbacks_failed
+        }
@@ -0,0 +1,300 @@
+import re
+import math
+from collections import namedtuple, Counter
+from src.config import LANGUAGE_DETECTION_SAMPLE_SIZE
+
+# 언어 감지 결과 (language: 언어 코드 또는 None, confidence: 0.0 ~ 1.0)
+LanguageDetection = namedtuple('LanguageDetection', ['language', 'confidence'])
+
+# 유니코드 문자 체계별 패턴
+_SCRIPT_PATTERNS = {
+    'hangul': re.compile('[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]'),
+    'kana': re.compile('[\u3040-\u30ff\u31f0-\u31ff\uff66-\uff9f]'),
+    'han': re.compile('[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]'),
+    'thai': re.compile('[\u0e00-\u0e7f]'),
+    'devanagari': re.compile('[\u0900-\u097f]'),
+    'greek': re.compile('[\u0370-\u03ff\u1f00-\u1fff]'),
+    'hebrew': re.compile('[\u0590-\u05ff]'),
+    'arabic': re.compile('[\u0600-\u06ff\u0750-\u077f\ufb50-\ufdff\ufe70-\ufeff]'),
+    'cyrillic': re.compile('[\u0400-\u04ff]'),
+    'latin': re.compile('[A-Za-z\u00c0-\u024f\u1e00-\u1eff]')
+}
+
+# CJK 문자 한 글자는 라틴 문자 여러 글자만큼의 정보를 담으므로 가중치를 줌
+_SCRIPT_WEIGHTS = {'hangul': 2.5, 'kana': 2.5, 'han': 2.5}
+
+# 문자 체계만으로 언어가 정해지는 경우
+_SINGLE_LANGUAGE_SCRIPTS = {
+    'hangul': 'ko',
+    'thai': 'th',
+    'devanagari': 'hi',
+    'greek': 'el',
+    'hebrew': 'he'
+}
+
+# 같은 문자 체계를 쓰는 언어를 구분하기 위한 표지 문자
+_SCRIPT_MARKERS = {
+    'cyrillic': {'uk': re.compile('[іїєґІЇЄҐ]'), 'ru': re.compile('[ыэъёЫЭЪЁ]')},
+    'arabic': {'fa': re.compile('[پچژگکی]'), 'ar': re.compile('[ةيكى]')}
+}
+
+# 표지 문자가 없을 때 선택할 기본 언어
+_SCRIPT_DEFAULTS = {'cyrillic': 'ru', 'arabic': 'ar'}
+
+# 라틴 문자 언어별 문자 n-gram 프로필을 만들기 위한 기본 문장
+_LATIN_SEED_TEXTS = {
+    'en': "The quick development of new technology has changed the way people work and communicate with each other. Many companies are now investing in artificial intelligence, which they believe will improve productivity. However, there are also concerns about privacy and the future of jobs.",
+    'es': "El rápido desarrollo de la nueva tecnología ha cambiado la forma en que las personas trabajan y se comunican entre sí. Muchas empresas están invirtiendo en inteligencia artificial, que según ellas mejorará la productividad. Sin embargo, también existen preocupaciones sobre la privacidad y el futuro del empleo.",
+    'fr': "Le développement rapide des nouvelles technologies a changé la façon dont les gens travaillent et communiquent entre eux. De nombreuses entreprises investissent maintenant dans l'intelligence artificielle, qui selon elles améliorera la productivité. Cependant, il existe aussi des inquiétudes concernant la vie privée et l'avenir de l'emploi.",
+    'de': "Die schnelle Entwicklung neuer Technologien hat die Art und Weise verändert, wie Menschen arbeiten und miteinander kommunizieren. Viele Unternehmen investieren jetzt in künstliche Intelligenz, die ihrer Meinung nach die Produktivität verbessern wird. Es gibt jedoch auch Bedenken hinsichtlich des Datenschutzes und der Zukunft der Arbeitsplätze.",
+    'pt': "O rápido desenvolvimento da nova tecnologia mudou a forma como as pessoas trabalham e se comunicam umas com as outras. Muitas empresas estão agora investindo em inteligência artificial, que segundo elas vai melhorar a produtividade. No entanto, também existem preocupações sobre a privacidade e o futuro dos empregos.",
+    'it': "Il rapido sviluppo delle nuove tecnologie ha cambiato il modo in cui le persone lavorano e comunicano tra loro. Molte aziende stanno ora investendo nell'intelligenza artificiale, che secondo loro migliorerà la produttività. Tuttavia, ci sono anche preoccupazioni per la privacy e il futuro del lavoro.",
+    'nl': "De snelle ontwikkeling van nieuwe technologie heeft de manier veranderd waarop mensen werken en met elkaar communiceren. Veel bedrijven investeren nu in kunstmatige intelligentie, waarvan zij denken dat die de productiviteit zal verbeteren. Er zijn echter ook zorgen over privacy en de toekomst van banen.",
+    'vi': "Sự phát triển nhanh chóng của công nghệ mới đã thay đổi cách mọi người làm việc và giao tiếp với nhau. Nhiều công ty hiện đang đầu tư vào trí tuệ nhân tạo, mà họ tin rằng sẽ cải thiện năng suất. Tuy nhiên, cũng có những lo ngại về quyền riêng tư và tương lai của việc làm.",
+    'id': "Perkembangan teknologi baru yang pesat telah mengubah cara orang bekerja dan berkomunikasi satu sama lain. Banyak perusahaan sekarang berinvestasi dalam kecerdasan buatan, yang mereka yakini akan meningkatkan produktivitas. Namun, ada juga kekhawatiran tentang privasi dan masa depan pekerjaan.",
+    'ms': "Perkembangan pesat teknologi baharu telah mengubah cara orang bekerja dan berkomunikasi antara satu sama lain. Banyak syarikat kini melabur dalam kecerdasan buatan, yang mereka percaya akan meningkatkan produktiviti. Walau bagaimanapun, terdapat juga kebimbangan mengenai privasi dan masa depan pekerjaan.",
+    'tr': "Yeni teknolojinin hızlı gelişimi, insanların çalışma ve birbirleriyle iletişim kurma şeklini değiştirdi. Birçok şirket şimdi verimliliği artıracağına inandıkları yapay zekâya yatırım yapıyor. Ancak gizlilik ve işlerin geleceği konusunda da endişeler var.",
+    'pl': "Szybki rozwój nowych technologii zmienił sposób, w jaki ludzie pracują i komunikują się ze sobą. Wiele firm inwestuje teraz w sztuczną inteligencję, która ich zdaniem poprawi wydajność. Istnieją jednak również obawy dotyczące prywatności i przyszłości miejsc pracy.",
+    'sv': "Den snabba utvecklingen av ny teknik har förändrat sättet som människor arbetar och kommunicerar med varandra. Många företag investerar nu i artificiell intelligens, som de tror kommer att förbättra produktiviteten. Det finns dock också oro kring integritet och framtidens arbeten.",
+    'da': "Den hurtige udvikling af ny teknologi har ændret den måde, mennesker arbejder og kommunikerer med hinanden på. Mange virksomheder investerer nu i kunstig intelligens, som de mener vil forbedre produktiviteten. Der er dog også bekymringer om privatliv og fremtidens arbejdspladser.",
+    'no': "Den raske utviklingen av ny teknologi har endret måten mennesker jobber og kommuniserer med hverandre på. Mange bedrifter investerer nå i kunstig intelligens, som de mener vil forbedre produktiviteten. Det finnes likevel også bekymringer rundt personvern og fremtidens arbeidsplasser.",
+    'fi': "Uuden teknologian nopea kehitys on muuttanut tapaa, jolla ihmiset työskentelevät ja viestivät keskenään. Monet yritykset investoivat nyt tekoälyyn, jonka ne uskovat parantavan tuottavuutta. Yksityisyydestä ja työpaikkojen tulevaisuudesta on kuitenkin myös huolia.",
+    'cs': "Rychlý vývoj nových technologií změnil způsob, jakým lidé pracují a komunikují mezi sebou. Mnoho firem nyní investuje do umělé inteligence, o které věří, že zlepší produktivitu. Existují však také obavy o soukromí a budoucnost pracovních míst.",
+    'hu': "Az új technológia gyors fejlődése megváltoztatta, ahogyan az emberek dolgoznak és kommunikálnak egymással. Sok vállalat most mesterséges intelligenciába fektet, amely szerintük javítani fogja a termelékenységet. Ugyanakkor aggodalmak is vannak a magánélet és a munkahelyek jövője miatt.",
+    'ro': "Dezvoltarea rapidă a noii tehnologii a schimbat modul în care oamenii lucrează și comunică între ei. Multe companii investesc acum în inteligența artificială, despre care cred că va îmbunătăți productivitatea. Cu toate acestea, există și îngrijorări privind confidențialitatea și viitorul locurilor de muncă."
+}
+
+# 라틴 문자 언어별 고빈도 기능어
+_LATIN_STOPWORDS = {
+    'en': "the of and to in is that it for was on are as with be by this have from or not at but an they which you he we were has been their will would there can",
+    'es': "de la que el en y los se del las un por con no una su para es al lo como más pero sus le ya este fue ha muy sin sobre también entre cuando",
+    'fr': "de la le et les des en un du une que est pour qui dans pas par sur au plus ne ce il sont avec se cette mais ou nous été aux leur",
+    'de': "der die und in den von zu das mit sich des auf für ist im dem nicht ein eine als auch es an werden aus er hat dass sie nach bei wird",
+    'pt': "de a o que e do da em um para é com não uma os no se na por mais as dos como mas foi ao ele das tem à seu sua ou ser quando muito nos já está também",
+    'it': "di e il la che in per un è del non una sono le i con si da lo al della come ma più anche nel gli alla questo ha essere ci",
+    'nl': "de en van het een in is dat op te zijn die niet met voor er aan ook als maar om bij door wordt nog dan uit naar heeft worden was deze",
+    'vi': "và của là có được trong cho không những các người một này với để đã khi đến từ như cũng thì về sẽ nhiều đó làm",
+    'id': "yang dan di ini itu dengan untuk tidak dari dalam akan pada juga ke ada adalah bisa sudah saya mereka kami oleh karena atau telah seperti lebih harus sangat",
+    'ms': "yang dan di ini itu dengan untuk tidak dari dalam akan pada juga ke ada ialah boleh sudah saya mereka kami oleh kerana atau telah seperti lebih perlu daripada sahaja",
+    'tr': "ve bir bu da de için ile ne çok olarak daha gibi en ama ki sonra kadar var değil olan şey ben sen biz onlar mi",
+    'pl': "i w nie na się z do że to jest jak o co ale po tak od jego za przez dla czy być już tylko są może jej oraz także",
+    'sv': "och i att det som en på är av för med till den har de inte om ett men var jag sig från vi så kan när också",
+    'da': "og i at det en den til er som på de med af for ikke der var har et men han jeg sig fra vi så kan når også",
+    'no': "og i det at en som på er til av for med de ikke den har et var jeg men seg fra vi så kan når også om",
+    'fi': "ja on ei se että oli hän ovat mutta kun tai joka myös niin vain jo sen tämä ole kuin mitä siitä hänen he",
+    'cs': "a se na v je že to s z o do ve k i jako ale jsou by pro jeho po tak byl není také jak jen už který",
+    'hu': "a az és hogy nem is egy meg de van volt csak már el ez ki mint még azt ha vagy lesz kell minden nagyon",
+    'ro': "și de la în a cu că pe nu din o un este care mai pentru sunt ca ce se fost al lui dar această sau"
+}
+
+# 특정 언어에서만 주로 쓰이는 문자 (출현할 때마다 가산점)
+_LATIN_DISTINCTIVE_CHARACTERS = {
+    'vi': "ăđơưạảấầẩẫậắằẳẵặẹẻẽếềểễệỉịọỏốồổỗộớờởỡợụủứừửữựỳỵỷỹ",
+    'tr': "ğış",
+    'pl': "ąęłńśźż",
+    'cs': "řěůďťň",
+    'hu': "őű",
+    'ro': "șțşţ",
+    'de': "ß",
+    'es': "ñ¿¡",
+    'pt': "ãõ",
+    'fr': "œ",
+    'da': "æø",
+    'no': "æø"
+}
+
+# 점수 계산 가중치
+_STOPWORD_WEIGHT = 2.0
+_DISTINCTIVE_CHARACTER_WEIGHT = 1.5
+# 점수 차이를 신뢰도로 변환할 때의 척도
+_CONFIDENCE_SCALE = 0.45
+# 라틴 문자 n-gram 점수 계산에 사용할 최대 글자 수
+_LATIN_SCORING_CHARS = 600
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+def sample_text(text, size=LANGUAGE_DETECTION_SAMPLE_SIZE, windows=5):
+    """문서 전체에서 고르게 텍스트 샘플 추출
+    
+    앞부분만 사용하면 머리말이나 메뉴 텍스트에 결과가 좌우되므로
+    문서 전체에 걸쳐 일정한 간격으로 구간을 잘라 이어 붙입니다.
+    
+    Args:
+        text (str): 원본 텍스트
+        size (int): 샘플 최대 글자 수
+        windows (int): 추출할 구간 수
+    
+    Returns:
+        str: 샘플 텍스트
+    """
+    if len(text) <= size:
+        return text
+    
+    window_size = size // windows
+    step = (len(text) - window_size) / (windows - 1)
+    return ' '.join(
+        text[int(i * step):int(i * step) + window_size]
+        for i in range(windows)
+    )
+
+def _trigrams(words):
+    """단어 목록에서 공백으로 둘러싼 문자 3-gram 생성"""
+    for word in words:
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            yield padded[i:i + 3]
+
+class LanguageDetector:
+    """네트워크 없이 동작하는 로컬 언어 감지기
+    
+    1. 유니코드 문자 체계 분포로 한국어, 일본어, 중국어, 태국어 등을 바로 판별합니다.
+    2. 키릴/아랍 문자는 언어별 표지 문자로 구분합니다.
+    3. 라틴 문자 언어는 문자 3-gram 프로필(나이브 베이즈), 기능어, 고유 문자로 점수를 매깁니다.
+    """
+    
+    def __init__(self):
+        """언어별 n-gram 프로필 구성"""
+        self.latin_languages = list(_LATIN_SEED_TEXTS.keys())
+        
+        counts = []
+        vocabulary = set()
+        for language in self.latin_languages:
+            # 기능어는 두 번 넣어 실제 문서에서의 높은 빈도를 반영
+            words = _WORD_PATTERN.findall(_LATIN_SEED_TEXTS[language].lower())
+            words += _LATIN_STOPWORDS[language].split() * 2
+            counter = Counter(_trigrams(words))
+            counts.append(counter)
+            vocabulary.update(counter)
+        
+        # 등장하지 않은 n-gram의 로그 확률(기본값)과 등장한 n-gram의 보정값만 저장하여
+        # 점수 계산 시 실제로 등장한 언어만 갱신하도록 함
+        self._unseen_log_probs = []
+        self._trigram_deltas = {}
+        for index, counter in enumerate(counts):
+            denominator = sum(counter.values()) + len(vocabulary)
+            unseen = math.log(1 / denominator)
+            self._unseen_log_probs.append(unseen)
+            for trigram, count in counter.items():
+                delta = math.log((count + 1) / denominator) - unseen
+                self._trigram_deltas.setdefault(trigram, []).append((index, delta))
+        
+        self._stopwords = {}
+        for index, language in enumerate(self.latin_languages):
+            for word in _LATIN_STOPWORDS[language].split():
+                self._stopwords.setdefault(word, []).append(index)
+        
+        self._distinctive_characters = {}
+        for language, characters in _LATIN_DISTINCTIVE_CHARACTERS.items():
+            index = self.latin_languages.index(language)
+            for character in characters:
+                self._distinctive_characters.setdefault(character, []).append(index)
+        self._distinctive_pattern = re.compile(
+            '[' + ''.join(sorted(self._distinctive_characters)) + ']'
+        )
+    
+    def detect(self, text):
+        """텍스트의 언어 감지
+        
+        Args:
+            text (str): 언어를 감지할 텍스트
+        
+        Returns:
+            LanguageDetection: 감지된 언어 코드와 신뢰도 (판별할 수 없으면 language가 None)
+        """
+        if not text:
+            return LanguageDetection(None, 0.0)
+        
+        sample = sample_text(text)
+        script_counts = {
+            script: len(pattern.findall(sample)) * _SCRIPT_WEIGHTS.get(script, 1)
+            for script, pattern in _SCRIPT_PATTERNS.items()
+        }
+        total = sum(script_counts.values())
+        if not total:
+            return LanguageDetection(None, 0.0)
+        
+        # 한자와 가나는 함께 쓰이므로 하나의 CJK 그룹으로 묶어 우세 문자 체계를 결정
+        cjk_count = script_counts['han'] + script_counts['kana']
+        groups = dict(script_counts)
+        groups['cjk'] = cjk_count
+        del groups['han'], groups['kana']
+        script = max(groups, key=groups.get)
+        share = groups[script] / total
+        
+        if script in _SINGLE_LANGUAGE_SCRIPTS:
+            return LanguageDetection(_SINGLE_LANGUAGE_SCRIPTS[script], share)
+        
+        if script == 'cjk':
+            kana_ratio = script_counts['kana'] / cjk_count
+            # 일본어 문장에는 가나가 상당한 비율로 섞여 있음
+            if kana_ratio >= 0.05:
+                return LanguageDetection('ja', share * min(1.0, 0.5 + kana_ratio * 3))
+            return LanguageDetection('zh', share)
+        
+        if script in _SCRIPT_MARKERS:
+            marks = {
+                language: len(pattern.findall(sample))
+                for language, pattern in _SCRIPT_MARKERS[script].items()
+            }
+            marked = sum(marks.values())
+            if not marked:
+                return LanguageDetection(_SCRIPT_DEFAULTS[script], share * 0.6)
+            language = max(marks, key=marks.get)
+            return LanguageDetection(language, share * marks[language] / marked)
+        
+        language, confidence = self._detect_latin(sample)
+        return LanguageDetection(language, share * confidence)
+    
+    def _detect_latin(self, sample):
+        """라틴 문자 언어 점수 계산
+        
+        Returns:
+            tuple: (언어 코드, 0.0 ~ 1.0 신뢰도)
+        """
+        words = _WORD_PATTERN.findall(sample[:_LATIN_SCORING_CHARS].lower())
+        if not words:
+            return None, 0.0
+        
+        trigrams = list(_trigrams(words))
+        scores = [unseen * len(trigrams) for unseen in self._unseen_log_probs]
+        deltas = self._trigram_deltas
+        for trigram in trigrams:
+            for index, delta in deltas.get(trigram, ()):
+                scores[index] += delta
+        
+        stopwords = self._stopwords
+        for word in words:
+            for index in stopwords.get(word, ()):
+                scores[index] += _STOPWORD_WEIGHT
+        
+        distinctive = self._distinctive_characters
+        for character in self._distinctive_pattern.findall(sample):
+            for index in distinctive[character]:
+                scores[index] += _DISTINCTIVE_CHARACTER_WEIGHT
+        
+        ranked = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        best, second = ranked[0], ranked[1]
+        # 단어당 평균 점수 차이가 클수록 신뢰도가 높음
+        margin = (scores[best] - scores[second]) / len(words) ** 0.5
+        confidence = 1 - math.exp(-margin * _CONFIDENCE_SCALE)
+        return self.latin_languages[best], confidence
+    
+    def detect_batch(self, texts):
+        """여러 텍스트의 언어를 한 번에 감지
+        
+        Args:
+            texts (list): 언어를 감지할 텍스트 목록
+        
+        Returns:
+            list: 텍스트별 LanguageDetection 목록 (입력 순서 유지)
+        """
+        return [self.detect(text) for text in texts]
+
+_language_detector = None
+
+def get_language_detector():
+    """공유 언어 감지기 반환 (최초 호출 시 프로필 구성)"""
+    global _language_detector
+    if _language_detector is None:
+        _language_detector = LanguageDetector()
+    return _language_detector
@@ -0,0 +1,550 @@
+import os
+import json
+import time
+import bisect
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+
+# Prometheus 텍스트 형식 응답의 Content-Type (charset은 Starlette 응답이 추가)
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# HTTP 요청, 스크래핑, 파싱 소요 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# OpenAI API 호출 소요 시간 히스토그램 구간 (초)
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0)
+
+def _format_value(value):
+    if value == float('inf'):
+        return "+Inf"
+    if value == float('-inf'):
+        return "-Inf"
+    return repr(float(value))
+
+def _escape_label_value(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_labels(names, values):
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+class _Metric:
+    """레이블 값 조합별 하위 지표를 관리하는 기본 클래스"""
+    
+    type = None
+    
+    def __init__(self, name, documentation, labelnames=()):
+        """지표 초기화
+        
+        Args:
+            name (str): 지표 이름 (Prometheus 이름 규칙을 따름)
+            documentation (str): 지표 설명 (HELP 줄에 출력)
+            labelnames (tuple): 레이블 이름 목록
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+    
+    def labels(self, *values):
+        """레이블 값에 해당하는 하위 지표 반환 (처음 사용하면 생성)"""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} 지표에는 레이블 {len(self.labelnames)}개가 필요합니다.")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+    
+    def _new_child(self):
+        raise NotImplementedError
+    
+    def _child_value(self, child):
+        """하위 지표 하나의 현재 값 (JSON으로 저장할 수 있는 값)"""
+        return child.value
+    
+    def _samples(self, labels, value):
+        """하위 지표 하나의 (이름 접미사, 레이블 문자열, 값) 목록"""
+        raise NotImplementedError
+    
+    def values(self):
+        """레이블 값 조합별 현재 값
+        
+        Returns:
+            dict: 레이블 값 튜플 -> 값
+        """
+        with self._lock:
+            children = list(self._children.items())
+        return {values: self._child_value(child) for values, child in children}
+    
+    def merge(self, values, other, live):
+        """다른 워커 프로세스의 값을 합침 (누적 지표는 종료된 워커 값도 계속 더함)
+        
+        Args:
+            values (dict): 지금까지 합친 레이블 값 튜플 -> 값
+            other (dict): 다른 워커의 레이블 값 튜플 -> 값
+            live (bool): 다른 워커가 최근에 값을 저장했는지 여부
+        
+        Returns:
+            dict: 합친 값
+        """
+        merged = dict(values)
+        for key, value in other.items():
+            merged[key] = merged[key] + value if key in merged else value
+        return merged
+    
+    def render(self, values=None):
+        """Prometheus 텍스트 형식으로 변환
+        
+        Args:
+            values (dict): 출력할 레이블 값 튜플 -> 값 (None이면 이 프로세스의 현재 값)
+        
+        Returns:
+            list: 출력할 줄 목록
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation.replace(chr(92), chr(92) * 2).replace(chr(10), ' ')}",
+            f"# TYPE {self.name} {self.type}"
+        ]
+        if values is None:
+            values = self.values()
+        for label_values, value in sorted(values.items()):
+            for suffix, labels, sample in self._samples(_format_labels(self.labelnames, label_values), value):
+                lines.append(f"{self.name}{suffix}{labels} {_format_value(sample)}")
+        return lines
+
+class _CounterChild:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+    
+    def inc(self, amount=1):
+        if amount < 0:
+            raise ValueError("카운터는 감소할 수 없습니다.")
+        with self._lock:
+            self.value += amount
+
+class Counter(_Metric):
+    """누적 횟수 지표 (요청 수, 토큰 수, 오류 수 등)"""
+    
+    type = "counter"
+    
+    def _new_child(self):
+        return _CounterChild()
+    
+    def _samples(self, labels, value):
+        return [("", labels, value)]
+    
+    def inc(self, amount=1):
+        self.labels().inc(amount)
+
+class _GaugeChild:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+    
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+    
+    def dec(self, amount=1):
+        with self._lock:
+            self.value -= amount
+    
+    def set(self, value):
+        with self._lock:
+            self.value = value
+
+class Gauge(_Metric):
+    """현재 값 지표 (진행 중인 요청 수, 캐시 크기 등)
+    
+    여러 워커의 값을 합칠 때는 최근에 값을 저장한 워커만 포함하며,
+    프로세스마다 따로 있는 값은 더하고 모든 워커가 같은 저장소에서 읽는 값은 최댓값을 사용합니다.
+    """
+    
+    type = "gauge"
+    
+    def __init__(self, name, documentation, labelnames=(), aggregate="sum"):
+        """지표 초기화
+        
+        Args:
+            name (str): 지표 이름 (Prometheus 이름 규칙을 따름)
+            documentation (str): 지표 설명 (HELP 줄에 출력)
+            labelnames (tuple): 레이블 이름 목록
+            aggregate: 워커 값을 합치는 방식 ("sum", "max" 또는 레이블 값을 받아 둘 중 하나를 반환하는 함수)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.aggregate = aggregate
+    
+    def _new_child(self):
+        return _GaugeChild()
+    
+    def _samples(self, labels, value):
+        return [("", labels, value)]
+    
+    def merge(self, values, other, live):
+        if not live:
+            return values
+        merged = dict(values)
+        for key, value in other.items():
+            aggregate = self.aggregate(*key) if callable(self.aggregate) else self.aggregate
+            if key not in merged:
+                merged[key] = value
+            elif aggregate == "max":
+                merged[key] = max(merged[key], value)
+            else:
+                merged[key] += value
+        return merged
+    
+    def set(self, value):
+        self.labels().set(value)
+
+class _HistogramChild:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf 구간
+        self.sum = 0.0
+        self._lock = threading.Lock()
+    
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+    
+    @contextmanager
+    def time(self):
+        """블록 실행 시간(초) 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+class Histogram(_Metric):
+    """값 분포 지표 (소요 시간 등)"""
+    
+    type = "histogram"
+    
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+    
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+    
+    def _child_value(self, child):
+        with child._lock:
+            return [list(child.counts), child.sum]
+    
+    def merge(self, values, other, live):
+        merged = dict(values)
+        for key, (counts, total) in other.items():
+            if key in merged:
+                merged_counts, merged_total = merged[key]
+                merged[key] = [[a + b for a, b in zip(merged_counts, counts)], merged_total + total]
+            else:
+                merged[key] = [list(counts), total]
+        return merged
+    
+    def _samples(self, labels, value):
+        counts, total = value
+        
+        # le 레이블을 기존 레이블 뒤에 추가
+        prefix = labels[:-1] + "," if labels else "{"
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += count
+            samples.append(("_bucket", f'{prefix}le="{_format_value(bound)}"}}', cumulative))
+        samples.append(("_sum", labels, total))
+        samples.append(("_count", labels, cumulative))
+        return samples
+    
+    def observe(self, value):
+        self.labels().observe(value)
+
+def _read_snapshot(path):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        # 다른 워커가 파일을 바꾸는 중이거나 지운 경우
+        return None
+
+def reset_multiprocess_dir(directory):
+    """이전 실행에서 남은 워커 지표 파일 삭제 (워커 프로세스를 시작하기 전에 호출)"""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return
+    for path in directory.glob("worker-*.json"):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+class MetricsRegistry:
+    """지표와 수집 함수 목록 (/metrics 응답 생성)
+    
+    여러 워커 프로세스로 실행하면 각 워커가 공유 디렉토리에 자기 지표 값을 저장하고,
+    /metrics 요청을 받은 워커가 모든 워커의 값을 합쳐 응답하므로 어느 워커가 응답해도 같은 합계가 나옵니다.
+    """
+    
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+        self.multiprocess_dir = None
+        self.stale_after = None
+    
+    def register(self, metric):
+        """지표 등록
+        
+        Returns:
+            등록한 지표 (모듈 수준에서 바로 변수에 대입할 수 있도록 반환)
+        
+        Raises:
+            ValueError: 같은 이름의 지표가 이미 등록된 경우
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+    
+    def register_collector(self, collector):
+        """/metrics 요청마다 호출할 수집 함수 등록
+        
+        캐시 통계처럼 다른 객체가 이미 세고 있는 값을 응답 시점에 지표로 변환할 때 사용합니다.
+        
+        Args:
+            collector: 인자 없이 호출하면 지표(Counter, Gauge 등) 목록을 반환하는 함수
+        """
+        with self._lock:
+            self._collectors.append(collector)
+    
+    def enable_multiprocess(self, directory, stale_after=30.0):
+        """여러 워커 프로세스의 지표를 합쳐서 출력하도록 설정
+        
+        Args:
+            directory (Path): 워커별 지표 파일을 저장할 공유 디렉토리
+            stale_after (float): 이 시간(초) 동안 값을 저장하지 않은 워커의 현재 값 지표(Gauge)는 제외
+        """
+        self.multiprocess_dir = Path(directory)
+        self.multiprocess_dir.mkdir(parents=True, exist_ok=True)
+        self.stale_after = stale_after
+    
+    def _collect(self):
+        """등록된 지표와 수집 함수가 만든 지표 목록"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        
+        for collector in collectors:
+            try:
+                metrics.extend(collector())
+            except Exception as e:
+                print(f"지표 수집 중 오류가 발생했습니다: {str(e)}")
+        return metrics
+    
+    def _snapshot_path(self, pid):
+        return self.multiprocess_dir / f"worker-{pid}.json"
+    
+    def write_snapshot(self, metrics=None):
+        """이 프로세스의 현재 지표 값을 공유 디렉토리에 저장 (여러 워커로 실행하지 않으면 아무것도 하지 않음)
+        
+        Raises:
+            OSError: 파일을 쓸 수 없을 경우
+        """
+        if self.multiprocess_dir is None:
+            return
+        if metrics is None:
+            metrics = self._collect()
+        
+        snapshot = {
+            "pid": os.getpid(),
+            "written_at": time.time(),
+            "metrics": {metric.name: [[list(key), value] for key, value in metric.values().items()] for metric in metrics}
+        }
+        path = self._snapshot_path(os.getpid())
+        temporary_path = path.with_suffix(".tmp")
+        temporary_path.write_text(json.dumps(snapshot), encoding="utf-8")
+        # 다른 워커가 쓰는 도중의 파일을 읽지 않도록 교체
+        os.replace(temporary_path, path)
+    
+    def _other_snapshots(self):
+        """다른 워커 프로세스가 저장한 지표 값 목록"""
+        own_path = self._snapshot_path(os.getpid())
+        now = time.time()
+        snapshots = []
+        for path in self.multiprocess_dir.glob("worker-*.json"):
+            if path == own_path:
+                continue
+            snapshot = _read_snapshot(path)
+            if snapshot is None:
+                continue
+            live = now - snapshot.get("written_at", 0) <= self.stale_after
+            snapshots.append((live, snapshot.get("metrics", {})))
+        return snapshots
+    
+    def render(self):
+        """등록된 모든 지표를 Prometheus 텍스트 형식으로 변환
+        
+        여러 워커로 실행 중이면 이 프로세스의 값을 먼저 저장한 뒤 모든 워커의 값을 합칩니다.
+        
+        Returns:
+            str: /metrics 응답 본문
+        """
+        metrics = self._collect()
+        
+        others = []
+        if self.multiprocess_dir is not None:
+            try:
+                self.write_snapshot(metrics)
+            except OSError as e:
+                print(f"지표 파일 저장 중 오류가 발생했습니다: {str(e)}")
+            others = self._other_snapshots()
+        
+        lines = []
+        for metric in metrics:
+            values = metric.values()
+            for live, snapshot in others:
+                if metric.name in snapshot:
+                    other = {tuple(key): value for key, value in snapshot[metric.name]}
+                    values = metric.merge(values, other, live)
+            lines.extend(metric.render(values))
+        return "\n".join(lines) + "\n"
+
+# 프로세스 전체에서 공유하는 기본 레지스트리
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "contents_lenz_http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status")
+))
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "contents_lenz_http_request_duration_seconds", "HTTP 요청 처리 시간 (스트리밍 응답은 본문 전송 완료까지)", ("method", "route")
+))
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "contents_lenz_http_requests_in_flight", "처리 중인 HTTP 요청 수"
+))
+HTTP_EXCEPTIONS = REGISTRY.register(Counter(
+    "contents_lenz_http_exceptions_total", "처리되지 않은 예외로 끝난 HTTP 요청 수", ("route", "exception")
+))
+
+LLM_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "contents_lenz_llm_request_duration_seconds", "OpenAI API 호출 시간", ("operation",), buckets=LLM_BUCKETS
+))
+LLM_REQUESTS_IN_FLIGHT = REGISTRY.register(Gauge(
+    "contents_lenz_llm_requests_in_flight", "진행 중인 OpenAI API 호출 수", ("operation",)
+))
+LLM_TOKENS = REGISTRY.register(Counter(
+    "contents_lenz_llm_tokens_total", "OpenAI API가 보고한 토큰 사용량", ("operation", "type")
+))
+LLM_ERRORS = REGISTRY.register(Counter(
+    "contents_lenz_llm_errors_total", "실패한 OpenAI API 호출 수", ("operation", "exception")
+))
+
+SCRAPE_DURATION = REGISTRY.register(Histogram(
+    "contents_lenz_scrape_duration_seconds", "웹 페이지 가져오기 시간 (result: fresh, revalidated, downloaded, error)", ("result",)
+))
+PARSE_DURATION = REGISTRY.register(Histogram(
+    "contents_lenz_parse_duration_seconds", "HTML 파싱과 본문 추출 단계별 시간", ("stage",)
+))
+DOCUMENT_EXTRACT_DURATION = REGISTRY.register(Histogram(
+    "contents_lenz_document_extract_duration_seconds", "업로드 문서 텍스트 추출 시간", ("format",)
+))
+
+@contextmanager
+def track_llm_call(operation):
+    """OpenAI API 호출 시간, 진행 중인 호출 수, 실패 횟수 기록"""
+    in_flight = LLM_REQUESTS_IN_FLIGHT.labels(operation)
+    in_flight.inc()
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        LLM_ERRORS.labels(operation, type(e).__name__).inc()
+        raise
+    finally:
+        LLM_REQUEST_DURATION.labels(operation).observe(time.perf_counter() - start)
+        in_flight.dec()
+
+def record_llm_tokens(operation, entry):
+    """TokenUsageTracker 사용량 기록을 토큰 카운터에 반영"""
+    if entry.get("prompt_tokens"):
+        LLM_TOKENS.labels(operation, "prompt").inc(entry["prompt_tokens"])
+    if entry.get("completion_tokens"):
+        LLM_TOKENS.labels(operation, "completion").inc(entry["completion_tokens"])
+
+class MetricsMiddleware:
+    """HTTP 요청 수, 처리 시간, 진행 중인 요청 수를 기록하는 ASGI 미들웨어
+    
+    경로 대신 라우트 템플릿("/summarize/text" 등)을 레이블로 사용하므로
+    URL 경로 매개변수나 존재하지 않는 경로 때문에 시계열이 늘어나지 않습니다.
+    """
+    
+    def __init__(self, app, excluded_paths=("/metrics",)):
+        """미들웨어 초기화
+        
+        Args:
+            app: 감쌀 ASGI 애플리케이션
+            excluded_paths (tuple): 기록하지 않을 요청 경로 목록
+        """
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+        self._route_names = {}  # 엔드포인트 -> 라우트 템플릿
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def tracked_send(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        HTTP_REQUESTS_IN_FLIGHT.labels().inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, tracked_send)
+        except Exception as e:
+            HTTP_EXCEPTIONS.labels(self._route_name(scope), type(e).__name__).inc()
+            raise
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.labels().dec()
+            route = self._route_name(scope)
+            HTTP_REQUEST_DURATION.labels(scope["method"], route).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(scope["method"], route, status_code).inc()
+    
+    def _route_name(self, scope):
+        """요청이 일치한 라우트 템플릿 (일치하는 라우트가 없으면 "unmatched")"""
+        routes = getattr(scope.get("app"), "routes", None) or []
+        
+        # 라우터가 요청을 처리했으면 scope에 엔드포인트가 남아 있음
+        endpoint = scope.get("endpoint")
+        if endpoint is not None:
+            name = self._route_names.get(endpoint)
+            if name is None:
+                for route in routes:
+                    if getattr(route, "endpoint", None) is endpoint or getattr(route, "app", None) is endpoint:
+                        name = route.path_format
+                        break
+                else:
+                    name = "unmatched"
+                self._route_names[endpoint] = name
+            return name
+        
+        # 라우팅 전에 응답한 요청(업로드 크기 초과 등)은 직접 일치하는 라우트를 찾음
+        from starlette.routing import Match
+        for route in routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path_format
+        return "unmatched"
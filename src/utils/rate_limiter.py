@@ -0,0 +1,77 @@
+import time
+import asyncio
+
+class TokenBucket:
+    """분당 토큰 수(TPM) 제한을 지키기 위한 비동기 토큰 버킷
+    
+    요청 전에 예상 토큰 수만큼 예약하고, 응답을 받은 뒤 실제 사용량과의 차이를 정산합니다.
+    버킷이 비어 있으면 필요한 만큼 채워질 때까지 요청 순서대로 기다립니다.
+    """
+    
+    def __init__(self, tokens_per_minute):
+        """토큰 버킷 초기화
+        
+        Args:
+            tokens_per_minute (int): 분당 허용 토큰 수 (버킷 최대 크기)
+        """
+        self.capacity = tokens_per_minute
+        self.rate = tokens_per_minute / 60.0
+        self.tokens = float(tokens_per_minute)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        
+        self.waits = 0
+        self.wait_seconds = 0.0
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self, tokens):
+        """토큰 예약 (부족하면 채워질 때까지 대기)
+        
+        Args:
+            tokens (int): 예약할 토큰 수 (버킷 크기보다 크면 버킷 크기만큼 예약)
+        
+        Returns:
+            int: 실제로 예약한 토큰 수 (정산 시 사용)
+        """
+        tokens = min(tokens, self.capacity)
+        # 잠금을 쥔 채로 기다려 먼저 온 요청이 먼저 처리되도록 함
+        async with self._lock:
+            self._refill()
+            if self.tokens < tokens:
+                delay = (tokens - self.tokens) / self.rate
+                self.waits += 1
+                self.wait_seconds += delay
+                await asyncio.sleep(delay)
+                self._refill()
+            self.tokens -= tokens
+        return tokens
+    
+    def settle(self, reserved, used):
+        """예약한 토큰 수와 실제 사용량의 차이 정산
+        
+        Args:
+            reserved (int): acquire로 예약한 토큰 수
+            used (int): 실제 사용한 토큰 수 (알 수 없으면 None)
+        """
+        if used is None:
+            return
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + reserved - used)
+    
+    def stats(self):
+        """버킷 상태 반환
+        
+        Returns:
+            dict: 분당 허용 토큰 수, 남은 토큰 수, 대기 횟수와 누적 대기 시간
+        """
+        self._refill()
+        return {
+            "tokens_per_minute": self.capacity,
+            "available_tokens": int(self.tokens),
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 3)
+        }
@@ -0,0 +1,63 @@
+import asyncio
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 비동기 호출을 하나로 합치는 single-flight 그룹
+    
+    첫 번째 호출만 실제로 실행하고, 실행이 끝나기 전에 같은 키로 들어온 호출은
+    그 결과(또는 예외)를 함께 받습니다. 실행이 끝나면 키가 해제되므로
+    결과를 보관하지는 않습니다 (결과 재사용은 캐시가 담당).
+    """
+    
+    def __init__(self, name):
+        """single-flight 그룹 초기화
+        
+        Args:
+            name (str): 그룹 이름 (통계 출력용)
+        """
+        self.name = name
+        self._flights = {}
+        
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+    
+    async def do(self, key, function):
+        """키별로 하나만 실행하고 결과 공유
+        
+        Args:
+            key: 같은 작업을 식별하는 해시 가능한 키
+            function (callable): 인자 없이 호출하면 코루틴을 반환하는 함수
+        
+        Returns:
+            function이 반환한 코루틴의 결과
+        """
+        self.calls += 1
+        future = self._flights.get(key)
+        if future is None:
+            self.executions += 1
+            future = asyncio.ensure_future(function())
+            self._flights[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+        else:
+            self.coalesced += 1
+        
+        # 기다리던 요청 하나가 취소되어도 다른 요청이 공유하는 작업은 계속 진행
+        return await asyncio.shield(future)
+    
+    def _release(self, key, future):
+        if self._flights.get(key) is future:
+            del self._flights[key]
+    
+    def stats(self):
+        """합치기 통계 반환
+        
+        Returns:
+            dict: 전체 호출 수, 실제 실행 수, 합쳐진 호출 수, 진행 중인 작업 수
+        """
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights)
+        }
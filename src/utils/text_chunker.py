@@ -0,0 +1,101 @@
+import re
+
+# 문단 경계 (빈 줄)
+_PARAGRAPH_PATTERN = re.compile(r'\n\s*\n')
+# 문장 경계: 마침표/물음표/느낌표 뒤의 공백, 또는 CJK 문장 부호(공백 없이 이어지는 경우 포함)
+_SENTENCE_PATTERN = re.compile(r'(?<=[.!?…])\s+|(?<=[。！？｡])\s*')
+
+def split_paragraphs(text):
+    """텍스트를 문단 단위로 분리
+    
+    Args:
+        text (str): 원본 텍스트
+    
+    Returns:
+        list: 빈 문단을 제외한 문단 목록
+    """
+    return [paragraph.strip() for paragraph in _PARAGRAPH_PATTERN.split(text) if paragraph.strip()]
+
+def split_sentences(text):
+    """텍스트를 문장 단위로 분리 (한국어, 중국어, 일본어 문장 부호 포함)
+    
+    Args:
+        text (str): 원본 텍스트
+    
+    Returns:
+        list: 빈 문장을 제외한 문장 목록
+    """
+    return [sentence.strip() for sentence in _SENTENCE_PATTERN.split(text) if sentence.strip()]
+
+def _split_oversized(piece, max_size, measure):
+    """문장 하나가 최대 크기보다 큰 경우 글자 수 비율로 강제 분할"""
+    size = measure(piece)
+    step = max(1, int(len(piece) * max_size / size))
+    return [piece[i:i + step] for i in range(0, len(piece), step)]
+
+def _iter_pieces(text, max_size, measure):
+    """청크를 구성할 조각과 앞 조각과의 구분자 생성
+    
+    문단을 기본 단위로 하되, 최대 크기를 넘는 문단은 문장으로,
+    그래도 넘는 문장은 글자 단위로 나눕니다.
+    """
+    for paragraph in split_paragraphs(text):
+        if measure(paragraph) <= max_size:
+            yield paragraph, "\n\n"
+            continue
+        
+        separator = "\n\n"
+        for sentence in split_sentences(paragraph):
+            if measure(sentence) <= max_size:
+                yield sentence, separator
+            else:
+                for fragment in _split_oversized(sentence, max_size, measure):
+                    yield fragment, separator
+                    separator = ""
+            separator = " "
+
+def iter_chunks(texts, max_size, measure=len):
+    """텍스트 블록 이터레이터에서 청크를 만드는 대로 생성
+    
+    블록(페이지, 문단 묶음 등)은 문단 경계로 취급하며, 앞쪽 청크는 뒤쪽 블록을
+    읽기 전에 생성되므로 문서 추출과 청크 처리를 겹쳐 진행할 수 있습니다.
+    
+    Args:
+        texts (iterable): 텍스트 블록 이터레이터
+        max_size (int): 청크 최대 크기 (measure 단위)
+        measure (callable): 텍스트 크기 측정 함수 (기본값: 글자 수)
+    
+    Yields:
+        str: 청크
+    """
+    current = []
+    current_size = 0
+    
+    for text in texts:
+        for piece, separator in _iter_pieces(text, max_size, measure):
+            size = measure(piece)
+            if current and current_size + size > max_size:
+                yield "".join(current)
+                current = []
+                current_size = 0
+            
+            if current:
+                current.append(separator)
+            current.append(piece)
+            current_size += size
+    
+    if current:
+        yield "".join(current)
+
+def chunk_text(text, max_size, measure=len):
+    """문단/문장 경계를 유지하며 텍스트를 최대 크기 이하의 청크로 분할
+    
+    Args:
+        text (str): 원본 텍스트
+        max_size (int): 청크 최대 크기 (measure 단위)
+        measure (callable): 텍스트 크기 측정 함수 (기본값: 글자 수)
+    
+    Returns:
+        list: 청크 목록
+    """
+    return list(iter_chunks([text], max_size, measure))
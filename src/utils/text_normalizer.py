@@ -0,0 +1,157 @@
+import re
+import time
+import threading
+
+# 세 줄 이상 연속된 줄바꿈
+_MULTIPLE_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+# 공백만 있는 줄을 포함한 빈 줄
+_BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+# 연속된 공백 (중복 비교용 키 생성)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+# 줄바꿈과 탭을 제외한 제어 문자 (PDF 추출 결과 등에 섞여 나오는 문자)
+_CONTROL_CHARACTERS_PATTERN = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+# 웹 콘텐츠에서 제거할 문자열 패턴 (저작권 정보, 광고 문구 등)
+# 되돌아가기(backtracking)로 줄 길이의 제곱 시간이 걸리는 패턴은 줄 단위 문자열 검사로 처리
+_RIGHTS_NOTICE_START = 'ⓒ'
+_RIGHTS_NOTICE_END = 'All Rights Reserved'
+_COPYRIGHT_PATTERN = re.compile(r'Copyright ©.*', re.MULTILINE)
+_BOILERPLATE_PHRASES_PATTERN = re.compile(r'무단 전재 및 재배포 금지|관련기사|관련 기사|관련 뉴스', re.MULTILINE)
+_BOILERPLATE_LINE_PATTERN = re.compile(r'^외눈박이의.*|^family site.*|^문화·교육.*', re.MULTILINE)  # "외눈박이의 누드 사진"과 같은 패턴
+
+def normalize_line_endings(text):
+    """CRLF/CR 줄바꿈을 LF로 통일"""
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+def remove_control_characters(text):
+    """줄바꿈과 탭을 제외한 제어 문자 제거"""
+    return _CONTROL_CHARACTERS_PATTERN.sub('', text)
+
+def collapse_newlines(text):
+    """세 줄 이상 연속된 줄바꿈을 빈 줄 하나로 줄이고 양 끝 공백 제거"""
+    return _MULTIPLE_NEWLINES_PATTERN.sub('\n\n', text).strip()
+
+def _remove_rights_notice(line):
+    """줄의 첫 ⓒ부터 마지막 All Rights Reserved까지 제거 (정규식 ⓒ.*All Rights Reserved와 같은 결과)"""
+    start = line.find(_RIGHTS_NOTICE_START)
+    if start == -1:
+        return line
+    end = line.rfind(_RIGHTS_NOTICE_END)
+    if end <= start:
+        return line
+    return line[:start] + line[end + len(_RIGHTS_NOTICE_END):]
+
+def _is_bracket_line(line):
+    """[카메라 워크 K]처럼 ]로 끝나고 앞에 [가 있는 줄인지 확인 (줄 전체에 맞추던 정규식과 같은 조건)"""
+    return line.endswith(']') and '[' in line
+
+def remove_boilerplate(text):
+    """저작권 정보, 관련 기사 안내 등 불필요한 문구 제거
+    
+    모든 단계가 줄 길이에 비례하는 시간에 끝나므로 웹 페이지의 아주 긴 줄도 느려지지 않습니다.
+    """
+    if _RIGHTS_NOTICE_START in text:
+        text = '\n'.join(_remove_rights_notice(line) for line in text.split('\n'))
+    text = _COPYRIGHT_PATTERN.sub('', text)
+    text = _BOILERPLATE_PHRASES_PATTERN.sub('', text)
+    # 줄 내용만 지우고 줄바꿈은 유지
+    text = '\n'.join('' if _is_bracket_line(line) else line for line in text.split('\n'))
+    return _BOILERPLATE_LINE_PATTERN.sub('', text)
+
+def normalize_blank_lines(text):
+    """공백만 있는 줄을 포함한 빈 줄을 빈 줄 하나로 통일"""
+    return _BLANK_LINES_PATTERN.sub('\n\n', text)
+
+def dedupe_paragraphs(text, normalize_whitespace=False):
+    """중복 문단 제거 (처음 나온 문단만 유지)
+    
+    Args:
+        text (str): 빈 줄로 문단이 구분된 텍스트
+        normalize_whitespace (bool): 공백 차이만 있는 문단도 같은 문단으로 볼지 여부
+    
+    Returns:
+        str: 중복과 빈 문단을 제거한 텍스트
+    """
+    seen = set()
+    unique_paragraphs = []
+    for paragraph in text.split('\n\n'):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        key = _WHITESPACE_PATTERN.sub(' ', paragraph) if normalize_whitespace else paragraph
+        if key not in seen:
+            seen.add(key)
+            unique_paragraphs.append(paragraph)
+    return '\n\n'.join(unique_paragraphs)
+
+class TextPipeline:
+    """텍스트 정리 단계를 순서대로 적용하고 단계별 소요 시간을 기록하는 파이프라인"""
+    
+    def __init__(self, name, stages):
+        """파이프라인 초기화
+        
+        Args:
+            name (str): 파이프라인 이름 (통계 출력용)
+            stages (list): (단계 이름, 텍스트를 받아 텍스트를 반환하는 함수) 목록
+        """
+        self.name = name
+        self.stages = stages
+        self._totals = {stage_name: [0, 0.0] for stage_name, _ in stages}  # 단계 이름 -> [호출 수, 누적 시간]
+        self._lock = threading.Lock()
+    
+    def run(self, text, timings=None):
+        """모든 단계를 적용
+        
+        Args:
+            text (str): 원본 텍스트
+            timings (dict): 전달하면 단계 이름별 소요 시간(초)을 기록
+        
+        Returns:
+            str: 정리된 텍스트
+        """
+        elapsed = []
+        for stage_name, stage in self.stages:
+            start = time.perf_counter()
+            text = stage(text)
+            elapsed.append((stage_name, time.perf_counter() - start))
+        
+        with self._lock:
+            for stage_name, seconds in elapsed:
+                totals = self._totals[stage_name]
+                totals[0] += 1
+                totals[1] += seconds
+        
+        if timings is not None:
+            timings.update(elapsed)
+        return text
+    
+    def stats(self):
+        """단계별 누적 통계 반환
+        
+        Returns:
+            dict: 단계 이름별 호출 수, 누적 시간(ms), 평균 시간(ms)
+        """
+        with self._lock:
+            return {
+                stage_name: {
+                    "calls": calls,
+                    "total_ms": round(seconds * 1000, 3),
+                    "average_ms": round(seconds * 1000 / calls, 3) if calls else 0.0
+                }
+                for stage_name, (calls, seconds) in self._totals.items()
+            }
+
+# 웹 페이지에서 추출한 본문 정리
+WEB_CONTENT_PIPELINE = TextPipeline("web_content", [
+    ("collapse_newlines", collapse_newlines),
+    ("remove_boilerplate", remove_boilerplate),
+    ("normalize_blank_lines", normalize_blank_lines),
+    ("dedupe_paragraphs", dedupe_paragraphs)
+])
+
+# 파일에서 읽은 텍스트 정리
+DOCUMENT_PIPELINE = TextPipeline("document", [
+    ("normalize_line_endings", normalize_line_endings),
+    ("remove_control_characters", remove_control_characters),
+    ("collapse_newlines", collapse_newlines)
+])
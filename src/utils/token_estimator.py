@@ -0,0 +1,207 @@
+import re
+import threading
+from src.config import OPENAI_MODEL, TIKTOKEN_ENABLED
+
+# 문자 종류별 글자당 평균 토큰 수 (GPT-4o 계열 o200k_base 토크나이저 기준 근사치)
+_TOKEN_RATES = [
+    (re.compile('[\uac00-\ud7a3\u1100-\u11ff\u3130-\u318f]'), 0.9),   # 한글
+    (re.compile('[\u3040-\u30ff\u31f0-\u31ff\uff66-\uff9f]'), 0.8),   # 가나
+    (re.compile('[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]'), 0.9),   # 한자
+    (re.compile('[\u0e00-\u0e7f\u0900-\u097f]'), 0.6),                # 태국 문자, 데바나가리
+    (re.compile('[\u0370-\u03ff\u0400-\u04ff\u0590-\u05ff\u0600-\u06ff]'), 0.35),  # 그리스, 키릴, 히브리, 아랍 문자
+    (re.compile('[A-Za-z\u00c0-\u024f\u1e00-\u1eff]'), 0.25),         # 라틴 문자
+    (re.compile('[0-9]'), 0.34),                                       # 숫자 (최대 3자리씩 묶임)
+    (re.compile(r'[^\w\s]'), 0.8)                                     # 문장 부호 및 기호
+]
+
+# 예산까지만 계산하기 위해 근사치를 누적할 때 한 번에 계산할 글자 수
+_ESTIMATE_BLOCK_CHARS = 4096
+# tiktoken으로 자를 때 먼저 인코딩해 볼 앞부분 길이 (토큰당 글자 수 상한 추정치)
+_MAX_CHARS_PER_TOKEN = 6
+# 앞부분만 인코딩하면 잘린 위치 근처의 토큰이 달라질 수 있으므로 예산보다 더 인코딩할 토큰 수
+_CUT_MARGIN_TOKENS = 16
+
+# 메시지마다 붙는 역할/구분자 토큰 수
+_TOKENS_PER_MESSAGE = 4
+# 응답 시작 부분에 추가되는 토큰 수
+_TOKENS_PER_REPLY = 3
+
+_encoding = None
+_encoding_loaded = False
+
+def _get_encoding():
+    """tiktoken 인코딩 반환 (설치되지 않았거나 어휘 파일을 받을 수 없으면 None)"""
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        _encoding_loaded = True
+        if not TIKTOKEN_ENABLED:
+            return None
+        try:
+            import tiktoken
+            try:
+                _encoding = tiktoken.encoding_for_model(OPENAI_MODEL)
+            except KeyError:
+                _encoding = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            # 오프라인 환경 등에서는 근사치 계산만 사용
+            _encoding = None
+    return _encoding
+
+def estimate_tokens(text):
+    """텍스트의 토큰 수 추정
+    
+    tiktoken을 사용할 수 있으면 실제 토크나이저로 계산하고,
+    그렇지 않으면 문자 종류별 평균 토큰 수로 근사합니다.
+    
+    Args:
+        text (str): 토큰 수를 계산할 텍스트
+    
+    Returns:
+        int: 추정 토큰 수
+    """
+    if not text:
+        return 0
+    
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    
+    return max(1, int(_heuristic_tokens(text) + 0.5))
+
+def _heuristic_tokens(text):
+    """문자 종류별 평균 토큰 수로 계산한 근사치 (반올림 전, 이어 붙인 텍스트의 값은 각 부분의 합)"""
+    estimate = 0.0
+    for pattern, rate in _TOKEN_RATES:
+        estimate += len(pattern.findall(text)) * rate
+    return estimate
+
+def estimate_message_tokens(messages):
+    """Chat Completions 메시지 목록의 입력 토큰 수 추정
+    
+    Args:
+        messages (list): role/content 키를 가진 메시지 목록
+    
+    Returns:
+        int: 추정 입력 토큰 수
+    """
+    total = _TOKENS_PER_REPLY
+    for message in messages:
+        total += _TOKENS_PER_MESSAGE + estimate_tokens(message.get("content") or "")
+    return total
+
+def truncate_to_tokens(text, max_tokens):
+    """텍스트를 최대 토큰 수 이하로 자르기
+    
+    Args:
+        text (str): 원본 텍스트
+        max_tokens (int): 최대 토큰 수
+    
+    Returns:
+        str: 잘린 텍스트 (이미 예산 안이면 원본 그대로)
+    """
+    if max_tokens <= 0:
+        return ""
+    
+    encoding = _get_encoding()
+    if encoding is not None:
+        # 긴 텍스트는 예산을 넘는 앞부분만 인코딩 (앞부분으로 부족하면 전체를 인코딩)
+        limit = (max_tokens + _CUT_MARGIN_TOKENS) * _MAX_CHARS_PER_TOKEN
+        tokens = encoding.encode(text[:limit], disallowed_special=())
+        if len(text) > limit and len(tokens) <= max_tokens + _CUT_MARGIN_TOKENS:
+            tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens])
+    
+    # 글자당 토큰 수 근사치는 1보다 작으므로 글자 수가 예산 이하면 계산하지 않음
+    if len(text) <= max_tokens:
+        return text
+    
+    # 근사치는 부분의 합이므로 블록 단위로 누적하다가 예산을 넘는 블록 안에서만 이분 탐색
+    # (estimate_tokens는 반올림하므로 max_tokens + 0.5 미만이면 예산 안)
+    limit = max_tokens + 0.5
+    total = 0.0
+    for start in range(0, len(text), _ESTIMATE_BLOCK_CHARS):
+        block = text[start:start + _ESTIMATE_BLOCK_CHARS]
+        block_tokens = _heuristic_tokens(block)
+        if total + block_tokens >= limit:
+            low, high = 0, len(block)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if total + _heuristic_tokens(block[:middle]) < limit:
+                    low = middle
+                else:
+                    high = middle - 1
+            return text[:start + low]
+        total += block_tokens
+    return text
+
+class TokenUsageTracker:
+    """API 호출별 추정 토큰 수와 실제 사용량 기록"""
+    
+    def __init__(self):
+        self._operations = {}
+        self._lock = threading.Lock()
+        self.last = None
+    
+    def record(self, operation, estimated_prompt_tokens, max_tokens, usage):
+        """호출 한 번의 토큰 사용량 기록
+        
+        Args:
+            operation (str): 작업 종류 ("summary", "keywords" 등)
+            estimated_prompt_tokens (int): 호출 전 추정한 입력 토큰 수
+            max_tokens (int): 요청한 응답 최대 토큰 수
+            usage: API 응답의 usage 객체 (없으면 None)
+        
+        Returns:
+            dict: 이번 호출의 사용량 기록
+        """
+        # 스트리밍 응답의 usage는 SDK 버전에 따라 dict로 전달될 수 있음
+        if isinstance(usage, dict):
+            prompt_tokens = usage.get("prompt_tokens")
+            completion_tokens = usage.get("completion_tokens")
+        else:
+            prompt_tokens = getattr(usage, "prompt_tokens", None)
+            completion_tokens = getattr(usage, "completion_tokens", None)
+        entry = {
+            "operation": operation,
+            "estimated_prompt_tokens": estimated_prompt_tokens,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "max_tokens": max_tokens
+        }
+        
+        with self._lock:
+            totals = self._operations.setdefault(operation, {
+                "calls": 0,
+                "estimated_prompt_tokens": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "max_tokens": 0
+            })
+            totals["calls"] += 1
+            totals["estimated_prompt_tokens"] += estimated_prompt_tokens
+            totals["prompt_tokens"] += prompt_tokens or 0
+            totals["completion_tokens"] += completion_tokens or 0
+            totals["max_tokens"] += max_tokens
+            self.last = entry
+        return entry
+    
+    def stats(self):
+        """작업별 누적 사용량 반환
+        
+        Returns:
+            dict: 작업별 호출 수, 추정/실제 입력 토큰 수, 응답 토큰 수와 추정 오차 비율
+        """
+        with self._lock:
+            operations = {}
+            for operation, totals in self._operations.items():
+                operations[operation] = dict(totals)
+                operations[operation]["estimate_ratio"] = (
+                    totals["estimated_prompt_tokens"] / totals["prompt_tokens"] if totals["prompt_tokens"] else None
+                )
+            return {
+                "tokenizer": "tiktoken" if _encoding is not None else "heuristic",
+                "operations": operations,
+                "last": self.last
+            }
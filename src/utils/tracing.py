@@ -0,0 +1,170 @@
+import re
+import json
+import time
+import uuid
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# 현재 요청의 추적 정보 (요청마다 미들웨어가 설정하며, 스레드 풀과 하위 태스크에도 전달됨)
+_current_trace = ContextVar("current_trace", default=None)
+
+# 클라이언트가 보낸 요청 ID로 허용할 형식 (헤더와 로그에 그대로 쓰므로 제한)
+_REQUEST_ID_PATTERN = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+_trace_log_lock = threading.Lock()
+
+class Trace:
+    """요청 하나에서 실행된 구간(span)별 소요 시간 기록"""
+    
+    def __init__(self, request_id, method, path):
+        """추적 정보 초기화
+        
+        Args:
+            request_id (str): 요청 ID
+            method (str): HTTP 메서드
+            path (str): 요청 경로
+        """
+        self.request_id = request_id
+        self.method = method
+        self.path = path
+        self.started_at = time.time()
+        self.start = time.perf_counter()
+        self.spans = []  # (구간 이름, 요청 시작부터 구간 시작까지 시간, 소요 시간)
+        self._lock = threading.Lock()
+    
+    def add_span(self, name, start, duration):
+        """구간 기록 (스레드 풀에서 실행되는 구간도 있으므로 잠금 사용)"""
+        with self._lock:
+            self.spans.append((name, start - self.start, duration))
+    
+    def elapsed(self):
+        """요청 시작부터 지금까지 걸린 시간 (초)"""
+        return time.perf_counter() - self.start
+    
+    def server_timing(self):
+        """Server-Timing 헤더 값 생성
+        
+        같은 이름의 구간(분할 요약의 여러 API 호출 등)은 소요 시간을 합치고 횟수를 desc에 적습니다.
+        동시에 실행된 구간은 합친 시간이 전체 시간보다 길 수 있습니다.
+        
+        Returns:
+            str: 'fetch;dur=12.3, llm.summary;dur=840.1;desc="2 calls", total;dur=870.0' 형식의 값
+        """
+        totals = {}
+        with self._lock:
+            for name, _, duration in self.spans:
+                total = totals.setdefault(name, [0.0, 0])
+                total[0] += duration
+                total[1] += 1
+        
+        entries = []
+        for name, (duration, count) in totals.items():
+            entry = f"{name};dur={duration * 1000:.1f}"
+            if count > 1:
+                entry += f';desc="{count} calls"'
+            entries.append(entry)
+        entries.append(f"total;dur={self.elapsed() * 1000:.1f}")
+        return ", ".join(entries)
+    
+    def to_record(self, status_code):
+        """추적 로그에 기록할 JSON 객체
+        
+        Returns:
+            dict: 요청 정보와 시작 순서로 정렬한 구간 목록
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span[1])
+        return {
+            "request_id": self.request_id,
+            "timestamp": self.started_at,
+            "method": self.method,
+            "path": self.path,
+            "status": status_code,
+            "duration_ms": round(self.elapsed() * 1000, 3),
+            "spans": [
+                {"name": name, "start_ms": round(start * 1000, 3), "duration_ms": round(duration * 1000, 3)}
+                for name, start, duration in spans
+            ]
+        }
+
+@contextmanager
+def span(name):
+    """블록 실행 시간을 현재 요청의 구간으로 기록
+    
+    요청 처리 중이 아니면(명령줄 실행 등) 아무것도 기록하지 않습니다.
+    
+    Args:
+        name (str): 구간 이름 ("fetch", "html.parse", "llm.summary" 등, Server-Timing 토큰 규칙을 따름)
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add_span(name, start, time.perf_counter() - start)
+
+def write_trace_log(log_path, record):
+    """추적 기록을 JSON Lines 파일에 한 줄로 추가"""
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    try:
+        with _trace_log_lock:
+            with open(log_path, "a", encoding="utf-8") as file:
+                file.write(line)
+    except OSError as e:
+        print(f"추적 로그 기록 중 오류가 발생했습니다: {str(e)}")
+
+class TracingMiddleware:
+    """요청별 구간 소요 시간을 Server-Timing 헤더와 추적 로그로 전달하는 ASGI 미들웨어
+    
+    응답마다 X-Request-ID 헤더를 붙이며, 요청에 올바른 형식의 X-Request-ID가 있으면 그 값을 그대로 사용합니다.
+    스트리밍 응답은 헤더를 먼저 보내므로 Server-Timing에는 헤더 전송 전까지의 구간만 포함되고,
+    추적 로그에는 본문 전송이 끝날 때까지의 모든 구간이 기록됩니다.
+    """
+    
+    def __init__(self, app, log_path=None):
+        """미들웨어 초기화
+        
+        Args:
+            app: 감쌀 ASGI 애플리케이션
+            log_path (str): 추적 로그 파일 경로 (None이면 기록하지 않음)
+        """
+        self.app = app
+        self.log_path = log_path or None
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                value = value.decode("latin-1")
+                if _REQUEST_ID_PATTERN.match(value):
+                    request_id = value
+                break
+        trace = Trace(request_id or uuid.uuid4().hex, scope["method"], scope["path"])
+        status_code = 500
+        
+        async def traced_send(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", trace.server_timing().encode("latin-1")))
+                headers.append((b"x-request-id", trace.request_id.encode("latin-1")))
+                message = dict(message, headers=headers)
+            await send(message)
+        
+        token = _current_trace.set(trace)
+        try:
+            await self.app(scope, receive, traced_send)
+        finally:
+            _current_trace.reset(token)
+            if self.log_path:
+                write_trace_log(self.log_path, trace.to_record(status_code))
@@ -0,0 +1,89 @@
+import json
+from fastapi import HTTPException
+
+def _too_large_detail(max_bytes):
+    return f"업로드 크기가 최대 허용 크기({max_bytes // (1024 * 1024)}MB)를 초과했습니다."
+
+class UploadTooLarge(HTTPException):
+    """요청 본문이 최대 크기를 넘은 경우 발생하는 예외
+    
+    본문 파싱 중에 발생해도 FastAPI가 400 오류로 바꾸지 않고 413 응답으로 전달합니다.
+    """
+    
+    def __init__(self, max_bytes):
+        super().__init__(status_code=413, detail=_too_large_detail(max_bytes))
+
+class UploadSizeLimitMiddleware:
+    """파일 업로드 요청 본문 크기를 제한하는 ASGI 미들웨어
+    
+    Content-Length 헤더가 최대 크기를 넘으면 본문을 읽기 전에 바로 413 응답을 보내고,
+    헤더가 없는 청크 전송 요청은 받은 바이트 수를 세다가 최대 크기를 넘는 순간 중단합니다.
+    """
+    
+    def __init__(self, app, max_bytes, paths):
+        """미들웨어 초기화
+        
+        Args:
+            app: 감쌀 ASGI 애플리케이션
+            max_bytes (int): 요청 본문 최대 크기 (바이트)
+            paths (list): 크기를 제한할 요청 경로 목록
+        """
+        self.app = app
+        self.max_bytes = max_bytes
+        self.paths = frozenset(paths)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        
+        # 헤더만 보고 거절할 수 있으면 본문을 받지 않음
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    content_length = int(value)
+                except ValueError:
+                    break
+                if content_length > self.max_bytes:
+                    await self._reject(send)
+                    return
+                break
+        
+        received = 0
+        response_started = False
+        
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise UploadTooLarge(self.max_bytes)
+            return message
+        
+        async def tracked_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, limited_receive, tracked_send)
+        except UploadTooLarge:
+            if response_started:
+                raise
+            await self._reject(send)
+    
+    async def _reject(self, send):
+        """413 응답 전송"""
+        body = json.dumps({"detail": _too_large_detail(self.max_bytes)}, ensure_ascii=False).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"connection", b"close")
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,52 @@
+import json
+import os
+
+# src.config를 가져오기 전에 설정해야 적용됨 (요약 결과를 디스크 캐시에 남기지 않음)
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ["SUMMARY_CACHE_ENABLED"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src import api_server
+from src.models.async_openai_client import AsyncOpenAIClient
+
+class _FailingCompletions:
+    async def create(self, **kwargs):
+        raise RuntimeError("API 연결 실패")
+
+class _FailingChat:
+    completions = _FailingCompletions()
+
+class _FailingSDKClient:
+    chat = _FailingChat()
+
+@pytest.fixture
+def failing_client(monkeypatch):
+    client = AsyncOpenAIClient(tokens_per_minute=0)
+    client.client = _FailingSDKClient()
+    monkeypatch.setattr(api_server, "openai_client", client)
+    return TestClient(api_server.app)
+
+def test_batch_item_failure_sets_error(failing_client):
+    response = failing_client.post("/summarize/batch", json={
+        "items": [{"text": "요약할 문서입니다.", "language": "ko"}, {"text": "두 번째 문서", "chunked": True}]
+    })
+    
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["index"] for result in results] == [0, 1]
+    for result in results:
+        assert result["error"]
+        assert result.get("summary") is None
+
+def test_batch_stream_item_failure_sets_error(failing_client):
+    response = failing_client.post("/summarize/batch", json={
+        "items": [{"text": "요약할 문서입니다.", "language": "ko"}], "stream": True
+    })
+    
+    assert response.status_code == 200
+    results = [json.loads(line) for line in response.text.splitlines() if line]
+    assert len(results) == 1
+    assert results[0]["error"]
+    assert "summary" not in results[0]
@@ -0,0 +1,17 @@
+import asyncio
+
+from src.utils.cache import TieredCache
+
+def test_get_async_reads_disk_tier_and_promotes_to_memory(tmp_path):
+    writer = TieredCache("writer", disk_dir=tmp_path)
+    writer.set("key", {"summary": "요약"})
+    
+    # 다른 워커처럼 메모리 계층이 비어 있는 캐시
+    reader = TieredCache("reader", disk_dir=tmp_path)
+    
+    assert asyncio.run(reader.get_async("key")) == {"summary": "요약"}
+    assert reader.disk_hits == 1
+    assert asyncio.run(reader.get_async("key")) == {"summary": "요약"}
+    assert reader.memory_hits == 1
+    assert asyncio.run(reader.get_async("missing")) is None
+    assert reader.misses == 1
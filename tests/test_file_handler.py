@@ -0,0 +1,48 @@
+import io
+
+from src.config import TEXT_BLOCK_CHARS
+from src.utils.file_handler import FileHandler
+
+def _read_all(path):
+    return FileHandler.read_file(path, normalize=False), "".join(FileHandler.iter_file(path, normalize=False))
+
+def test_iter_file_cp949_after_ascii_chunk_boundary(tmp_path):
+    # 첫 조각의 마지막 바이트가 CP949 문자의 첫 바이트인 경우
+    data = b"a" * (TEXT_BLOCK_CHARS - 1) + "한글 문서입니다".encode("cp949")
+    path = tmp_path / "boundary.txt"
+    path.write_bytes(data)
+    
+    text, streamed = _read_all(path)
+    
+    assert text == "a" * (TEXT_BLOCK_CHARS - 1) + "한글 문서입니다"
+    assert streamed == text
+    assert "".join(FileHandler.iter_stream(io.BytesIO(data), ".txt", normalize=False)) == text
+
+def test_iter_file_cp949_after_long_ascii_prefix(tmp_path):
+    data = b"a" * (TEXT_BLOCK_CHARS * 3 + 5) + "한글\n".encode("cp949") * 100
+    path = tmp_path / "prefix.txt"
+    path.write_bytes(data)
+    
+    text, streamed = _read_all(path)
+    
+    assert text.endswith("한글\n")
+    assert streamed == text
+
+def test_iter_file_utf8_character_across_chunks(tmp_path):
+    data = b"a" * (TEXT_BLOCK_CHARS - 1) + "한글 문서입니다".encode("utf-8")
+    path = tmp_path / "utf8.txt"
+    path.write_bytes(data)
+    
+    text, streamed = _read_all(path)
+    
+    assert text.endswith("한글 문서입니다")
+    assert streamed == text
+
+def test_iter_file_utf16_without_bom(tmp_path):
+    path = tmp_path / "utf16.txt"
+    path.write_bytes("hello world\n".encode("utf-16-le") * 20000)
+    
+    text, streamed = _read_all(path)
+    
+    assert text == "hello world\n" * 20000
+    assert streamed == text
@@ -0,0 +1,57 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.run_benchmarks import LAZY_MODULES, STARTUP_BUDGETS, ROOT_DIR
+
+# 시작 시간 측정 횟수 (중앙값 사용)
+SAMPLES = 5
+
+# main.py --help 실행 후 로드된 모듈 목록을 출력하는 스크립트
+HELP_MODULES_SCRIPT = """
+import json, runpy, sys
+sys.argv = ["main.py", "--help"]
+try:
+    runpy.run_path("main.py", run_name="__main__")
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)))
+"""
+
+def _run_python(*args):
+    env = dict(os.environ, OPENAI_API_KEY="test", WARMUP_ENABLED="false")
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT_DIR, env=env, check=True, capture_output=True, text=True
+    )
+
+def _loaded_modules(*args):
+    return set(json.loads(_run_python(*args).stdout.strip().splitlines()[-1]))
+
+def _median_seconds(*args):
+    samples = []
+    for _ in range(SAMPLES):
+        start = time.perf_counter()
+        _run_python(*args)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+def test_import_api_server_keeps_heavy_modules_lazy():
+    modules = _loaded_modules("-c", "import sys, json, src.api_server; print(json.dumps(sorted(sys.modules)))")
+    
+    assert [module for module in LAZY_MODULES if module in modules] == []
+
+def test_main_help_does_not_import_openai():
+    modules = _loaded_modules("-c", HELP_MODULES_SCRIPT)
+    
+    assert "openai" not in modules
+    assert "src.models.openai_client" not in modules
+
+def test_import_api_server_within_budget():
+    # 인터프리터 시작 시간을 뺀 추가 시간으로 비교 (실행 환경에 따른 차이를 줄임)
+    baseline = _median_seconds("-c", "pass")
+    overhead = _median_seconds("-c", "import src.api_server") - baseline
+    
+    assert overhead < STARTUP_BUDGETS["startup/import src.api_server"]
@@ -0,0 +1,23 @@
+import time
+
+from src.utils.text_normalizer import remove_boilerplate
+
+def test_remove_boilerplate_clears_bracket_lines():
+    text = "본문 첫 줄\n사진 [카메라 워크 K]\n[광고] 끝나지 않는 줄\n]\n본문 끝"
+    
+    assert remove_boilerplate(text) == "본문 첫 줄\n\n[광고] 끝나지 않는 줄\n]\n본문 끝"
+
+def test_remove_boilerplate_rights_notice():
+    text = "앞 ⓒ 언론사 All Rights Reserved 뒤\nAll Rights Reserved ⓒ 남음"
+    
+    assert remove_boilerplate(text) == "앞  뒤\nAll Rights Reserved ⓒ 남음"
+
+def test_remove_boilerplate_long_lines_are_linear():
+    # 정규식 되돌아가기로는 수 초 이상 걸리던 입력
+    lines = ["[" * 20000, "a" * 200000 + "]", "ⓒ" * 20000, "x" * 200000]
+    
+    started = time.perf_counter()
+    result = remove_boilerplate("\n".join(lines))
+    
+    assert time.perf_counter() - started < 0.5
+    assert result == "\n".join(["[" * 20000, "a" * 200000 + "]", "ⓒ" * 20000, "x" * 200000])